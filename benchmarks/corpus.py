@@ -0,0 +1,146 @@
+"""Generates synthetic resumes and job descriptions in several file formats."""
+import html
+import io
+import random
+import zipfile
+from typing import List, Tuple
+
+FORMATS = ("txt", "md", "html", "docx", "pdf")
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Priya", "Wei", "Maria", "Omar", "Lena", "Kofi", "Yuki"]
+LAST_NAMES = ["Smith", "Patel", "Chen", "Garcia", "Okafor", "Müller", "Kim", "Rossi", "Ivanova", "Haddad"]
+SKILLS = [
+    "Python", "Java", "Go", "SQL", "PostgreSQL", "Docker", "Kubernetes", "AWS", "GCP", "Terraform",
+    "React", "TypeScript", "FastAPI", "Django", "Kafka", "Spark", "Airflow", "Redis", "GraphQL", "Linux",
+]
+ROLES = ["Software Engineer", "Backend Developer", "Data Engineer", "Platform Engineer", "Full Stack Developer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Tech"]
+DUTIES = [
+    "Designed and maintained REST APIs serving millions of requests per day",
+    "Migrated batch pipelines to streaming with measurable latency gains",
+    "Led a team of four engineers through a monolith decomposition",
+    "Automated infrastructure provisioning and reduced deploy time",
+    "Improved test coverage and introduced contract testing",
+    "Optimised slow database queries and added caching layers",
+]
+
+JOB_DESCRIPTION = """# Senior Backend Engineer
+
+We are looking for a backend engineer to build and operate data-heavy services.
+
+## Requirements
+- 5+ years of professional software development
+- Strong Python and SQL; experience with FastAPI or Django
+- Docker and Kubernetes in production
+- Cloud experience (AWS or GCP)
+
+## Nice to have
+- Kafka, Spark or Airflow
+- Terraform
+
+## Responsibilities
+- Design, build and run APIs and data pipelines
+- Mentor engineers and review code
+- Own services end to end, including on-call
+"""
+
+
+def resume_lines(rng: random.Random, index: int, sections: int = 3) -> List[str]:
+    """Returns the lines of one synthetic resume."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [name, f"{rng.choice(ROLES)} - candidate {index}", "", "Skills: " + ", ".join(rng.sample(SKILLS, 6)), ""]
+    for _ in range(sections):
+        lines.append(f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)} ({rng.randint(1, 6)} years)")
+        lines.extend(f"- {duty}" for duty in rng.sample(DUTIES, 3))
+        lines.append("")
+    lines.append(f"Education: BSc Computer Science, class of {rng.randint(2005, 2022)}")
+    return lines
+
+
+def render(lines: List[str], file_format: str) -> bytes:
+    """Renders resume lines as a file of the given format."""
+    if file_format == "txt":
+        return "\n".join(lines).encode("utf-8")
+    if file_format == "md":
+        return ("# " + "\n".join(lines)).encode("utf-8")
+    if file_format == "html":
+        body = "".join(f"<p>{html.escape(line)}</p>" for line in lines if line)
+        return f"<html><body><h1>Resume</h1>{body}</body></html>".encode("utf-8")
+    if file_format == "docx":
+        return _render_docx(lines)
+    if file_format == "pdf":
+        return _render_pdf(lines)
+    raise ValueError(f"Unknown format '{file_format}'.")
+
+
+def generate_corpus(size: int, formats=FORMATS, seed: int = 0) -> List[Tuple[str, bytes]]:
+    """Returns ``size`` unique ``(filename, data)`` resumes cycling through ``formats``."""
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(size):
+        file_format = formats[index % len(formats)]
+        corpus.append((f"resume_{index:04d}.{file_format}", render(resume_lines(rng, index), file_format)))
+    return corpus
+
+
+def _render_docx(lines: List[str]) -> bytes:
+    """Builds a minimal Word document with one paragraph per line."""
+    body = "".join(
+        f"<w:p><w:r><w:t xml:space=\"preserve\">{html.escape(line)}</w:t></w:r></w:p>" for line in lines
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(
+            "[Content_Types].xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            "</Types>",
+        )
+        archive.writestr(
+            "_rels/.rels",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="word/document.xml"/></Relationships>',
+        )
+        archive.writestr(
+            "word/document.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>",
+        )
+    return buffer.getvalue()
+
+
+def _render_pdf(lines: List[str]) -> bytes:
+    """Builds a minimal single-page PDF with one text line per resume line."""
+    def escape(line: str) -> str:
+        text = line.encode("latin-1", "replace").decode("latin-1")
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    content = "BT /F1 10 Tf 40 800 Td 13 TL " + " ".join(f"({escape(line)}) '" for line in lines) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(content.encode('latin-1'))} >>\nstream\n{content}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    output += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+    ).encode("latin-1")
+    return output
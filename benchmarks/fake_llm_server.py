@@ -0,0 +1,260 @@
+"""
+Local stand-in for the OpenAI / Groq chat-completions API.
+
+Serves ``POST /v1/chat/completions`` (OpenAI) and
+``POST /openai/v1/chat/completions`` (Groq) with canned but well-formed
+responses for every prompt the app sends, after a configurable delay, with
+optional random 500s and 429s, optional malformed JSON replies (fenced,
+truncated, drifting types or plain prose), and an optional in-flight
+capacity above which requests are rejected with 429 like a real rate
+limit. Point the app at it with::
+
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1
+    GROQ_BASE_URL=http://127.0.0.1:8765
+
+Run ``python benchmarks/fake_llm_server.py --help`` for the options.
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from typing import Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+# Rough prompt size in tokens, matching src/utils/tokens.py
+CHARS_PER_TOKEN = 4
+
+RESUME_ID_PATTERN = re.compile(r"=== Resume id: (\S+) ===")
+
+
+class FakeProvider:
+    """Generates delays, failures and chat-completion payloads."""
+
+    def __init__(
+        self,
+        latency_ms: float = 500,
+        latency_dist: str = "lognormal",
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        max_in_flight: int = 0,
+        malformed_rate: float = 0.0,
+        model_latency_ms: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initializes the FakeProvider."""
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.max_in_flight = max_in_flight
+        self.malformed_rate = malformed_rate
+        self.model_latency_ms = model_latency_ms or {}
+        self.malformed = 0
+        self.in_flight = 0
+        self.throttled = 0
+        self.random = random.Random(seed)
+        self.requests = 0
+
+    def sample_latency(self, model: str = "") -> float:
+        """Returns a response delay in seconds drawn from the configured distribution."""
+        mean = self.model_latency_ms.get(model, self.latency_ms) / 1000
+        if self.latency_dist == "fixed":
+            return mean
+        if self.latency_dist == "uniform":
+            return self.random.uniform(0, 2 * mean)
+        if self.latency_dist == "exponential":
+            return self.random.expovariate(1 / mean) if mean > 0 else 0
+        # lognormal with the requested mean
+        mu = -self.latency_sigma ** 2 / 2
+        return mean * self.random.lognormvariate(mu, self.latency_sigma)
+
+    def completion_content(self, body: dict) -> str:
+        """Builds a plausible reply for the prompt in a chat-completions request."""
+        messages = body.get("messages", [])
+        system_prompt = messages[0]["content"] if messages else ""
+        user_prompt = messages[-1]["content"] if messages else ""
+        is_json = (body.get("response_format") or {}).get("type") == "json_object"
+        if not is_json:
+            return "Dear candidate,\n\nThank you for your application.\n\nBest regards,\nRecruiting Team"
+
+        resume_ids = RESUME_ID_PATTERN.findall(user_prompt)
+        if resume_ids:
+            return self._maybe_malform(
+                json.dumps({"results": [self._evaluation(resume_id) for resume_id in resume_ids]})
+            )
+        if "must_have_skills" in user_prompt and "extract" in system_prompt:
+            return json.dumps({
+                "data": {
+                    "job_title": "Software Engineer",
+                    "years_of_experience": "3+ years",
+                    "must_have_skills": ["Python", "SQL", "Docker"],
+                    "nice_to_have_skills": ["Kubernetes"],
+                    "roles_and_responsibilities": ["Build and operate backend services"],
+                    "education_requirements": [],
+                    "job_summary": "Backend engineer for data-heavy services.",
+                }
+            })
+        if "malformed JSON" in system_prompt:
+            return json.dumps(self._evaluation())
+        return self._maybe_malform(json.dumps(self._evaluation()))
+
+    def _maybe_malform(self, content: str) -> str:
+        """Returns the reply, mangled the way real models occasionally do for ``malformed_rate`` of them."""
+        if self.random.random() >= self.malformed_rate:
+            return content
+        self.malformed += 1
+        kind = self.random.choice(["fenced", "truncated", "string_score", "prose"])
+        if kind == "fenced":
+            return f"Here is the evaluation:\n```json\n{content}\n```"
+        if kind == "truncated":
+            return content[: self.random.randint(len(content) // 2, len(content) - 1)]
+        if kind == "string_score":
+            return re.sub(r'"score": (\d+)', r'"score": "\1/100"', content)
+        return "I'm sorry, I can't produce a structured evaluation for this resume."
+
+    def _evaluation(self, resume_id: Optional[str] = None) -> dict:
+        """Returns one resume evaluation with a random score."""
+        evaluation = {
+            "score": self.random.randint(0, 100),
+            "missing_skills": self.random.sample(["Docker", "Kubernetes", "SQL", "AWS"], 2),
+            "remarks": "Solid backend experience; some infrastructure gaps.",
+        }
+        if resume_id is not None:
+            evaluation = {"id": resume_id, **evaluation}
+        return evaluation
+
+
+def create_app(provider: FakeProvider) -> FastAPI:
+    """Creates the fake provider's ASGI app."""
+    app = FastAPI(title="Fake LLM provider")
+
+    def rate_limited(message: str) -> JSONResponse:
+        provider.throttled += 1
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after": str(provider.retry_after)},
+            content={"error": {"message": message, "type": "rate_limit_exceeded"}},
+        )
+
+    async def chat_completions(request: Request):
+        provider.requests += 1
+        body = await request.json()
+        if provider.max_in_flight and provider.in_flight >= provider.max_in_flight:
+            return rate_limited("Too many concurrent requests.")
+        provider.in_flight += 1
+        try:
+            await asyncio.sleep(provider.sample_latency(body.get("model", "")))
+        finally:
+            provider.in_flight -= 1
+
+        roll = provider.random.random()
+        if roll < provider.rate_limit_rate:
+            return rate_limited("Rate limit reached.")
+        if roll < provider.rate_limit_rate + provider.error_rate:
+            return JSONResponse(
+                status_code=500,
+                content={"error": {"message": "Injected server error.", "type": "server_error"}},
+            )
+
+        content = provider.completion_content(body)
+        prompt_chars = sum(len(message.get("content", "")) for message in body.get("messages", []))
+        prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+        completion_tokens = len(content) // CHARS_PER_TOKEN
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/openai/v1/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok",
+            "requests": provider.requests,
+            "throttled": provider.throttled,
+            "malformed": provider.malformed,
+        }
+
+    return app
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parses the command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=500, help="Mean response delay.")
+    parser.add_argument(
+        "--latency-dist",
+        choices=["fixed", "uniform", "exponential", "lognormal"],
+        default="lognormal",
+    )
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Spread of the lognormal delay.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s.")
+    parser.add_argument(
+        "--max-in-flight", type=int, default=0, help="Concurrent requests above which 429s are sent (0: no cap)."
+    )
+    parser.add_argument(
+        "--malformed-rate", type=float, default=0.0, help="Share of JSON replies sent malformed."
+    )
+    parser.add_argument(
+        "--model-latency-ms",
+        action="append",
+        default=[],
+        metavar="MODEL=MS",
+        help="Mean delay for one model, e.g. a cascade's cheap model (repeatable).",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Runs the fake provider until interrupted."""
+    args = parse_args(argv)
+    provider = FakeProvider(
+        latency_ms=args.latency_ms,
+        latency_dist=args.latency_dist,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        max_in_flight=args.max_in_flight,
+        malformed_rate=args.malformed_rate,
+        model_latency_ms={
+            model: float(latency) for model, latency in (item.rsplit("=", 1) for item in args.model_latency_ms)
+        },
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(provider), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+Offline load driver for the evaluation pipeline.
+
+Starts the fake LLM provider (``fake_llm_server.py``) unless ``--llm-url`` is
+given, points the app at it, and evaluates generated resume corpora both
+through ``POST /evaluate`` (in-process ASGI) and through ``EvaluationEngine``
+directly. Reports requests/sec, latency percentiles, peak RSS and per-stage
+time, and writes everything to a JSON file so runs can be compared between
+commits (``--baseline``).
+
+Example::
+
+    python benchmarks/run_benchmarks.py --sizes 1,10,100 --repeats 3 --llm-latency-ms 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import yaml
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from corpus import FORMATS, JOB_DESCRIPTION, generate_corpus  # noqa: E402
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Returns a linearly interpolated percentile of ``values``."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> Dict[str, Optional[float]]:
+    """Returns the peak RSS of this process and of its live and reaped child processes."""
+    # ru_maxrss is in kilobytes on Linux
+    server = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    proc = Path("/proc")
+    if proc.exists():
+        # Conversion pool workers are still alive, so read their high-water marks directly
+        for status_file in proc.glob("[0-9]*/status"):
+            try:
+                status = status_file.read_text()
+            except OSError:
+                continue
+            fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+            if fields.get("PPid", "").strip() == str(os.getpid()) and "VmHWM" in fields:
+                workers = max(workers, int(fields["VmHWM"].split()[0]) / 1024)
+    return {"server": round(server, 1), "workers": round(workers, 1)}
+
+
+def git_commit() -> Optional[str]:
+    """Returns the current commit hash, if the tree is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_settings(args: argparse.Namespace, work_dir: Path) -> Path:
+    """Writes the settings used for the run, derived from the app's settings file."""
+    with open(args.settings) as f:
+        settings = yaml.safe_load(f)
+    if args.provider:
+        settings["ai"]["default_provider"] = args.provider
+    if args.max_concurrency:
+        settings["evaluation"]["max_concurrency"] = args.max_concurrency
+    if args.cascade_top_k:
+        cascade = settings["evaluation"].setdefault("cascade", {})
+        cascade.update(enabled=True, top_k=args.cascade_top_k)
+    if not args.keep_caches:
+        # Measure the cold path: every repeat converts and scores from scratch
+        settings["evaluation"]["cache"]["enabled"] = False
+        settings["documents"]["cache"]["enabled"] = False
+    settings.setdefault("jobs", {})["path"] = str(work_dir / "jobs.sqlite3")
+    settings.setdefault("candidates", {})["path"] = str(work_dir / "candidates.sqlite3")
+    settings_path = work_dir / "settings.yaml"
+    with open(settings_path, "w") as f:
+        yaml.safe_dump(settings, f)
+    return settings_path
+
+
+def start_fake_provider(args: argparse.Namespace) -> subprocess.Popen:
+    """Starts the fake LLM provider in a subprocess and waits until it answers."""
+    process = subprocess.Popen([
+        sys.executable, str(BENCHMARKS_DIR / "fake_llm_server.py"),
+        "--port", str(args.llm_port),
+        "--latency-ms", str(args.llm_latency_ms),
+        "--latency-dist", args.llm_latency_dist,
+        "--error-rate", str(args.llm_error_rate),
+        "--rate-limit-rate", str(args.llm_rate_limit_rate),
+        "--max-in-flight", str(args.llm_max_in_flight),
+        "--malformed-rate", str(args.llm_malformed_rate),
+        *(option for item in args.llm_model_latency_ms for option in ("--model-latency-ms", item)),
+        "--seed", str(args.seed),
+    ])
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{args.llm_port}/health", timeout=1).raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("The fake LLM provider did not start.")
+
+
+class StageTimer:
+    """Diffs the app's metrics around a scenario to attribute time to pipeline stages."""
+
+    def __init__(self):
+        """Captures the current metric totals."""
+        self.before = self._snapshot()
+
+    @staticmethod
+    def _snapshot() -> Dict[str, dict]:
+        """Returns the current totals of the metrics used for stage timing."""
+        from src.utils.metrics import REGISTRY
+
+        return {
+            name: REGISTRY.get(name).totals()
+            for name in (
+                "document_conversion_duration_seconds",
+                "llm_request_duration_seconds",
+                "llm_errors",
+                "llm_retries",
+            )
+        }
+
+    def stages(self) -> dict:
+        """Returns the time and counts accrued by each stage since construction."""
+        after = self._snapshot()
+
+        def histogram_delta(name: str, label_index: Optional[int] = None) -> Dict[str, tuple]:
+            deltas: Dict[str, tuple] = {}
+            for key, (count, total) in after[name].items():
+                old_count, old_total = self.before[name].get(key, (0, 0.0))
+                group = key[label_index] if label_index is not None else "all"
+                prev_count, prev_total = deltas.get(group, (0, 0.0))
+                deltas[group] = (prev_count + count - old_count, prev_total + total - old_total)
+            return deltas
+
+        def counter_delta(name: str) -> float:
+            return sum(value - self.before[name].get(key, 0) for key, value in after[name].items())
+
+        conversion = histogram_delta("document_conversion_duration_seconds").get("all", (0, 0.0))
+        llm_by_prompt = histogram_delta("llm_request_duration_seconds", label_index=2)
+        return {
+            # Sums over concurrent operations, so they can exceed the wall time
+            "conversion_seconds": round(conversion[1], 4),
+            "conversions": conversion[0],
+            "llm_seconds": {prompt: round(total, 4) for prompt, (_, total) in llm_by_prompt.items()},
+            "llm_calls": {prompt: count for prompt, (count, _) in llm_by_prompt.items()},
+            "llm_errors": counter_delta("llm_errors"),
+            "llm_retries": counter_delta("llm_retries"),
+        }
+
+
+async def run_requests(repeats: int, concurrency: int, make_request) -> tuple:
+    """Runs ``make_request`` ``repeats`` times, at most ``concurrency`` at once."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            ok = await make_request()
+            latencies.append(time.perf_counter() - started)
+            errors += 0 if ok else 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(repeats)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def summarize(mode: str, size: int, args: argparse.Namespace, latencies, errors, wall, stages) -> dict:
+    """Builds the result record of one scenario."""
+    requests = len(latencies)
+    return {
+        "mode": mode,
+        "size": size,
+        "formats": args.formats,
+        "repeats": args.repeats,
+        "concurrency": args.concurrency,
+        "wall_seconds": round(wall, 4),
+        "requests_per_sec": round(requests / wall, 4) if wall else None,
+        "resumes_per_sec": round(requests * size / wall, 4) if wall else None,
+        "latency_seconds": {
+            "p50": round(percentile(latencies, 0.50), 4),
+            "p95": round(percentile(latencies, 0.95), 4),
+            "p99": round(percentile(latencies, 0.99), 4),
+            "mean": round(sum(latencies) / requests, 4) if requests else None,
+            "max": round(max(latencies), 4) if latencies else None,
+        },
+        "errors": errors,
+        "stages": stages,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+async def bench_engine(size: int, corpus, args: argparse.Namespace, container) -> dict:
+    """Evaluates a corpus by calling ``EvaluationEngine.evaluate_candidates`` directly."""
+    from fastapi import UploadFile
+
+    async def make_request() -> bool:
+        resume_files = [UploadFile(BytesIO(data), filename=filename) for filename, data in corpus]
+        results = await container.evaluation_engine.evaluate_candidates(
+            resume_files=resume_files, jd_text=JOB_DESCRIPTION
+        )
+        return len(results) == size and not any("error" in result for result in results)
+
+    timer = StageTimer()
+    latencies, errors, wall = await run_requests(args.repeats, args.concurrency, make_request)
+    return summarize("engine", size, args, latencies, errors, wall, timer.stages())
+
+
+async def bench_http(size: int, corpus, args: argparse.Namespace, client: httpx.AsyncClient) -> dict:
+    """Evaluates a corpus through ``POST /evaluate``."""
+    async def make_request() -> bool:
+        files = [("resume_files", (filename, data)) for filename, data in corpus]
+        response = await client.post("/evaluate", files=files, data={"jd_text": JOB_DESCRIPTION})
+        return response.status_code == 200
+
+    timer = StageTimer()
+    latencies, errors, wall = await run_requests(args.repeats, args.concurrency, make_request)
+    return summarize("http", size, args, latencies, errors, wall, timer.stages())
+
+
+async def run_scenarios(args: argparse.Namespace) -> List[dict]:
+    """Runs every (mode, size) scenario against in-process app components."""
+    import main as app_module
+    from src.api.dependencies import AppContainer
+
+    corpora = {size: generate_corpus(size, formats=args.formats, seed=args.seed) for size in args.sizes}
+    scenarios = []
+
+    if "engine" in args.modes:
+        container = AppContainer()
+        try:
+            for size in args.sizes:
+                print(f"engine: {size} resumes x {args.repeats}", flush=True)
+                scenarios.append(await bench_engine(size, corpora[size], args, container))
+        finally:
+            await container.aclose()
+
+    if "http" in args.modes:
+        async with app_module.lifespan(app_module.app):
+            transport = httpx.ASGITransport(app=app_module.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+                for size in args.sizes:
+                    print(f"http: {size} resumes x {args.repeats}", flush=True)
+                    scenarios.append(await bench_http(size, corpora[size], args, client))
+
+    return scenarios
+
+
+def compare(results: dict, baseline_path: Path) -> None:
+    """Prints the change in throughput and latency against a previous results file."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(s["mode"], s["size"]): s for s in baseline["scenarios"]}
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta'].get('git_commit')}):")
+    print(f"{'scenario':<16}{'req/s':>12}{'p50':>12}{'p95':>12}")
+    for scenario in results["scenarios"]:
+        old = previous.get((scenario["mode"], scenario["size"]))
+        if old is None:
+            continue
+
+        def change(new_value, old_value) -> str:
+            if not old_value:
+                return "n/a"
+            return f"{(new_value - old_value) / old_value:+.1%}"
+
+        print(
+            f"{scenario['mode'] + ' ' + str(scenario['size']):<16}"
+            f"{change(scenario['requests_per_sec'], old['requests_per_sec']):>12}"
+            f"{change(scenario['latency_seconds']['p50'], old['latency_seconds']['p50']):>12}"
+            f"{change(scenario['latency_seconds']['p95'], old['latency_seconds']['p95']):>12}"
+        )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parses the command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--sizes", default="1,10,100,1000", help="Comma-separated corpus sizes.")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Comma-separated resume formats.")
+    parser.add_argument("--modes", default="engine,http", help="Comma-separated: engine, http.")
+    parser.add_argument("--repeats", type=int, default=3, help="Evaluations per scenario.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Evaluations in flight at once.")
+    parser.add_argument("--provider", choices=["openai", "groq"], default=None)
+    parser.add_argument("--max-concurrency", type=int, default=None, help="Overrides evaluation.max_concurrency.")
+    parser.add_argument("--keep-caches", action="store_true", help="Keep the evaluation and conversion caches on.")
+    parser.add_argument("--settings", type=Path, default=BASE_DIR / "config" / "settings.yaml")
+    parser.add_argument("--llm-url", default=None, help="Use an already running fake provider at this URL.")
+    parser.add_argument("--llm-port", type=int, default=8765)
+    parser.add_argument("--llm-latency-ms", type=float, default=200)
+    parser.add_argument(
+        "--llm-latency-dist", choices=["fixed", "uniform", "exponential", "lognormal"], default="lognormal"
+    )
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--llm-max-in-flight", type=int, default=0, help="Fake provider's concurrency cap.")
+    parser.add_argument("--llm-malformed-rate", type=float, default=0.0, help="Share of malformed JSON replies.")
+    parser.add_argument(
+        "--llm-model-latency-ms", action="append", default=[], metavar="MODEL=MS",
+        help="Mean fake-provider delay for one model (repeatable).",
+    )
+    parser.add_argument(
+        "--cascade-top-k", type=int, default=0, help="Enables the model cascade, re-scoring this many (0: off)."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/).")
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous results file to compare against.")
+    args = parser.parse_args(argv)
+    args.sizes = [int(size) for size in args.sizes.split(",")]
+    args.formats = [file_format.strip() for file_format in args.formats.split(",")]
+    args.modes = [mode.strip() for mode in args.modes.split(",")]
+    return args
+
+
+def main(argv=None) -> None:
+    """Runs the benchmark and writes the results file."""
+    args = parse_args(argv)
+    work_dir = Path(tempfile.mkdtemp(prefix="recruitment-bench-"))
+    llm_url = args.llm_url or f"http://127.0.0.1:{args.llm_port}"
+
+    # Must be set before the app modules are imported
+    os.environ["RECRUITMENT_SETTINGS_PATH"] = str(write_settings(args, work_dir))
+    os.environ["OPENAI_BASE_URL"] = f"{llm_url}/v1"
+    os.environ["GROQ_BASE_URL"] = llm_url
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+    os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+    provider_process = None if args.llm_url else start_fake_provider(args)
+    try:
+        started_at = datetime.now(timezone.utc)
+        scenarios = asyncio.run(run_scenarios(args))
+    finally:
+        if provider_process is not None:
+            provider_process.terminate()
+            provider_process.wait()
+
+    commit = git_commit()
+    results = {
+        "meta": {
+            "git_commit": commit,
+            "started_at": started_at.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        },
+        "scenarios": scenarios,
+    }
+
+    output = args.output or (
+        BENCHMARKS_DIR / "results" / f"{started_at:%Y%m%dT%H%M%S}_{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'scenario':<16}{'req/s':>10}{'resumes/s':>12}{'p50 s':>10}{'p95 s':>10}{'p99 s':>10}{'errors':>8}")
+    for scenario in scenarios:
+        latency = scenario["latency_seconds"]
+        print(
+            f"{scenario['mode'] + ' ' + str(scenario['size']):<16}"
+            f"{scenario['requests_per_sec']:>10.3f}{scenario['resumes_per_sec']:>12.2f}"
+            f"{latency['p50']:>10.3f}{latency['p95']:>10.3f}{latency['p99']:>10.3f}{scenario['errors']:>8}"
+        )
+    print(f"\nResults written to {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
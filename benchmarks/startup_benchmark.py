@@ -0,0 +1,254 @@
+"""
+Cold-start benchmark for the web app.
+
+Measures, in fresh interpreters, how long ``import main`` takes (from
+``python -X importtime``) and which packages dominate it, then starts the
+app under uvicorn and records the time until it answers its first request
+and how long its first evaluation takes (which pays for anything imported
+lazily). Modules meant to load on first use (``--deferred-modules``) must
+not appear at startup. With ``--baseline``, ``--max-regression`` turns a
+slower startup into a non-zero exit code, so slow imports are caught in CI.
+
+Example::
+
+    python benchmarks/startup_benchmark.py --repeats 5
+    python benchmarks/startup_benchmark.py --baseline benchmarks/results/startup_<previous>.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASE_DIR = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+import run_benchmarks  # noqa: E402
+from corpus import JOB_DESCRIPTION, generate_corpus  # noqa: E402
+from run_benchmarks import git_commit, percentile  # noqa: E402
+
+# "import time: self [us] | cumulative | imported package", nested imports indented
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+DEFERRED_MODULES = "openai,groq,markitdown,numpy,scipy,httpx"
+
+
+def measure_imports(env: Dict[str, str]) -> dict:
+    """Imports the app in a fresh interpreter and parses ``-X importtime``."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    total_us = 0
+    self_by_package: Dict[str, int] = defaultdict(int)
+    modules = set()
+    for line in process.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        modules.add(module)
+        self_by_package[module.split(".")[0]] += int(self_us)
+        if module == "main" and not indent:
+            total_us = int(cumulative_us)
+    return {"seconds": total_us / 1e6, "self_by_package": dict(self_by_package), "modules": modules}
+
+
+def free_port() -> int:
+    """Returns a TCP port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_server(env: Dict[str, str], resume: tuple, timeout: float) -> dict:
+    """
+    Starts uvicorn and times its first answered request and its first evaluation.
+
+    The first request is a ``GET /metrics`` poll, so it measures imports plus
+    the application lifespan; the evaluation then pays for lazily imported
+    SDKs and converters.
+    """
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BASE_DIR, env=env, start_new_session=True,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            deadline = started + timeout
+            while True:
+                try:
+                    client.get("/metrics", timeout=1).raise_for_status()
+                    break
+                except httpx.HTTPError:
+                    if time.perf_counter() > deadline or server.poll() is not None:
+                        raise RuntimeError("The app did not start.")
+                    time.sleep(0.01)
+            ready = time.perf_counter() - started
+
+            evaluation_started = time.perf_counter()
+            response = client.post(
+                "/evaluate", files=[("resume_files", resume)], data={"jd_text": JOB_DESCRIPTION}
+            )
+            response.raise_for_status()
+            first_evaluation = time.perf_counter() - evaluation_started
+    finally:
+        server.terminate()
+        server.wait()
+        # Conversion pool workers can outlive the server; don't let them skew the next run
+        try:
+            os.killpg(server.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    return {"ready_seconds": ready, "first_evaluation_seconds": first_evaluation}
+
+
+def summarize(values: List[float]) -> dict:
+    """Returns the median, minimum and maximum of ``values``."""
+    return {
+        "p50": round(percentile(values, 0.5), 4),
+        "min": round(min(values), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def compare(results: dict, baseline_path: Path, max_regression: Optional[float]) -> bool:
+    """Prints the change against a previous results file; returns False on a regression past the limit."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_path} (commit {baseline['meta'].get('git_commit')}):")
+    ok = True
+    for metric in ("import_seconds", "ready_seconds", "first_evaluation_seconds"):
+        new_value, old_value = results[metric]["p50"], baseline[metric]["p50"]
+        change = (new_value - old_value) / old_value if old_value else 0.0
+        regressed = max_regression is not None and metric != "first_evaluation_seconds" and change > max_regression
+        ok = ok and not regressed
+        print(f"{metric:<28}{old_value:>10.3f}{new_value:>10.3f}{change:>+10.1%}{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parses the command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters (and servers) measured.")
+    parser.add_argument("--format", default="docx", help="Format of the resume sent in the first evaluation.")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages listed.")
+    parser.add_argument(
+        "--deferred-modules", default=DEFERRED_MODULES,
+        help="Comma-separated modules that must not be imported at startup.",
+    )
+    parser.add_argument("--settings", type=Path, default=BASE_DIR / "config" / "settings.yaml")
+    parser.add_argument("--llm-port", type=int, default=8766)
+    parser.add_argument("--llm-latency-ms", type=float, default=50)
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for the app to answer.")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/).")
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous results file to compare against.")
+    parser.add_argument(
+        "--max-regression", type=float, default=None,
+        help="Fail if import or ready time grew by more than this fraction of the baseline (e.g. 0.2).",
+    )
+    args = parser.parse_args(argv)
+    args.deferred_modules = [module.strip() for module in args.deferred_modules.split(",") if module.strip()]
+    return args
+
+
+def main(argv=None) -> None:
+    """Runs the benchmark, writes the results file and exits non-zero on a regression."""
+    args = parse_args(argv)
+    work_dir = Path(tempfile.mkdtemp(prefix="recruitment-startup-"))
+    # Same settings as the load benchmark: caches off, so the first evaluation converts and scores
+    bench_args = run_benchmarks.parse_args([
+        "--settings", str(args.settings),
+        "--llm-port", str(args.llm_port),
+        "--llm-latency-ms", str(args.llm_latency_ms),
+    ])
+    llm_url = f"http://127.0.0.1:{args.llm_port}"
+    env = {
+        **os.environ,
+        "RECRUITMENT_SETTINGS_PATH": str(run_benchmarks.write_settings(bench_args, work_dir)),
+        "OPENAI_BASE_URL": f"{llm_url}/v1",
+        "GROQ_BASE_URL": llm_url,
+    }
+    env.setdefault("OPENAI_API_KEY", "benchmark")
+    env.setdefault("GROQ_API_KEY", "benchmark")
+    resume = generate_corpus(1, formats=[args.format], seed=0)[0]
+
+    started_at = datetime.now(timezone.utc)
+    imports, servers = [], []
+    provider_process = run_benchmarks.start_fake_provider(bench_args)
+    try:
+        for repeat in range(args.repeats):
+            print(f"startup: run {repeat + 1} of {args.repeats}", flush=True)
+            imports.append(measure_imports(env))
+            servers.append(measure_server(env, resume, args.timeout))
+    finally:
+        provider_process.terminate()
+        provider_process.wait()
+
+    # Package self-times of the median import run
+    median_run = sorted(imports, key=lambda run: run["seconds"])[len(imports) // 2]
+    slowest = sorted(median_run["self_by_package"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+    eager = sorted(
+        module for module in args.deferred_modules
+        if any(run_module == module or run_module.startswith(module + ".") for run_module in median_run["modules"])
+    )
+
+    commit = git_commit()
+    results = {
+        "meta": {
+            "git_commit": commit,
+            "started_at": started_at.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        },
+        "import_seconds": summarize([run["seconds"] for run in imports]),
+        "ready_seconds": summarize([run["ready_seconds"] for run in servers]),
+        "first_evaluation_seconds": summarize([run["first_evaluation_seconds"] for run in servers]),
+        "slowest_packages_seconds": {package: round(self_us / 1e6, 4) for package, self_us in slowest},
+        "eagerly_imported": eager,
+    }
+
+    output = args.output or (
+        BENCHMARKS_DIR / "results" / f"startup_{started_at:%Y%m%dT%H%M%S}_{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'metric':<28}{'p50 s':>10}{'min s':>10}{'max s':>10}")
+    for metric in ("import_seconds", "ready_seconds", "first_evaluation_seconds"):
+        print(f"{metric:<28}{results[metric]['p50']:>10.3f}{results[metric]['min']:>10.3f}{results[metric]['max']:>10.3f}")
+    print("\nSlowest packages at import (self time):")
+    for package, seconds in results["slowest_packages_seconds"].items():
+        print(f"  {package:<26}{seconds:>10.3f}")
+    print(f"\nResults written to {output}")
+
+    ok = True
+    if eager:
+        print(f"\nImported at startup but meant to load on first use: {', '.join(eager)}")
+        ok = False
+    if args.baseline:
+        ok = compare(results, args.baseline, args.max_regression) and ok
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
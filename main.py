@@ -2,6 +2,7 @@ import os
 import sys
 from pathlib import Path
 import logging
+from contextlib import asynccontextmanager
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
@@ -14,15 +15,37 @@ from fastapi.responses import JSONResponse
 
 # Import local modules
 from src.api import routes
+from src.api.dependencies import AppContainer
+from src.api.middleware import RequestSizeLimitMiddleware
+from src.utils.config import load_settings
 from src.utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Builds the shared application components once at startup."""
+    app.state.container = AppContainer()
+    await app.state.container.start()
+    logger.info("Application components initialized")
+    yield
+    await app.state.container.aclose()
+
+
 app = FastAPI(
     title="Recruitment AI Agent",
     description="A web application for ranking candidates based on their resumes and a job description.",
     version="0.2.0",  # Version incremented to reflect refactoring
+    lifespan=lifespan,
+)
+
+# Reject oversized uploads before their bodies are buffered (upload parts are
+# spooled to disk past uploads.spool_max_kb by the routes' UploadRequest)
+upload_settings = load_settings().get("uploads", {})
+app.add_middleware(
+    RequestSizeLimitMiddleware, max_bytes=int(upload_settings.get("max_request_mb", 200) * 1024 * 1024)
 )
 
 # Add CORS middleware
@@ -0,0 +1,239 @@
+import asyncio
+import hmac
+import os
+import threading
+from pathlib import Path
+
+from fastapi import Depends, HTTPException, Request
+
+from src.core.JobDescriptionGenerator import JobDescriptionGenerator
+from src.core.candidate_store import CandidateStore
+from src.core.compaction import ResumeCompactor
+from src.core.conversion_cache import ConversionCache
+from src.core.email_generator import EmailGenerator
+from src.core.document_processor import CONVERTER_VERSION, DocumentProcessor
+from src.core.evaluation_cache import EvaluationCache
+from src.core.evaluation_engine import EvaluationEngine
+from src.core.job_runner import JobRunner
+from src.core.job_store import JobStore
+from src.core.prescreen import LexicalPrescreener
+from src.llm import get_llm_client
+from src.llm.base import LLMClient
+from src.llm.http import close_shared_http_clients
+from src.prompts.manager import PromptManager
+from src.utils.config import BASE_DIR, PROMPTS_PATH, SETTINGS_PATH, load_settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Client addresses treated as the server's own host by ``require_admin``
+LOCAL_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+class AppContainer:
+    """
+    Builds and holds the components shared by every request.
+
+    The container is created once in the application lifespan so settings and
+    prompts are parsed once and the LLM client keeps its connection pool warm.
+    Call ``reload`` (or ``areload`` from the event loop) after editing the
+    configuration files.
+    """
+
+    def __init__(self, settings_path: Path = SETTINGS_PATH, prompts_path: Path = PROMPTS_PATH):
+        """Initializes the AppContainer and builds all components."""
+        self.settings_path = settings_path
+        self.prompts_path = prompts_path
+        self._lock = threading.Lock()
+        self.conversion_cache = None
+        self.evaluation_cache = None
+        self.candidate_store = None
+        self._build()
+        job_settings = self.settings.get("jobs", {})
+        self.job_store = JobStore(BASE_DIR / job_settings.get("path", "data/jobs.sqlite3"))
+        self.job_runner = JobRunner(
+            self.job_store,
+            get_engine=lambda: self.evaluation_engine,
+            workers=job_settings.get("workers", 2),
+        )
+
+    def _build(self) -> None:
+        """Builds a fresh set of components and swaps them in together."""
+        settings = load_settings(self.settings_path)
+        prompt_settings = settings.get("prompts", {})
+        reload_interval = (
+            prompt_settings.get("reload_interval_seconds", 2) if prompt_settings.get("hot_reload", False) else None
+        )
+        prompt_manager = PromptManager(self.prompts_path, reload_interval=reload_interval)
+        llm_client = get_llm_client(settings, prompt_manager)
+        document_settings = settings.get("documents", {})
+        workers = document_settings.get("workers")
+        document_processor = DocumentProcessor(
+            cache=self._get_conversion_cache(settings),
+            path_extensions=document_settings.get("path_extensions", []),
+            max_workers=(os.cpu_count() or 1) if workers is None else workers,
+            timeout_seconds=document_settings.get("timeout_seconds", 60),
+            max_bytes=document_settings.get("max_file_mb", 20) * 1024 * 1024,
+            max_pages=document_settings.get("max_pdf_pages", 50),
+        )
+        evaluation_settings = settings.get("evaluation", {})
+        batch_settings = evaluation_settings.get("batch", {})
+        digest_settings = evaluation_settings.get("jd_digest", {})
+        prescreen_settings = evaluation_settings.get("prescreen", {})
+        compaction_settings = evaluation_settings.get("compaction", {})
+        cascade_settings = evaluation_settings.get("cascade", {})
+        cascade_client = (
+            get_llm_client(settings, prompt_manager, models=cascade_settings.get("models", {}))
+            if cascade_settings.get("enabled", False)
+            else None
+        )
+        evaluation_engine = EvaluationEngine(
+            llm_client,
+            document_processor,
+            prompt_manager,
+            max_concurrency=evaluation_settings.get("max_concurrency", 5),
+            evaluation_cache=self._get_evaluation_cache(settings),
+            batch_token_budget=batch_settings.get("token_budget", 0),
+            max_batch_size=batch_settings.get("max_batch_size", 10),
+            jd_generator=(
+                JobDescriptionGenerator(llm_client) if digest_settings.get("enabled", False) else None
+            ),
+            digest_min_tokens=digest_settings.get("min_jd_tokens", 300),
+            prescreener=(
+                LexicalPrescreener(
+                    top_k=prescreen_settings.get("top_k", 50),
+                    min_score=prescreen_settings.get("min_score", 0),
+                )
+                if prescreen_settings.get("enabled", False)
+                else None
+            ),
+            prescreen_min_candidates=prescreen_settings.get("min_candidates", 50),
+            compactor=(
+                ResumeCompactor(token_budget=compaction_settings.get("token_budget", 2000))
+                if compaction_settings.get("enabled", False)
+                else None
+            ),
+            archive_max_entries=settings.get("uploads", {}).get("archive_max_entries", 1000),
+            candidate_store=self._get_candidate_store(settings),
+            cascade_client=cascade_client,
+            cascade_top_k=cascade_settings.get("top_k", 10),
+            cascade_band=tuple(cascade_settings.get("uncertain_band", [45, 70])),
+        )
+
+        email_generator = EmailGenerator(llm_client, prompt_manager)
+
+        with self._lock:
+            previous_processor = getattr(self, "document_processor", None)
+            self.settings = settings
+            self.upload_spool_bytes = int(settings.get("uploads", {}).get("spool_max_kb", 64) * 1024)
+            self.prompt_manager = prompt_manager
+            self.llm_client = llm_client
+            self.document_processor = document_processor
+            self.evaluation_engine = evaluation_engine
+            self.email_generator = email_generator
+
+        if previous_processor is not None:
+            # Requests started before the swap may still be converting with it
+            previous_processor.retire()
+
+    def _get_conversion_cache(self, settings: dict):
+        """Creates the conversion cache once; it survives reloads so entries stay warm."""
+        cache_settings = settings.get("documents", {}).get("cache", {})
+        if not cache_settings.get("enabled", False):
+            return None
+        if self.conversion_cache is None:
+            self.conversion_cache = ConversionCache(
+                db_path=BASE_DIR / cache_settings.get("path", "data/cache/conversions.sqlite3"),
+                converter_version=CONVERTER_VERSION,
+                memory_items=cache_settings.get("memory_items", 256),
+                max_disk_bytes=cache_settings.get("max_disk_mb", 256) * 1024 * 1024,
+            )
+        return self.conversion_cache
+
+    def _get_evaluation_cache(self, settings: dict):
+        """
+        Creates the evaluation cache once; its keys include the model and prompt
+        version, so entries stay valid across reloads.
+        """
+        cache_settings = settings.get("evaluation", {}).get("cache", {})
+        if not cache_settings.get("enabled", False):
+            return None
+        if self.evaluation_cache is None:
+            self.evaluation_cache = EvaluationCache(
+                max_items=cache_settings.get("max_items", 2048),
+                ttl_seconds=cache_settings.get("ttl_seconds", 86400),
+            )
+        return self.evaluation_cache
+
+    def _get_candidate_store(self, settings: dict):
+        """Opens the candidate store once; it survives reloads like the job store."""
+        store_settings = settings.get("candidates", {})
+        if not store_settings.get("enabled", False):
+            return None
+        if self.candidate_store is None:
+            self.candidate_store = CandidateStore(BASE_DIR / store_settings.get("path", "data/candidates.sqlite3"))
+        return self.candidate_store
+
+    def reload(self) -> None:
+        """Re-reads the settings and prompts files and rebuilds every component."""
+        self._build()
+        logger.info("Reloaded application components from configuration")
+
+    async def areload(self) -> None:
+        """Reloads the configuration in a thread, so parsing and rebuilding don't block the event loop."""
+        await asyncio.to_thread(self.reload)
+
+    async def start(self) -> None:
+        """Starts background work; must be called from the running event loop."""
+        await self.job_runner.start()
+
+    async def aclose(self) -> None:
+        """Releases resources held by the components."""
+        await self.job_runner.stop()
+        self.job_store.close()
+        await close_shared_http_clients()
+        self.document_processor.shutdown()
+        if self.conversion_cache is not None:
+            self.conversion_cache.close()
+        if self.candidate_store is not None:
+            self.candidate_store.close()
+
+
+def get_container(request: Request) -> AppContainer:
+    """Returns the application-scoped component container."""
+    return request.app.state.container
+
+
+def require_admin(request: Request, container: AppContainer = Depends(get_container)) -> None:
+    """
+    Guards administrative endpoints. When the environment variable named by
+    ``admin.token_env`` is set, callers must send it as ``X-Admin-Token``;
+    otherwise only requests from the server's own host are accepted.
+    """
+    token_env = container.settings.get("admin", {}).get("token_env", "RECRUITMENT_ADMIN_TOKEN")
+    token = os.getenv(token_env) if token_env else None
+    if token:
+        if not hmac.compare_digest(request.headers.get("x-admin-token", ""), token):
+            raise HTTPException(status_code=403, detail="Missing or invalid admin token.")
+    elif request.client is None or request.client.host not in LOCAL_HOSTS:
+        raise HTTPException(status_code=403, detail="Only allowed from the server's own host.")
+
+
+def get_llm(container: AppContainer = Depends(get_container)) -> LLMClient:
+    """Returns the shared LLM client."""
+    return container.llm_client
+
+
+def get_evaluation_engine(container: AppContainer = Depends(get_container)) -> EvaluationEngine:
+    """Returns the shared evaluation engine."""
+    return container.evaluation_engine
+
+
+def get_email_generator(container: AppContainer = Depends(get_container)) -> EmailGenerator:
+    """Returns the shared email generator."""
+    return container.email_generator
+
+
+def get_job_runner(container: AppContainer = Depends(get_container)) -> JobRunner:
+    """Returns the background job runner."""
+    return container.job_runner
@@ -0,0 +1,69 @@
+import json
+
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+REJECTED_REQUESTS = REGISTRY.counter(
+    "http_requests_too_large", "Requests rejected for exceeding the request body size limit."
+)
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Rejects request bodies larger than ``max_bytes`` with 413 before they are buffered.
+
+    A declared ``Content-Length`` over the limit is refused without reading the
+    body. Otherwise the bytes are counted as they stream in and the request
+    fails as soon as the count passes the limit, so a chunked upload can't
+    spool an unbounded body to memory or disk. Raising HTTPException from the
+    body stream lets FastAPI's form parsing surface it as a 413 response.
+    """
+
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        """Initializes the RequestSizeLimitMiddleware; a ``max_bytes`` of 0 disables it."""
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.max_bytes:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await self._reject(send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    REJECTED_REQUESTS.inc()
+                    raise HTTPException(status_code=413, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        """Returns the error message for an oversized request."""
+        return f"Request body is larger than the limit of {self.max_bytes} bytes."
+
+    async def _reject(self, send: Send) -> None:
+        """Sends a 413 response without reading the request body."""
+        REJECTED_REQUESTS.inc()
+        body = json.dumps({"detail": self._detail()}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
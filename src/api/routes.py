@@ -1,15 +1,40 @@
-from fastapi import APIRouter, Request, UploadFile, File, Form
-from fastapi.responses import HTMLResponse
+import asyncio
+import heapq
+import json
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File, Form
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from src.core.document_processor import DocumentProcessor
-from src.core.evaluation_engine import EvaluationEngine
-from src.llm import get_llm_client
-from src.prompts.manager import PromptManager
+from src.api.dependencies import (
+    AppContainer,
+    get_container,
+    get_email_generator,
+    get_evaluation_engine,
+    get_job_runner,
+    get_llm,
+    require_admin,
+)
+from src.api.uploads import UploadRoute
+from src.core.candidate_store import CandidateStore
+from src.core.email_generator import EmailGenerator
+from src.core.evaluation_engine import EvaluationEngine, ranking_key
+from src.core.ingestion import FileTooLargeError, IngestedFile, ingest_upload, is_archive, iter_archive_entries
+from src.core.job_runner import JobRunner
+from src.llm.base import LLMClient
+from src.llm.router import RoutingLLMClient
+from src.utils.metrics import COUNT_BUCKETS, REGISTRY
 from pathlib import Path
 
-router = APIRouter()
+router = APIRouter(route_class=UploadRoute)
+
+EVALUATION_SECONDS = REGISTRY.histogram(
+    "evaluation_duration_seconds", "End-to-end latency of evaluation requests.", ("endpoint",)
+)
+EVALUATION_CANDIDATES = REGISTRY.histogram(
+    "evaluation_candidates", "Resumes submitted per evaluation request.", ("endpoint",), COUNT_BUCKETS
+)
 
 # Build a robust path to the templates directory
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -35,51 +60,348 @@ async def evaluate(
     employment_type: Optional[str] = Form(None),
     industry: Optional[str] = Form(None),
     location: Optional[str] = Form(None),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
 ):
-    """Evaluates resumes against a job description and generates emails."""
-    llm_client = get_llm_client()
-    document_processor = DocumentProcessor()
-    prompt_manager = PromptManager(BASE_DIR / "config/prompts.yaml")
-    evaluation_engine = EvaluationEngine(
-        llm_client, document_processor, prompt_manager
+    """Evaluates resumes against a job description."""
+    jd_generation_details = _jd_generation_details(
+        job_title, experience, skills, company_name, employment_type, industry, location
     )
 
-    jd_generation_details = {
-        "job_title": job_title,
-        "experience": experience,
-        "skills": skills,
-        "company_name": company_name,
-        "employment_type": employment_type,
-        "industry": industry,
-        "location": location,
-    }
+    EVALUATION_CANDIDATES.observe(len(resume_files), endpoint="/evaluate")
+    with EVALUATION_SECONDS.time(endpoint="/evaluate"):
+        results = await evaluation_engine.evaluate_candidates(
+            resume_files=resume_files,
+            jd_file=jd_file,
+            jd_text=jd_text,
+            jd_generation_details=jd_generation_details,
+        )
+
+    return templates.TemplateResponse(
+        "index.html",
+        {"request": request, "results": results, "job_title": job_title},
+    )
+
+
+@router.post("/evaluate/stream")
+async def evaluate_stream(
+    resume_files: List[UploadFile] = File(...),
+    jd_file: Optional[UploadFile] = File(None),
+    jd_text: Optional[str] = Form(None),
+    job_title: Optional[str] = Form(None),
+    experience: Optional[str] = Form(None),
+    skills: Optional[str] = Form(None),
+    company_name: Optional[str] = Form(None),
+    employment_type: Optional[str] = Form(None),
+    industry: Optional[str] = Form(None),
+    location: Optional[str] = Form(None),
+    top_n: int = Form(5),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """
+    Streams evaluation progress as NDJSON.
 
-    results = await evaluation_engine.evaluate_candidates(
+    Emits one ``candidate`` event per resume as soon as its evaluation
+    completes, carrying the running top-N ranking, then a final ``done``
+    event with the full ranked results.
+    """
+    jd_generation_details = _jd_generation_details(
+        job_title, experience, skills, company_name, employment_type, industry, location
+    )
+
+    EVALUATION_CANDIDATES.observe(len(resume_files), endpoint="/evaluate/stream")
+    # Archives are expanded while they are read, so their resume count is unknown up front
+    total = None if any(is_archive(resume_file.filename) for resume_file in resume_files) else len(resume_files)
+
+    results = evaluation_engine.iter_evaluations(
         resume_files=resume_files,
         jd_file=jd_file,
         jd_text=jd_text,
         jd_generation_details=jd_generation_details,
     )
+    return StreamingResponse(
+        _ndjson_events(results, total, top_n, "/evaluate/stream"), media_type="application/x-ndjson"
+    )
 
-    interview_email = None
-    rejection_email = None
-    role = job_title or "the position"
 
-    if results and "error" not in results[0]:
-        top_candidate_name = results[0]["filename"].split('.')[0]
-        interview_email = llm_client.generate_interview_email(
-            candidate_name=top_candidate_name, role=role
+@router.post("/emails")
+async def generate_emails(
+    email_types: List[str] = Form(["interview", "rejection"]),
+    job_title: Optional[str] = Form(None),
+    candidate_name: Optional[str] = Form(None),
+    email_generator: EmailGenerator = Depends(get_email_generator),
+):
+    """
+    Generates the requested candidate emails on demand, concurrently.
+
+    The UI calls this only when the recruiter asks for emails, so email
+    generation stays off the critical path of an evaluation.
+    """
+    try:
+        emails = await email_generator.generate_many(
+            email_types, role=job_title or "the position", candidate_name=candidate_name
         )
-        rejection_email = llm_client.generate_rejection_email(
-            candidate_name="Candidate", role=role
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"emails": emails}
+
+
+@router.post("/jobs", status_code=202)
+async def create_job(
+    resume_files: List[UploadFile] = File(...),
+    jd_file: Optional[UploadFile] = File(None),
+    jd_text: Optional[str] = Form(None),
+    job_title: Optional[str] = Form(None),
+    experience: Optional[str] = Form(None),
+    skills: Optional[str] = Form(None),
+    company_name: Optional[str] = Form(None),
+    employment_type: Optional[str] = Form(None),
+    industry: Optional[str] = Form(None),
+    location: Optional[str] = Form(None),
+    job_runner: JobRunner = Depends(get_job_runner),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """Queues a screening run in the background and returns its job id."""
+    jd_generation_details = _jd_generation_details(
+        job_title, experience, skills, company_name, employment_type, industry, location
+    )
+    max_bytes = evaluation_engine.document_processor.max_bytes
+    archives = [resume_file for resume_file in resume_files if is_archive(resume_file.filename)]
+    plain_files = [resume_file for resume_file in resume_files if not is_archive(resume_file.filename)]
+    uploads = await asyncio.to_thread(_ingest_uploads, plain_files, max_bytes)
+    jd = None
+    if jd_file and jd_file.filename:
+        jd_upload = (await asyncio.to_thread(_ingest_uploads, [jd_file], max_bytes))[0]
+        jd = (jd_upload.filename, jd_upload.read())
+
+    def job_resumes():
+        # Each resume is read from its spooled upload or archive only while it is being stored
+        for upload in uploads:
+            yield upload.filename, upload.read(), None
+        for archive in archives:
+            entries = iter_archive_entries(
+                archive.filename, archive.file, max_bytes, evaluation_engine.archive_max_entries
+            )
+            for entry in entries:
+                if entry.error is not None:
+                    yield entry.filename, b"", {"filename": entry.filename, "error": entry.error}
+                else:
+                    yield entry.filename, entry.data, None
+
+    try:
+        job_id, total = await asyncio.to_thread(
+            job_runner.store.create_job, job_resumes(), jd_text, jd_generation_details, jd
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    job_runner.submit(job_id)
+    return {"job_id": job_id, "status": "queued", "total": total}
 
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "results": results,
-            "interview_email": interview_email,
-            "rejection_email": rejection_email,
-        },
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, job_runner: JobRunner = Depends(get_job_runner)):
+    """Returns a job's status, progress and the ranked results completed so far."""
+    job = await asyncio.to_thread(job_runner.get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+
+@router.post("/candidates")
+async def store_candidates(
+    resume_files: List[UploadFile] = File(...),
+    pool: Optional[str] = Form(None),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """
+    Converts resumes (or archives of resumes) once and saves them to the
+    candidate store, optionally adding them to a named pool.
+    """
+    _require_candidate_store(evaluation_engine)
+    candidates = [result async for result in evaluation_engine.iter_store_candidates(resume_files, pool or None)]
+    return {
+        "pool": pool or None,
+        "stored": sum(1 for candidate in candidates if candidate.get("stored")),
+        "candidates": candidates,
+    }
+
+
+@router.get("/candidates")
+async def list_candidates(
+    pool: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """Lists stored candidates, newest first, optionally of one pool."""
+    store = _require_candidate_store(evaluation_engine)
+    return {"candidates": await asyncio.to_thread(store.list_candidates, pool, limit, offset)}
+
+
+@router.get("/candidates/rankings")
+async def candidate_rankings(
+    jd_id: str,
+    pool: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=1000),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """Returns the best stored evaluations against a JD (by its ``jd_id``), highest score first."""
+    store = _require_candidate_store(evaluation_engine)
+    return {"jd_id": jd_id, "results": await asyncio.to_thread(store.ranking, jd_id, pool, limit)}
+
+
+@router.get("/candidates/{candidate_id}")
+async def get_candidate(
+    candidate_id: str,
+    include_text: bool = False,
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """Returns a stored candidate with its pools and past evaluations."""
+    store = _require_candidate_store(evaluation_engine)
+    candidate = await asyncio.to_thread(store.get_candidate, candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found.")
+    if not include_text:
+        candidate.pop("text")
+    return candidate
+
+
+@router.post("/candidates/evaluate")
+async def evaluate_stored_candidates(
+    pool: Optional[str] = Form(None),
+    candidate_ids: List[str] = Form([]),
+    jd_file: Optional[UploadFile] = File(None),
+    jd_text: Optional[str] = Form(None),
+    job_title: Optional[str] = Form(None),
+    experience: Optional[str] = Form(None),
+    skills: Optional[str] = Form(None),
+    company_name: Optional[str] = Form(None),
+    employment_type: Optional[str] = Form(None),
+    industry: Optional[str] = Form(None),
+    location: Optional[str] = Form(None),
+    top_n: int = Form(5),
+    evaluation_engine: EvaluationEngine = Depends(get_evaluation_engine),
+):
+    """
+    Streams the evaluation of stored candidates (a ``pool`` and/or
+    ``candidate_ids``) against a job description as NDJSON, in the same
+    format as ``/evaluate/stream``; nothing is uploaded or converted.
+    """
+    store = _require_candidate_store(evaluation_engine)
+    jd_generation_details = _jd_generation_details(
+        job_title, experience, skills, company_name, employment_type, industry, location
+    )
+    ids = [candidate_id.strip() for value in candidate_ids for candidate_id in value.split(",") if candidate_id.strip()]
+    if pool:
+        ids += await asyncio.to_thread(store.pool_candidate_ids, pool)
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise HTTPException(status_code=400, detail="No stored candidates selected.")
+
+    EVALUATION_CANDIDATES.observe(len(ids), endpoint="/candidates/evaluate")
+    results = evaluation_engine.iter_stored_evaluations(
+        ids, jd_file=jd_file, jd_text=jd_text, jd_generation_details=jd_generation_details
     )
+    return StreamingResponse(
+        _ndjson_events(results, len(ids), top_n, "/candidates/evaluate"), media_type="application/x-ndjson"
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Exposes LLM, document and evaluation metrics in the Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/llm/routing")
+async def routing_stats(llm_client: LLMClient = Depends(get_llm)):
+    """Returns per-backend load, health and latency when LLM routing is enabled."""
+    if not isinstance(llm_client, RoutingLLMClient):
+        return {"enabled": False, "backends": []}
+    return {"enabled": True, "backends": llm_client.stats()}
+
+
+@router.get("/prompts/versions")
+async def prompt_versions(container: AppContainer = Depends(get_container)):
+    """Returns the version id (content hash) of every loaded prompt."""
+    return container.prompt_manager.versions
+
+
+@router.post("/config/reload", dependencies=[Depends(require_admin)])
+async def reload_config(container: AppContainer = Depends(get_container)):
+    """
+    Reloads settings and prompts from disk without restarting the server.
+    Requests already running finish with the components they started with.
+    """
+    await container.areload()
+    return {"status": "reloaded"}
+
+
+async def _ndjson_events(
+    results: AsyncIterator[dict], total: Optional[int], top_n: int, endpoint: str
+) -> AsyncIterator[str]:
+    """
+    Renders evaluation results as NDJSON: one ``candidate`` event per result
+    as soon as it completes, carrying the running top-N ranking, then a final
+    ``done`` event with the full ranked results.
+    """
+    started = time.perf_counter()
+    completed = []
+    async for result in results:
+        completed.append(result)
+        ranking = heapq.nlargest(top_n, completed, key=ranking_key)
+        yield json.dumps({
+            "type": "candidate",
+            "candidate": result,
+            "completed": len(completed),
+            "total": total,
+            "ranking": [
+                {"filename": r.get("filename"), "score": r.get("score")}
+                for r in ranking if "error" not in r
+            ],
+        }) + "\n"
+
+    completed.sort(key=ranking_key, reverse=True)
+    EVALUATION_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint)
+    yield json.dumps({"type": "done", "results": completed}) + "\n"
+
+
+def _require_candidate_store(evaluation_engine: EvaluationEngine) -> CandidateStore:
+    """Returns the candidate store, or rejects the request if it is disabled."""
+    if evaluation_engine.candidate_store is None:
+        raise HTTPException(status_code=404, detail="The candidate store is disabled.")
+    return evaluation_engine.candidate_store
+
+
+def _ingest_uploads(files: List[UploadFile], max_bytes: int) -> List[IngestedFile]:
+    """Size-checks and hashes uploads in chunks, rejecting the request if one is too large."""
+    uploads = []
+    for file in files:
+        try:
+            uploads.append(ingest_upload(file, max_bytes))
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=f"{file.filename}: {e}") from e
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    return uploads
+
+
+def _jd_generation_details(
+    job_title: Optional[str],
+    experience: Optional[str],
+    skills: Optional[str],
+    company_name: Optional[str],
+    employment_type: Optional[str],
+    industry: Optional[str],
+    location: Optional[str],
+) -> dict:
+    """Collects the form fields used to generate a JD when none is provided."""
+    return {
+        "job_title": job_title,
+        "experience": experience,
+        "skills": skills,
+        "company_name": company_name,
+        "employment_type": employment_type,
+        "industry": industry,
+        "location": location,
+    }
+
@@ -1,12 +1,12 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List
 
-class CandidateResult(BaseModel):
+from src.utils.schemas import CandidateEvaluation
+
+
+class CandidateResult(CandidateEvaluation):
     """Pydantic model for a candidate evaluation result."""
     filename: str
-    score: int
-    missing_skills: List[str]
-    remarks: str
 
 class EvaluationResult(BaseModel):
     """Pydantic model for the overall evaluation result."""
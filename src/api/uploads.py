@@ -0,0 +1,60 @@
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import FormData, Headers
+from starlette.formparsers import MultiPartException, MultiPartParser
+
+
+class SpooledMultiPartParser(MultiPartParser):
+    """Multipart parser that spools parts larger than ``spool_max_size`` bytes to disk."""
+
+    def __init__(self, headers: Headers, stream, spool_max_size: int, **kwargs):
+        """Initializes the SpooledMultiPartParser."""
+        super().__init__(headers, stream, **kwargs)
+        self.spool_max_size = spool_max_size
+
+
+class UploadRequest(Request):
+    """
+    Request that parses multipart forms with the container's upload spool size.
+
+    The size is read from ``uploads.spool_max_kb`` through the AppContainer
+    on each request, so ``/config/reload`` applies it without touching
+    Starlette's class-wide default.
+    """
+
+    async def _get_form(
+        self,
+        *,
+        max_files: float = 1000,
+        max_fields: float = 1000,
+        max_part_size: int = 1024 * 1024,
+    ) -> FormData:
+        content_type = self.headers.get("content-type", "")
+        if self._form is None and content_type.startswith("multipart/form-data"):
+            parser = SpooledMultiPartParser(
+                self.headers,
+                self.stream(),
+                spool_max_size=self.app.state.container.upload_spool_bytes,
+                max_files=max_files,
+                max_fields=max_fields,
+                max_part_size=max_part_size,
+            )
+            try:
+                self._form = await parser.parse()
+            except MultiPartException as exc:
+                raise HTTPException(status_code=400, detail=exc.message)
+        return await super()._get_form(max_files=max_files, max_fields=max_fields, max_part_size=max_part_size)
+
+
+class UploadRoute(APIRoute):
+    """API route whose handlers receive an ``UploadRequest``."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def upload_route_handler(request: Request) -> Response:
+            return await handler(UploadRequest(request.scope, request.receive))
+
+        return upload_route_handler
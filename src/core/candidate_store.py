@@ -0,0 +1,276 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+STORED_EVALUATIONS_REUSED = REGISTRY.counter(
+    "candidate_store_evaluations_reused", "Stored evaluations reused instead of calling the LLM."
+)
+
+# Keeps "IN (...)" queries under SQLite's bound-parameter limit
+_QUERY_CHUNK = 500
+
+
+def jd_id_for(jd_text: str) -> str:
+    """Returns the id of a job description: a hash of its whitespace-normalized text."""
+    return hashlib.sha256(" ".join(jd_text.split()).encode("utf-8")).hexdigest()
+
+
+class CandidateStore:
+    """
+    SQLite-backed library of converted resumes and their past evaluations.
+
+    Candidates are keyed by the SHA-256 of the uploaded bytes, so uploading
+    the same file twice stores and converts it once. A candidate can belong
+    to any number of named pools. Evaluations are kept per candidate, job
+    description, model and prompt version. They are indexed by candidate
+    and by JD and score, so a pool can be re-ranked against a new opening
+    without re-uploading, and against a known one without any LLM calls.
+    """
+
+    def __init__(self, db_path: Path):
+        """Initializes the CandidateStore and creates its tables if needed."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS candidates (
+                id TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pool_members (
+                pool TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                added_at REAL NOT NULL,
+                PRIMARY KEY (pool, candidate_id)
+            );
+            CREATE TABLE IF NOT EXISTS job_descriptions (
+                id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS evaluations (
+                candidate_id TEXT NOT NULL,
+                jd_id TEXT NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (candidate_id, jd_id, model, prompt_version)
+            );
+            CREATE INDEX IF NOT EXISTS idx_pool_members_candidate ON pool_members (candidate_id);
+            CREATE INDEX IF NOT EXISTS idx_evaluations_jd_score ON evaluations (jd_id, score DESC);
+            """
+        )
+        self._conn.commit()
+
+    def add_to_pool(self, candidate_id: str, pool: Optional[str]) -> bool:
+        """
+        Adds a stored candidate to a pool (if one is given).
+
+        Returns:
+            Whether the candidate is stored; unknown ids are not added
+        """
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM candidates WHERE id = ?", (candidate_id,)
+            ).fetchone() is not None
+            if exists and pool:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO pool_members (pool, candidate_id, added_at) VALUES (?, ?, ?)",
+                    (pool, candidate_id, time.time()),
+                )
+                self._conn.commit()
+        return exists
+
+    def add_candidate(self, candidate_id: str, filename: str, text: str, pool: Optional[str] = None) -> None:
+        """Stores a converted resume, keeping the first copy if the same file was stored before."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO candidates (id, filename, text, created_at) VALUES (?, ?, ?, ?)",
+                (candidate_id, filename, text, now),
+            )
+            if pool:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO pool_members (pool, candidate_id, added_at) VALUES (?, ?, ?)",
+                    (pool, candidate_id, now),
+                )
+            self._conn.commit()
+
+    def list_candidates(self, pool: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Returns stored candidates (without their text), newest first, optionally of one pool."""
+        with self._lock:
+            if pool:
+                rows = self._conn.execute(
+                    "SELECT c.id, c.filename, length(c.text), c.created_at FROM pool_members p "
+                    "JOIN candidates c ON c.id = p.candidate_id WHERE p.pool = ? "
+                    "ORDER BY p.added_at DESC LIMIT ? OFFSET ?",
+                    (pool, limit, offset),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT id, filename, length(text), created_at FROM candidates "
+                    "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (limit, offset),
+                ).fetchall()
+        return [
+            {"candidate_id": candidate_id, "filename": filename, "text_length": length, "created_at": created_at}
+            for candidate_id, filename, length, created_at in rows
+        ]
+
+    def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a candidate with its pools and past evaluations, newest first."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT filename, text, created_at FROM candidates WHERE id = ?", (candidate_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            pools = [
+                pool for (pool,) in self._conn.execute(
+                    "SELECT pool FROM pool_members WHERE candidate_id = ? ORDER BY pool", (candidate_id,)
+                )
+            ]
+            evaluations = self._conn.execute(
+                "SELECT jd_id, model, prompt_version, result, created_at FROM evaluations "
+                "WHERE candidate_id = ? ORDER BY created_at DESC",
+                (candidate_id,),
+            ).fetchall()
+        filename, text, created_at = row
+        return {
+            "candidate_id": candidate_id,
+            "filename": filename,
+            "text": text,
+            "created_at": created_at,
+            "pools": pools,
+            "evaluations": [
+                {
+                    "jd_id": jd_id,
+                    "model": model,
+                    "prompt_version": prompt_version,
+                    "created_at": evaluated_at,
+                    **json.loads(result),
+                }
+                for jd_id, model, prompt_version, result, evaluated_at in evaluations
+            ],
+        }
+
+    def pool_candidate_ids(self, pool: str) -> List[str]:
+        """Returns the ids of every candidate in a pool, oldest member first."""
+        with self._lock:
+            return [
+                candidate_id for (candidate_id,) in self._conn.execute(
+                    "SELECT candidate_id FROM pool_members WHERE pool = ? ORDER BY added_at", (pool,)
+                )
+            ]
+
+    def load_texts(self, candidate_ids: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """Returns ``{candidate_id: (filename, text)}`` for the ids that are stored."""
+        texts: Dict[str, Tuple[str, str]] = {}
+        with self._lock:
+            for chunk in _chunks(list(candidate_ids)):
+                for candidate_id, filename, text in self._conn.execute(
+                    f"SELECT id, filename, text FROM candidates WHERE id IN ({_placeholders(chunk)})", chunk
+                ):
+                    texts[candidate_id] = (filename, text)
+        return texts
+
+    def save_jd(self, jd_text: str) -> str:
+        """Stores a job description once and returns its id."""
+        jd_id = jd_id_for(jd_text)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO job_descriptions (id, text, created_at) VALUES (?, ?, ?)",
+                (jd_id, jd_text, time.time()),
+            )
+            self._conn.commit()
+        return jd_id
+
+    def get_evaluations(
+        self, candidate_ids: Iterable[str], jd_id: str, model: str, prompt_version: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns the stored evaluations of candidates against a JD by this model and prompt version."""
+        evaluations: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for chunk in _chunks(list(candidate_ids)):
+                for candidate_id, result in self._conn.execute(
+                    "SELECT candidate_id, result FROM evaluations "
+                    f"WHERE jd_id = ? AND model = ? AND prompt_version = ? AND candidate_id IN ({_placeholders(chunk)})",
+                    [jd_id, model, prompt_version, *chunk],
+                ):
+                    evaluations[candidate_id] = json.loads(result)
+        if evaluations:
+            STORED_EVALUATIONS_REUSED.inc(len(evaluations))
+        return evaluations
+
+    def save_evaluation(
+        self, candidate_id: str, jd_id: str, model: str, prompt_version: str, evaluation: Dict[str, Any]
+    ) -> None:
+        """Stores (or replaces) a candidate's evaluation against a JD."""
+        result = {key: value for key, value in evaluation.items() if key not in ("candidate_id", "jd_id")}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations "
+                "(candidate_id, jd_id, model, prompt_version, score, result, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (candidate_id, jd_id, model, prompt_version, int(result.get("score", 0)), json.dumps(result), time.time()),
+            )
+            self._conn.commit()
+
+    def ranking(self, jd_id: str, pool: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Returns the best stored evaluations against a JD, highest score first,
+        with each candidate's latest evaluation only.
+        """
+        query = (
+            "SELECT e.candidate_id, c.filename, e.model, e.prompt_version, e.result, MAX(e.created_at) "
+            "FROM evaluations e JOIN candidates c ON c.id = e.candidate_id "
+        )
+        params: List[Any] = []
+        if pool:
+            query += "JOIN pool_members p ON p.candidate_id = e.candidate_id AND p.pool = ? "
+            params.append(pool)
+        query += "WHERE e.jd_id = ? GROUP BY e.candidate_id ORDER BY e.score DESC LIMIT ?"
+        params += [jd_id, limit]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                "candidate_id": candidate_id,
+                "filename": filename,
+                "jd_id": jd_id,
+                "model": model,
+                "prompt_version": prompt_version,
+                **json.loads(result),
+            }
+            for candidate_id, filename, model, prompt_version, result, _ in rows
+        ]
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _chunks(items: List[str]) -> Iterable[List[str]]:
+    """Splits ids into groups small enough for one query."""
+    for start in range(0, len(items), _QUERY_CHUNK):
+        yield items[start:start + _QUERY_CHUNK]
+
+
+def _placeholders(items: List[str]) -> str:
+    """Returns the "?, ?, ..." list for an IN clause."""
+    return ", ".join("?" * len(items))
@@ -0,0 +1,233 @@
+import re
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+from src.utils.tokens import estimate_tokens
+
+logger = get_logger(__name__)
+
+COMPACTION_TOKENS = REGISTRY.counter(
+    "resume_compaction_tokens",
+    "Estimated resume tokens before and after compaction.",
+    ("stage",),
+)
+
+# Section headings, by keyword, in the order sections are kept when a resume is
+# over budget; unrecognised sections rank between these and LOW_PRIORITY_SECTIONS
+SECTION_PRIORITIES = (
+    ("skill", "competenc", "technolog", "tech stack", "expertise", "programming"),
+    ("experience", "employment", "work history", "career", "professional background"),
+    ("summary", "profile", "objective", "about"),
+    ("project",),
+    ("education", "qualification", "certif", "degree", "training"),
+    ("achievement", "award", "publication", "accomplishment"),
+)
+LOW_PRIORITY_SECTIONS = (
+    "hobbies", "hobby", "interests", "references", "referees", "personal", "declaration",
+    "volunteer", "extracurricular", "languages",
+)
+
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_EMPHASIS = re.compile(r"(\*\*|__|\*|`)")
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?$")
+_RULE = re.compile(r"^([-*_=~.·•])\1{2,}$")
+_PAGE_MARKER = re.compile(r"^(page\s*)?\d+\s*(of|/)\s*\d+$|^page\s*\d+$", re.IGNORECASE)
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_PHONE = re.compile(r"(?<!\w)\+?\d[\d\s().-]{7,}\d(?!\w)")
+# Phone numbers have at least this many digits; fewer is more likely a date range
+_MIN_PHONE_DIGITS = 9
+_URL = re.compile(r"(https?://|www\.)\S+", re.IGNORECASE)
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200b]+")
+_HEADING = re.compile(r"^#{1,6}\s*(.+?)\s*#*$")
+
+# Lines shorter than this are never dropped as duplicates (bullets like "- Go")
+_MIN_DEDUPE_LENGTH = 4
+# Non-blank lines at the top and bottom of each page treated as header or footer
+_EDGE_LINES = 2
+# A header or footer line must recur on at least this many pages to be dropped
+_MIN_EDGE_REPEATS = 2
+
+# Appended where a section was cut to fit the budget
+TRUNCATION_MARKER = "[...]"
+
+
+class ResumeCompactor:
+    """
+    Shrinks converted resume Markdown before it is sent to the LLM.
+
+    Compaction normalizes whitespace, strips Markdown and table scaffolding,
+    drops page headers and footers (lines repeated at the top or bottom of
+    several pages), page markers and contact details, then, if the resume still exceeds ``token_budget``, keeps its
+    sections by priority: skills and experience before education, and
+    hobbies or references last.
+    """
+
+    def __init__(self, token_budget: int = 2000):
+        """Initializes the ResumeCompactor; a ``token_budget`` of 0 disables truncation."""
+        self.token_budget = token_budget
+
+    def compact(self, text: str) -> Tuple[str, Dict[str, int]]:
+        """Returns the compacted text and its estimated token counts before and after."""
+        original_tokens = estimate_tokens(text)
+        lines = self._clean_lines(text)
+        compacted = "\n".join(lines)
+        if self.token_budget and estimate_tokens(compacted) > self.token_budget:
+            compacted = self._truncate_by_priority(lines)
+
+        stats = {"original_tokens": original_tokens, "compacted_tokens": estimate_tokens(compacted)}
+        COMPACTION_TOKENS.inc(stats["original_tokens"], stage="original")
+        COMPACTION_TOKENS.inc(stats["compacted_tokens"], stage="compacted")
+        logger.debug(
+            f"Compacted resume from {stats['original_tokens']} to {stats['compacted_tokens']} tokens"
+        )
+        return compacted, stats
+
+    def _clean_lines(self, text: str) -> List[str]:
+        """Removes formatting noise, contact details and repeated page headers and footers."""
+        pages = self._clean_pages(_HTML_COMMENT.sub("", text))
+
+        # Lines recurring at the top or bottom of several pages are running headers and footers
+        edge_counts: Dict[str, int] = Counter()
+        for page in pages:
+            edges = _edge_indices(page)
+            edge_counts.update({page[index].lower() for index in edges})
+        repeated = {
+            key for key, count in edge_counts.items()
+            if count >= _MIN_EDGE_REPEATS and len(key) >= _MIN_DEDUPE_LENGTH
+        }
+
+        seen = set()
+        lines: List[str] = []
+        for page in pages:
+            edges = _edge_indices(page)
+            for index, line in enumerate(page):
+                if not line:
+                    if lines and lines[-1]:
+                        lines.append("")
+                    continue
+                key = line.lower()
+                if key in repeated and index in edges:
+                    # Keep the first copy, which on the first page is usually the candidate's name
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                lines.append(line)
+
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    def _clean_pages(self, text: str) -> List[List[str]]:
+        """
+        Normalizes each line and groups them by page, splitting on form feeds
+        and page markers; lines without text become '' paragraph breaks.
+        """
+        pages: List[List[str]] = [[]]
+        for page_text in text.split("\f"):
+            if pages[-1]:
+                pages.append([])
+            for raw_line in page_text.splitlines():
+                line = raw_line.strip()
+                if _PAGE_MARKER.match(line):
+                    if pages[-1]:
+                        pages.append([])
+                    continue
+                if _TABLE_SEPARATOR.match(line) or _RULE.match(line):
+                    continue
+
+                line = _IMAGE.sub("", line)
+                line = _LINK.sub(r"\1", line)
+                line = _EMPHASIS.sub("", line)
+                line = _URL.sub("", line)
+                line = _EMAIL.sub("", line)
+                line = _PHONE.sub(_strip_phone, line)
+                if line.startswith("|"):
+                    # Flatten table rows to their non-empty cells
+                    line = " | ".join(cell.strip() for cell in line.strip("|").split("|") if cell.strip())
+                line = _SPACES.sub(" ", line).strip(" |,;")
+                pages[-1].append(line if any(char.isalnum() for char in line) else "")
+        return pages
+
+    def _truncate_by_priority(self, lines: List[str]) -> str:
+        """Keeps whole sections by priority, cutting the first one that does not fit."""
+        sections = _split_sections(lines)
+        # The first section holds the candidate's name and headline, so it always comes first
+        order = sorted(
+            range(len(sections)),
+            key=lambda index: (-1 if index == 0 else _section_priority(sections[index][0]), index),
+        )
+
+        remaining = self.token_budget
+        kept: Dict[int, List[str]] = {}
+        for index in order:
+            if remaining <= 0:
+                break
+            heading, body = sections[index]
+            section_lines = ([heading] if heading else []) + body
+            section_tokens = estimate_tokens("\n".join(section_lines)) + 1
+            if section_tokens <= remaining:
+                kept[index] = section_lines
+                remaining -= section_tokens
+                continue
+
+            partial: List[str] = []
+            for line in section_lines:
+                line_tokens = estimate_tokens(line) + 1
+                if line_tokens > remaining:
+                    break
+                partial.append(line)
+                remaining -= line_tokens
+            if partial:
+                kept[index] = partial + [TRUNCATION_MARKER]
+            remaining = 0
+
+        return "\n".join("\n".join(kept[index]) for index in sorted(kept)).strip()
+
+
+def _strip_phone(match: re.Match) -> str:
+    """Removes a phone number match, keeping digit runs such as "2015 - 2019"."""
+    text = match.group(0)
+    return "" if sum(char.isdigit() for char in text) >= _MIN_PHONE_DIGITS else text
+
+
+def _edge_indices(page: List[str]) -> Set[int]:
+    """Returns the indices of the first and last ``_EDGE_LINES`` non-blank lines of a page."""
+    content = [index for index, line in enumerate(page) if line]
+    return set(content[:_EDGE_LINES] + content[-_EDGE_LINES:])
+
+
+def _heading_text(line: str) -> str:
+    """Returns the heading text if ``line`` looks like a section heading, else ''."""
+    match = _HEADING.match(line)
+    if match:
+        return match.group(1)
+    words = line.rstrip(":").split()
+    if 0 < len(words) <= 4 and (line.endswith(":") or line.isupper()):
+        return line.rstrip(":")
+    return ""
+
+
+def _split_sections(lines: List[str]) -> List[Tuple[str, List[str]]]:
+    """Splits lines into ``(heading, body)`` sections; the preamble has no heading."""
+    sections: List[Tuple[str, List[str]]] = [("", [])]
+    for line in lines:
+        if _heading_text(line):
+            sections.append((line, []))
+        else:
+            sections[-1][1].append(line)
+    return [section for section in sections if section[0] or section[1]]
+
+
+def _section_priority(heading: str) -> int:
+    """Ranks a section by its heading; lower values are kept first."""
+    title = _heading_text(heading).lower()
+    for priority, keywords in enumerate(SECTION_PRIORITIES):
+        if any(keyword in title for keyword in keywords):
+            return priority
+    if any(keyword in title for keyword in LOW_PRIORITY_SECTIONS):
+        return len(SECTION_PRIORITIES) + 1
+    return len(SECTION_PRIORITIES)
@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.utils.cache import LRUCache
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConversionCache:
+    """
+    Content-addressed cache of document-to-Markdown conversions.
+
+    Entries are keyed by a SHA-256 of the file bytes, the file extension and
+    the converter version. A small in-memory LRU sits in front of a SQLite
+    store of zlib-compressed Markdown, which is trimmed to ``max_disk_bytes``
+    by evicting the least recently used rows. The store's size is kept as a
+    running total, so a write only touches the rows it adds or evicts.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        converter_version: str,
+        memory_items: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        """Initializes the ConversionCache and creates the SQLite store if needed."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.converter_version = converter_version
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = LRUCache(max_items=memory_items)
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS conversions ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_conversions_last_access ON conversions (last_access)"
+        )
+        self._conn.commit()
+        self._disk_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM conversions").fetchone()[0]
+
+    def key_for_digest(self, digest: str, extension: str = "") -> str:
+        """Builds the cache key from a SHA-256 hex digest computed while streaming the file."""
+        return f"{digest}:{extension.lower()}:{self.converter_version}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached Markdown for ``key``, or ``None`` on a miss."""
+        text = self.memory.get(key)
+        if text is not None:
+            return text
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE conversions SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.disk_hits += 1
+
+        text = zlib.decompress(row[0]).decode("utf-8")
+        self.memory.set(key, text)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        """Stores the Markdown for ``key`` in memory and on disk."""
+        self.memory.set(key, text)
+        data = zlib.compress(text.encode("utf-8"))
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM conversions WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversions (key, data, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._disk_bytes += len(data) - (replaced[0] if replaced else 0)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self, batch_size: int = 64) -> None:
+        """Deletes the least recently used rows, a batch at a time, until the store fits its size budget."""
+        evicted = 0
+        while self._disk_bytes > self.max_disk_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM conversions ORDER BY last_access ASC LIMIT ?", (batch_size,)
+            ).fetchall()
+            if not rows:
+                self._disk_bytes = 0
+                break
+            for key, size in rows:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    break
+                self._conn.execute("DELETE FROM conversions WHERE key = ?", (key,))
+                self._disk_bytes -= size
+                evicted += 1
+        logger.info(f"Evicted {evicted} cached conversions to stay under {self.max_disk_bytes} bytes")
+
+    def stats(self) -> Dict[str, int]:
+        """Returns hit and miss counters for both tiers."""
+        return {
+            "memory_hits": self.memory.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self.memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+        with self._lock:
+            self._conn.close()
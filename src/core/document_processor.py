@@ -1,38 +1,371 @@
+import asyncio
 import os
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from concurrent.futures.process import BrokenProcessPool
+from importlib.metadata import version
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Optional
 from fastapi import UploadFile
-from markitdown import MarkItDown
+from src.core.conversion_cache import ConversionCache
+from src.core.ingestion import IngestedFile, ingest_upload
+from src.utils.cache import SingleFlight
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from markitdown import MarkItDown
+
+logger = get_logger(__name__)
+
+# File types reported as their own metric label; anything else is grouped as "other"
+_METRIC_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".md", ".html", ".rtf", ".odt", ".pptx", ".xlsx"}
+CONVERSION_SECONDS = REGISTRY.histogram(
+    "document_conversion_duration_seconds",
+    "Time to convert a document to Markdown, excluding cache hits.",
+    ("extension",),
+)
+CONVERSION_ERRORS = REGISTRY.counter(
+    "document_conversion_errors", "Document conversions that failed.", ("extension", "error")
+)
+CONVERSION_CACHE_HITS = REGISTRY.counter(
+    "document_conversion_cache_hits", "Documents served from the conversion cache.", ("extension",)
+)
+
+# Part of every conversion cache key, so upgrading MarkItDown invalidates old
+# entries. Read from the package metadata so MarkItDown isn't imported at startup.
+CONVERTER_VERSION = f"markitdown-{version('markitdown')}"
+
+# Extra time the event loop waits for a worker past its own alarm before giving up
+_TIMEOUT_GRACE_SECONDS = 5
+
+# MarkItDown instance owned by a pool worker process
+_worker_markitdown: Optional["MarkItDown"] = None
+
+
+def _extension_label(extension: str) -> str:
+    """Maps a file extension to a bounded set of metric label values."""
+    return extension if extension in _METRIC_EXTENSIONS else "other"
+
+
+def _count_pdf_pages(data: bytes, limit: int) -> int:
+    """Counts PDF pages, stopping once ``limit`` is exceeded."""
+    try:
+        from pdfminer.pdfpage import PDFPage
+    except ImportError:
+        return 0
+    return sum(1 for _ in PDFPage.get_pages(BytesIO(data), maxpages=limit + 1))
+
+
+def _new_markitdown() -> "MarkItDown":
+    """Imports MarkItDown and its converters and creates an instance."""
+    from markitdown import MarkItDown
+
+    return MarkItDown()
+
+
+def _convert_bytes(
+    md: "MarkItDown", data: bytes, filename: str, extension: str, use_path: bool
+) -> str:
+    """Converts file bytes to Markdown, via a unique temp file when ``use_path`` is set."""
+    if not use_path:
+        from markitdown import StreamInfo
+
+        stream_info = StreamInfo(extension=extension or None, filename=filename)
+        return md.convert_stream(BytesIO(data), stream_info=stream_info).text_content
+
+    fd, temp_file_path = tempfile.mkstemp(suffix=extension)
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            buffer.write(data)
+        return md.convert(temp_file_path).text_content
+    finally:
+        # Clean up the temporary file
+        os.remove(temp_file_path)
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError("Document conversion timed out.")
+
+
+def _convert_in_worker(
+    data: bytes,
+    filename: str,
+    extension: str,
+    use_path: bool,
+    max_pages: int,
+    timeout_seconds: float,
+) -> str:
+    """
+    Entry point run inside a pool worker process.
+
+    Where SIGALRM is available the conversion is interrupted after
+    ``timeout_seconds``, so a pathological document frees its worker.
+    """
+    global _worker_markitdown
+    if _worker_markitdown is None:
+        _worker_markitdown = _new_markitdown()
+
+    use_alarm = hasattr(signal, "SIGALRM") and timeout_seconds > 0
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+    try:
+        if max_pages and extension == ".pdf" and _count_pdf_pages(data, max_pages) > max_pages:
+            raise ValueError(f"PDF has more than {max_pages} pages.")
+        return _convert_bytes(_worker_markitdown, data, filename, extension, use_path)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
 
 class DocumentProcessor:
     """
-    Processes uploaded documents by saving them temporarily, converting to
-    Markdown, and then cleaning up the temporary file.
+    Processes uploaded documents by converting their bytes to Markdown in memory.
+
+    Uploads are first streamed in chunks to enforce the size cap and hash
+    their content (``ingestion.py``), so cached files are never loaded into
+    memory. The bytes are then handed straight to MarkItDown with the file
+    extension as a hint, so concurrent uploads never share a file on disk.
+    Extensions listed in ``path_extensions`` are instead written to a uniquely
+    named temporary file, for converters that need a real path.
+
+    ``aprocess`` hands the bytes to a pool of ``max_workers`` processes so
+    CPU-bound parsing runs off the event loop and scales with cores; with
+    ``max_workers=0`` it converts in a thread instead. Files larger than
+    ``max_bytes`` or PDFs longer than ``max_pages`` are rejected. In the pool,
+    each conversion is interrupted after ``timeout_seconds`` of running time
+    (queue time excluded). A thread cannot be interrupted, so with
+    ``max_workers=0`` the timeout only stops waiting: the request fails, but
+    the conversion runs to completion in its thread.
+
+    When a ConversionCache is supplied, files whose bytes were converted
+    before are served from the cache without running MarkItDown.
+
+    MarkItDown and its converter dependencies are only imported by the
+    first conversion that misses the cache, which keeps them off startup.
     """
-    def __init__(self):
-        self.upload_dir = Path("data/uploads")
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        cache: Optional[ConversionCache] = None,
+        path_extensions: Iterable[str] = (),
+        max_workers: int = 0,
+        timeout_seconds: float = 60,
+        max_bytes: int = 20 * 1024 * 1024,
+        max_pages: int = 50,
+    ):
+        self.cache = cache
+        self.path_extensions = {ext.lower() for ext in path_extensions}
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self._markitdown: Optional["MarkItDown"] = None
+        self._markitdown_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Submissions beyond the worker count wait here, so queue time doesn't count toward the timeout
+        self._pool_slots: Optional[asyncio.Semaphore] = None
+        self._pool_conversions = 0
+        self._retired = False
+        self._single_flight = SingleFlight()
+
+    @property
+    def markitdown(self) -> "MarkItDown":
+        """The in-process MarkItDown instance, created on first use."""
+        with self._markitdown_lock:
+            if self._markitdown is None:
+                self._markitdown = _new_markitdown()
+            return self._markitdown
 
     def process(self, file: UploadFile) -> str:
         """
-        Saves an uploaded file, converts it to Markdown, and deletes the temp file.
+        Converts an uploaded file to Markdown inline, using the conversion cache if enabled.
         """
-        # Ensure filename is secure
-        if not file.filename:
-            raise ValueError("File has no name.")
-        
-        temp_file_path = self.upload_dir / Path(file.filename).name
+        upload = ingest_upload(file, self.max_bytes)
+        filename, extension = upload.filename, upload.extension
+
+        cache_key, cached = self._lookup(upload)
+        if cached is not None:
+            return cached
 
+        data = upload.read()
+        started = time.perf_counter()
         try:
-            # Save the uploaded file to a temporary location
-            with open(temp_file_path, "wb") as buffer:
-                buffer.write(file.file.read())
+            if self.max_pages and extension == ".pdf" and _count_pdf_pages(data, self.max_pages) > self.max_pages:
+                raise ValueError(f"PDF has more than {self.max_pages} pages.")
+            text = self._convert_inline(data, filename, extension, extension in self.path_extensions)
+        except Exception as e:
+            self._record_conversion(extension, started, e)
+            raise
+        self._record_conversion(extension, started)
+
+        self._store(cache_key, text)
+        return text
+
+    async def aprocess(self, file: UploadFile) -> str:
+        """
+        Converts an uploaded file to Markdown without blocking the event loop.
+
+        Identical files converting at the same time share one conversion.
+        """
+        upload = await asyncio.to_thread(ingest_upload, file, self.max_bytes)
+        return await self.aprocess_ingested(upload)
+
+    async def aprocess_ingested(self, upload: IngestedFile) -> str:
+        """Converts an upload that was already size-checked and hashed (see ``aprocess``)."""
+        cache_key, cached = await asyncio.to_thread(self._lookup, upload)
+        if cached is not None:
+            return cached
+        return await self._single_flight.run(
+            (upload.sha256, upload.extension), lambda: self._aconvert(upload, cache_key)
+        )
+
+    async def _aconvert(self, upload: IngestedFile, cache_key: Optional[str]) -> str:
+        """Converts an ingested upload off the event loop and caches the result."""
+        filename, extension = upload.filename, upload.extension
+        data = await asyncio.to_thread(upload.read)
+        use_path = extension in self.path_extensions
+        started = time.perf_counter()
+        try:
+            if self.max_workers > 0:
+                text = await self._convert_in_pool(data, filename, extension, use_path)
+            else:
+                text = await asyncio.wait_for(
+                    asyncio.to_thread(self._convert_inline, data, filename, extension, use_path),
+                    timeout=self.timeout_seconds,
+                )
+        except asyncio.TimeoutError:
+            error = TimeoutError(f"Conversion of {filename} timed out.")
+            self._record_conversion(extension, started, error)
+            raise error
+        except Exception as e:
+            self._record_conversion(extension, started, e)
+            raise
+        self._record_conversion(extension, started)
+
+        self._store(cache_key, text)
+        return text
+
+    def _convert_inline(self, data: bytes, filename: str, extension: str, use_path: bool) -> str:
+        """Converts bytes in the calling thread, importing MarkItDown there on first use."""
+        return _convert_bytes(self.markitdown, data, filename, extension, use_path)
+
+    def _lookup(self, upload: IngestedFile) -> tuple:
+        """Returns the cache key and any cached Markdown for the upload's content hash."""
+        if self.cache is None:
+            return None, None
+        cache_key = self.cache.key_for_digest(upload.sha256, upload.extension)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            CONVERSION_CACHE_HITS.inc(extension=_extension_label(upload.extension))
+        return cache_key, cached
+
+    @staticmethod
+    def _record_conversion(extension: str, started: float, error: Optional[Exception] = None) -> None:
+        """Records the duration of a conversion and whether it failed."""
+        label = _extension_label(extension)
+        CONVERSION_SECONDS.observe(time.perf_counter() - started, extension=label)
+        if error is not None:
+            CONVERSION_ERRORS.inc(extension=label, error=type(error).__name__)
+
+    def _store(self, cache_key: Optional[str], text: str) -> None:
+        """Stores a fresh conversion in the cache if caching is enabled."""
+        if cache_key is not None:
+            self.cache.set(cache_key, text)
 
-            # Process the file from its path
-            md = MarkItDown()
-            result = md.convert(str(temp_file_path))
-            return result.text_content
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Returns the worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                logger.info(f"Started document conversion pool with {self.max_workers} workers")
+            return self._executor
 
+    def _get_pool_slots(self) -> asyncio.Semaphore:
+        """
+        Returns the semaphore limiting pool submissions, creating it on first use.
+
+        It is created from the event loop rather than in ``__init__``, since a
+        reload builds the processor in a worker thread, where Python 3.9 can't
+        create one.
+        """
+        if self._pool_slots is None:
+            self._pool_slots = asyncio.Semaphore(max(1, self.max_workers))
+        return self._pool_slots
+
+    async def _convert_in_pool(
+        self, data: bytes, filename: str, extension: str, use_path: bool
+    ) -> str:
+        """
+        Runs a conversion in the process pool, replacing the pool if a worker died.
+
+        At most ``max_workers`` conversions are submitted at once, so the
+        timeout starts when a worker picks the document up; the worker's own
+        alarm enforces it, and the grace period only catches a stuck worker.
+        """
+        async with self._get_pool_slots(), self._pool_in_use():
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(
+                        executor,
+                        _convert_in_worker,
+                        data,
+                        filename,
+                        extension,
+                        use_path,
+                        self.max_pages,
+                        self.timeout_seconds,
+                    ),
+                    timeout=self.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+                )
+            except BrokenProcessPool:
+                logger.error(f"Conversion worker crashed while processing {filename}; restarting pool")
+                with self._executor_lock:
+                    if self._executor is executor:
+                        self._executor = None
+                executor.shutdown(wait=False)
+                raise RuntimeError("Document conversion worker crashed.")
+
+    @asynccontextmanager
+    async def _pool_in_use(self) -> AsyncIterator[None]:
+        """Counts a pool conversion in flight; a retired processor stops its pool after the last one."""
+        with self._executor_lock:
+            self._pool_conversions += 1
+        try:
+            yield
         finally:
-            # Clean up the temporary file
-            if temp_file_path.exists():
-                os.remove(temp_file_path)
+            with self._executor_lock:
+                self._pool_conversions -= 1
+                idle = self._retired and self._pool_conversions == 0
+            if idle:
+                self.shutdown()
+
+    def retire(self) -> None:
+        """
+        Stops the worker pool once the conversions in flight have finished.
+
+        Used when a reload replaces this processor while requests still hold
+        it; a conversion started afterwards gets a pool that is stopped again
+        as soon as it is idle.
+        """
+        with self._executor_lock:
+            self._retired = True
+            idle = self._pool_conversions == 0
+        if idle:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stops the worker pool, letting queued conversions finish."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,68 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from src.llm.base import LLMClient
+from src.prompts.manager import PromptManager
+from src.utils.cache import LRUCache, SingleFlight
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Email templates and the LLM client method that generates each of them
+EMAIL_TEMPLATES = {
+    "interview": ("interview_email", "agenerate_interview_email"),
+    "rejection": ("rejection_email", "agenerate_rejection_email"),
+}
+
+# Templates addressed to a generic candidate, so one email serves every candidate of a role
+ROLE_ONLY_TEMPLATES = {"rejection"}
+PLACEHOLDER_CANDIDATE_NAME = "Candidate"
+
+
+class EmailGenerator:
+    """
+    Generates candidate emails on demand.
+
+    Emails are cached per (template version, role, candidate name) and
+    identical requests in flight share one LLM call. Role-only templates
+    ignore the candidate name, so they are generated once per role.
+    """
+
+    def __init__(self, llm_client: LLMClient, prompt_manager: PromptManager, cache_size: int = 512):
+        """Initializes the EmailGenerator."""
+        self.llm_client = llm_client
+        self.prompt_manager = prompt_manager
+        self.cache = LRUCache(max_items=cache_size)
+        self.single_flight = SingleFlight()
+
+    async def generate(self, kind: str, role: str, candidate_name: Optional[str] = None) -> str:
+        """Returns the email of the given kind, generating it only on a cache miss."""
+        if kind not in EMAIL_TEMPLATES:
+            raise ValueError(f"Unknown email type '{kind}'.")
+        prompt_name, method_name = EMAIL_TEMPLATES[kind]
+        if kind in ROLE_ONLY_TEMPLATES or not candidate_name:
+            candidate_name = PLACEHOLDER_CANDIDATE_NAME
+
+        key = (prompt_name, self.prompt_manager.get_version(prompt_name), role, candidate_name)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        async def compose() -> str:
+            email = await getattr(self.llm_client, method_name)(candidate_name=candidate_name, role=role)
+            if email.startswith("Error:"):
+                logger.error(f"Failed to generate {kind} email for role '{role}'")
+            else:
+                self.cache.set(key, email)
+            return email
+
+        return await self.single_flight.run(key, compose)
+
+    async def generate_many(
+        self, kinds: List[str], role: str, candidate_name: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Generates several kinds of email for a candidate concurrently."""
+        emails = await asyncio.gather(
+            *(self.generate(kind, role, candidate_name) for kind in kinds)
+        )
+        return dict(zip(kinds, emails))
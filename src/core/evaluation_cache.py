@@ -0,0 +1,61 @@
+import copy
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+from src.utils.cache import LRUCache, SingleFlight
+
+
+def _hash_text(text: str) -> str:
+    """Returns a SHA-256 of the text with whitespace runs collapsed."""
+    normalized = " ".join(text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Caches resume evaluations and de-duplicates identical in-flight calls.
+
+    Entries are keyed by the normalized JD hash, the resume text hash, the
+    provider, the model and the prompt template version, so any change to
+    one of those produces a fresh evaluation. Errors are never cached.
+    """
+
+    def __init__(self, max_items: int = 2048, ttl_seconds: Optional[float] = 86400):
+        """Initializes the EvaluationCache."""
+        self.results = LRUCache(max_items=max_items, ttl_seconds=ttl_seconds)
+        self.single_flight = SingleFlight()
+
+    @staticmethod
+    def make_key(
+        jd_text: str, resume_text: str, provider: str, model: str, prompt_version: str
+    ) -> tuple:
+        """Builds the cache key for one evaluation."""
+        return (_hash_text(jd_text), _hash_text(resume_text), provider, model, prompt_version)
+
+    async def get_or_evaluate(self, key: tuple, evaluate: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Returns the cached evaluation for ``key`` or runs ``evaluate`` once for it.
+
+        Callers always receive their own copy, since results are annotated
+        per request (e.g. with the uploaded filename).
+        """
+        cached = self.results.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        async def evaluate_and_store() -> dict:
+            evaluation = await evaluate()
+            if "error" not in evaluation:
+                self.results.set(key, evaluation)
+            return evaluation
+
+        return copy.deepcopy(await self.single_flight.run(key, evaluate_and_store))
+
+    def stats(self) -> dict:
+        """Returns hit, miss and coalescing counters."""
+        return {
+            "hits": self.results.hits,
+            "misses": self.results.misses,
+            "coalesced": self.single_flight.coalesced,
+            "entries": len(self.results),
+        }
@@ -1,10 +1,29 @@
-from typing import List, Dict, Any
+import asyncio
+from typing import AsyncIterator, Awaitable, Iterable, List, Dict, Any, Optional, Tuple, Union
 from fastapi import UploadFile
+from src.core.JobDescriptionGenerator import JobDescriptionGenerator
+from src.core.candidate_store import CandidateStore
+from src.core.compaction import ResumeCompactor
 from src.core.document_processor import DocumentProcessor
+from src.core.evaluation_cache import EvaluationCache
+from src.core.ingestion import ingest_upload, is_archive, iter_archive_entries
+from src.core.prescreen import LexicalPrescreener
 from src.llm.base import LLMClient
 from src.prompts.manager import PromptManager
+from src.utils.metrics import REGISTRY
+from src.utils.tokens import estimate_tokens
 from io import BytesIO
 
+CASCADE_CANDIDATES = REGISTRY.counter(
+    "evaluation_cascade_candidates",
+    "Candidates scored in cascade mode, by whether the main model re-scored them.",
+    ("tier",),
+)
+
+# Approximate tokens taken by the batch prompt's instructions and per-resume markers
+BATCH_PROMPT_OVERHEAD_TOKENS = 400
+BATCH_RESUME_OVERHEAD_TOKENS = 16
+
 class EvaluationEngine:
     """Orchestrates the evaluation of candidates."""
 
@@ -13,13 +32,70 @@ class EvaluationEngine:
         llm_client: LLMClient,
         document_processor: DocumentProcessor,
         prompt_manager: PromptManager,
+        max_concurrency: int = 5,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        batch_token_budget: int = 0,
+        max_batch_size: int = 10,
+        jd_generator: Optional[JobDescriptionGenerator] = None,
+        digest_min_tokens: int = 300,
+        prescreener: Optional[LexicalPrescreener] = None,
+        prescreen_min_candidates: int = 50,
+        compactor: Optional[ResumeCompactor] = None,
+        archive_max_entries: int = 1000,
+        candidate_store: Optional[CandidateStore] = None,
+        cascade_client: Optional[LLMClient] = None,
+        cascade_top_k: int = 10,
+        cascade_band: Tuple[int, int] = (45, 70),
     ):
-        """Initializes the EvaluationEngine."""
+        """
+        Initializes the EvaluationEngine.
+
+        A non-zero ``batch_token_budget`` enables batched scoring: resumes are
+        packed, up to ``max_batch_size`` at a time, under one copy of the JD
+        so each request stays within the budget.
+
+        With a ``jd_generator``, JDs of at least ``digest_min_tokens`` are
+        replaced in scoring prompts by their structured digest.
+
+        With a ``prescreener``, pools of at least ``prescreen_min_candidates``
+        resumes are ranked locally first and only the best ones are sent to
+        the LLM.
+
+        With a ``compactor``, converted resumes are stripped of formatting
+        noise and cut to its token budget before any prompt is built.
+
+        ZIP and tar archives among the resume files are read member by member,
+        up to ``archive_max_entries`` resumes each, and every member is
+        evaluated as soon as it is read.
+
+        With a ``candidate_store``, converted resumes can be kept and stored
+        pools evaluated against new JDs by reference (``iter_store_candidates``
+        and ``iter_stored_evaluations``).
+
+        With a ``cascade_client`` (a cheaper, faster model), every candidate
+        is first scored by it; only the ``cascade_top_k`` best and those whose
+        score falls inside ``cascade_band`` are re-scored by ``llm_client``,
+        whose score then replaces the screening score in the ranking.
+        """
         self.llm_client = llm_client
         self.document_processor = document_processor
         self.prompt_manager = prompt_manager
+        self.max_concurrency = max(1, max_concurrency)
+        self.evaluation_cache = evaluation_cache
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max(1, max_batch_size)
+        self.jd_generator = jd_generator
+        self.digest_min_tokens = digest_min_tokens
+        self.prescreener = prescreener
+        self.prescreen_min_candidates = prescreen_min_candidates
+        self.compactor = compactor
+        self.archive_max_entries = archive_max_entries
+        self.candidate_store = candidate_store
+        self.cascade_client = cascade_client
+        self.cascade_top_k = cascade_top_k
+        self.cascade_band = cascade_band
 
-    def _get_jd_text(
+    async def resolve_jd_text(
         self,
         jd_file: UploadFile,
         jd_text: str,
@@ -27,38 +103,696 @@ class EvaluationEngine:
     ) -> str:
         """Determines the source of the job description and returns its text."""
         if jd_file and jd_file.filename:
-            return self.document_processor.process(jd_file)
+            return await self.document_processor.aprocess(jd_file)
         if jd_text:
             return jd_text
         if jd_generation_details and jd_generation_details.get("job_title"):
-            return self.llm_client.generate_jd(jd_generation_details)
+            return await self.llm_client.agenerate_jd(jd_generation_details)
         raise ValueError("No valid job description source provided.")
 
-    async def evaluate_candidates(
+    async def _get_scoring_jd(self, jd_text_content: str) -> Tuple[str, Optional[Dict]]:
+        """
+        Returns the JD used in scoring prompts (the digest for long JDs, else
+        the raw text) together with the digest, if one was produced.
+        """
+        if self.jd_generator is None or estimate_tokens(jd_text_content) < self.digest_min_tokens:
+            return jd_text_content, None
+
+        digest = await self.jd_generator.digest(jd_text_content)
+        if digest is None:
+            return jd_text_content, None
+        rendered = self.jd_generator.render(digest)
+        return (rendered if len(rendered) < len(jd_text_content) else jd_text_content), digest
+
+    async def _evaluate_resume(
+        self,
+        resume_file: UploadFile,
+        jd_text_content: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict:
+        """Converts and scores a single resume, isolating any failure to its own result."""
+        async with semaphore:
+            try:
+                resume_text = await self._resume_text(resume_file)
+
+                evaluation = await self._score_resume(jd_text_content, resume_text)
+                evaluation["filename"] = resume_file.filename
+                return evaluation
+            except Exception as e:
+                return {"filename": resume_file.filename, "error": str(e)}
+
+    async def _resume_text(self, resume_file: UploadFile) -> str:
+        """Converts a resume to Markdown and compacts it if a compactor is configured."""
+        resume_text = await self.document_processor.aprocess(resume_file)
+        if self.compactor is not None:
+            resume_text, _ = self.compactor.compact(resume_text)
+        return resume_text
+
+    def _cache_key(
+        self, jd_text_content: str, resume_text: str, prompt_name: str, client: Optional[LLMClient] = None
+    ) -> tuple:
+        """Builds the evaluation cache key for a client (the main one by default) and prompt."""
+        client = client or self.llm_client
+        return self.evaluation_cache.make_key(
+            jd_text_content,
+            resume_text,
+            getattr(client, "provider", type(client).__name__),
+            getattr(client, "model", ""),
+            self.prompt_manager.get_version(prompt_name),
+        )
+
+    async def _score_resume(
+        self, jd_text_content: str, resume_text: str, client: Optional[LLMClient] = None
+    ) -> dict:
+        """Scores resume text with the LLM, reusing cached or in-flight evaluations."""
+        client = client or self.llm_client
+        if self.evaluation_cache is None:
+            return await client.aevaluate_resume(jd_text_content, resume_text)
+
+        key = self._cache_key(jd_text_content, resume_text, "resume_evaluation", client)
+        return await self.evaluation_cache.get_or_evaluate(
+            key, lambda: client.aevaluate_resume(jd_text_content, resume_text)
+        )
+
+    async def _convert_resume(
+        self, resume_file: UploadFile, semaphore: asyncio.Semaphore
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Converts a resume, returning its text or the conversion error."""
+        async with semaphore:
+            try:
+                return await self._resume_text(resume_file), None
+            except Exception as e:
+                return None, str(e)
+
+    async def _score_one(
+        self,
+        jd_text_content: str,
+        resume_text: str,
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> dict:
+        """Scores one converted resume, isolating any failure to its own result."""
+        async with semaphore:
+            try:
+                return await self._score_resume(jd_text_content, resume_text, client)
+            except Exception as e:
+                return {"error": str(e)}
+
+    def _plan_batches(self, jd_text_content: str, resumes: Dict[str, str]) -> List[Dict[str, str]]:
+        """Packs resumes into batches that fit the token budget and size limit."""
+        base_tokens = estimate_tokens(jd_text_content) + BATCH_PROMPT_OVERHEAD_TOKENS
+        batches, current, current_tokens = [], {}, base_tokens
+        for resume_id, resume_text in resumes.items():
+            resume_tokens = estimate_tokens(resume_text) + BATCH_RESUME_OVERHEAD_TOKENS
+            if current and (
+                current_tokens + resume_tokens > self.batch_token_budget
+                or len(current) >= self.max_batch_size
+            ):
+                batches.append(current)
+                current, current_tokens = {}, base_tokens
+            current[resume_id] = resume_text
+            current_tokens += resume_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _score_batch(
+        self,
+        jd_text_content: str,
+        batch: Dict[str, str],
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> Dict[str, dict]:
+        """
+        Scores a batch in one LLM call, splitting and retrying the resumes
+        whose evaluations came back missing or malformed.
+        """
+        if len(batch) == 1:
+            (resume_id, resume_text), = batch.items()
+            return {resume_id: await self._score_one(jd_text_content, resume_text, semaphore, client)}
+
+        async with semaphore:
+            try:
+                evaluations = await (client or self.llm_client).aevaluate_resume_batch(jd_text_content, batch)
+            except Exception:
+                evaluations = {}
+
+        retry = {resume_id: text for resume_id, text in batch.items() if resume_id not in evaluations}
+        if retry:
+            ids = list(retry)
+            middle = (len(ids) + 1) // 2
+            halves = [
+                {resume_id: retry[resume_id] for resume_id in ids[:middle]},
+                {resume_id: retry[resume_id] for resume_id in ids[middle:]},
+            ]
+            for retried in await asyncio.gather(
+                *(self._score_batch(jd_text_content, half, semaphore, client) for half in halves if half)
+            ):
+                evaluations.update(retried)
+        return evaluations
+
+    def _split_cached(
+        self, jd_text_content: str, resumes: Dict[str, str], client: Optional[LLMClient] = None
+    ) -> Tuple[Dict[str, dict], Dict[str, str]]:
+        """Separates resumes with a cached batch evaluation from those still to score."""
+        cached_results: Dict[str, dict] = {}
+        pending: Dict[str, str] = {}
+        for resume_id, resume_text in resumes.items():
+            if self.evaluation_cache is not None:
+                key = self._cache_key(jd_text_content, resume_text, "resume_batch_evaluation", client)
+                cached = self.evaluation_cache.results.get(key)
+                if cached is not None:
+                    cached_results[resume_id] = dict(cached)
+                    continue
+            pending[resume_id] = resume_text
+        return cached_results, pending
+
+    async def _score_and_cache_batch(
+        self,
+        jd_text_content: str,
+        batch: Dict[str, str],
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> Dict[str, dict]:
+        """Scores one planned batch and caches its successful evaluations."""
+        evaluations = await self._score_batch(jd_text_content, batch, semaphore, client)
+        if self.evaluation_cache is not None:
+            for resume_id, evaluation in evaluations.items():
+                if "error" not in evaluation:
+                    key = self._cache_key(
+                        jd_text_content, batch[resume_id], "resume_batch_evaluation", client
+                    )
+                    self.evaluation_cache.results.set(key, dict(evaluation))
+        return evaluations
+
+    def _prescreen(
+        self, jd_text: str, digest: Optional[Dict], resumes: Dict[str, str]
+    ) -> Tuple[Dict[str, str], Dict[str, dict]]:
+        """
+        Splits resumes into those kept for LLM scoring and the results of those
+        screened out, which carry their local score.
+        """
+        resume_ids = list(resumes)
+        kept_indices, scores = self.prescreener.select(
+            jd_text, [resumes[resume_id] for resume_id in resume_ids], digest
+        )
+        kept_ids = {resume_ids[index] for index in kept_indices}
+
+        kept, screened_out = {}, {}
+        for resume_id, score in zip(resume_ids, scores):
+            if resume_id in kept_ids:
+                kept[resume_id] = resumes[resume_id]
+            else:
+                screened_out[resume_id] = {
+                    "score": int(round(score)),
+                    "missing_skills": [],
+                    "remarks": f"Pre-screened out: local keyword match score {score:.0f}/100.",
+                    "prescreened_out": True,
+                }
+        return kept, screened_out
+
+    def _uses_two_phase(self, candidate_count: int) -> bool:
+        """Whether every resume must be converted before any is scored."""
+        return self.batch_token_budget > 0 or self.cascade_client is not None or (
+            self.prescreener is not None and candidate_count >= self.prescreen_min_candidates
+        )
+
+    async def _iter_two_phase(
+        self,
+        resume_files: List[UploadFile],
+        jd_text: str,
+        scoring_jd: str,
+        digest: Optional[Dict],
+        semaphore: asyncio.Semaphore,
+    ) -> AsyncIterator[Tuple[int, dict]]:
+        """
+        Converts every resume first, optionally pre-screens the pool locally,
+        then scores the remaining resumes individually or in batches, yielding
+        ``(index, result)`` pairs as each call completes.
+        """
+        converted = await asyncio.gather(
+            *(self._convert_resume(resume_file, semaphore) for resume_file in resume_files)
+        )
+        async for indexed_result in self._iter_scoring_phase(
+            dict(enumerate(converted)),
+            [resume_file.filename for resume_file in resume_files],
+            jd_text,
+            scoring_jd,
+            digest,
+            semaphore,
+        ):
+            yield indexed_result
+
+    async def _iter_scoring_phase(
+        self,
+        converted: Dict[int, Tuple[Optional[str], Optional[str]]],
+        filenames: List[str],
+        jd_text: str,
+        scoring_jd: str,
+        digest: Optional[Dict],
+        semaphore: asyncio.Semaphore,
+    ) -> AsyncIterator[Tuple[int, dict]]:
+        """Pre-screens and scores converted resumes, keyed by their index in ``filenames``."""
+        def with_filename(resume_id: str, evaluation: dict) -> Tuple[int, dict]:
+            index = int(resume_id)
+            evaluation["filename"] = filenames[index]
+            return index, evaluation
+
+        resumes: Dict[str, str] = {}
+        for index, (resume_text, error) in converted.items():
+            if error is not None:
+                yield with_filename(str(index), {"error": error})
+            else:
+                resumes[str(index)] = resume_text
+
+        if self.prescreener is not None and len(converted) >= self.prescreen_min_candidates:
+            resumes, screened_out = self._prescreen(jd_text, digest, resumes)
+            for resume_id, evaluation in screened_out.items():
+                yield with_filename(resume_id, evaluation)
+
+        if self.cascade_client is None:
+            async for evaluations in self._iter_llm_scores(scoring_jd, resumes, semaphore):
+                for resume_id, evaluation in evaluations.items():
+                    yield with_filename(resume_id, evaluation)
+            return
+
+        screening: Dict[str, dict] = {}
+        rescoring: List[asyncio.Future] = []
+        rescore_ids: set = set()
+
+        def rescore(resume_ids: Iterable[str]) -> None:
+            selected = {resume_id: resumes[resume_id] for resume_id in resume_ids if resume_id not in rescore_ids}
+            rescore_ids.update(selected)
+            rescoring.extend(
+                asyncio.ensure_future(awaitable) for awaitable in self._plan_scoring(scoring_jd, selected, semaphore)
+            )
+
+        try:
+            # Uncertain and failed screenings are re-scored while the rest are still being screened
+            async for evaluations in self._iter_llm_scores(scoring_jd, resumes, semaphore, self.cascade_client):
+                screening.update(evaluations)
+                rescore(resume_id for resume_id, evaluation in evaluations.items() if self._is_uncertain(evaluation))
+            rescore(self._top_screened(screening))
+
+            CASCADE_CANDIDATES.inc(len(screening) - len(rescore_ids), tier="screening")
+            CASCADE_CANDIDATES.inc(len(rescore_ids), tier="rescored")
+            for resume_id, evaluation in screening.items():
+                if resume_id not in rescore_ids:
+                    yield with_filename(resume_id, {**evaluation, "screening_score": evaluation.get("score")})
+            for next_done in asyncio.as_completed(rescoring):
+                for resume_id, evaluation in (await next_done).items():
+                    yield with_filename(resume_id, _merge_cascade(screening[resume_id], evaluation))
+        finally:
+            for task in rescoring:
+                task.cancel()
+
+    def _plan_scoring(
+        self,
+        scoring_jd: str,
+        resumes: Dict[str, str],
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> List[Awaitable[Dict[str, dict]]]:
+        """
+        Plans the LLM calls that score resumes keyed by id with a client (the
+        main one by default), individually or in batches; each awaitable
+        returns evaluations keyed by id.
+        """
+        if self.batch_token_budget <= 0:
+            return [self._score_keyed(scoring_jd, resume_id, resume_text, semaphore, client)
+                    for resume_id, resume_text in resumes.items()]
+
+        cached_results, resumes = self._split_cached(scoring_jd, resumes, client)
+        scoring = [self._score_and_cache_batch(scoring_jd, batch, semaphore, client)
+                   for batch in self._plan_batches(scoring_jd, resumes)]
+        if cached_results:
+            scoring.append(_resolved(cached_results))
+        return scoring
+
+    async def _iter_llm_scores(
+        self,
+        scoring_jd: str,
+        resumes: Dict[str, str],
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> AsyncIterator[Dict[str, dict]]:
+        """Runs ``_plan_scoring``'s calls, yielding evaluations as each call completes."""
+        async for evaluations in _as_completed(self._plan_scoring(scoring_jd, resumes, semaphore, client)):
+            yield evaluations
+
+    def _is_uncertain(self, evaluation: dict) -> bool:
+        """Whether a screening evaluation failed or scored inside ``cascade_band``."""
+        low, high = self.cascade_band
+        return "error" in evaluation or low <= evaluation.get("score", 0) <= high
+
+    def _top_screened(self, screening: Dict[str, dict]) -> List[str]:
+        """Returns the ids of the ``cascade_top_k`` best screening scores."""
+        scored = [resume_id for resume_id, evaluation in screening.items() if "error" not in evaluation]
+        scored.sort(key=lambda resume_id: screening[resume_id].get("score", 0), reverse=True)
+        return scored[:self.cascade_top_k]
+
+    async def _iter_resume_sources(
+        self, resume_files: List[UploadFile]
+    ) -> AsyncIterator[Union[UploadFile, dict]]:
+        """
+        Yields uploads, expanding archives into one UploadFile per member as it
+        is read; skipped members and unreadable archives are yielded as error results.
+        """
+        for resume_file in resume_files:
+            if not is_archive(resume_file.filename):
+                yield resume_file
+                continue
+
+            entries = iter_archive_entries(
+                resume_file.filename,
+                resume_file.file,
+                self.document_processor.max_bytes,
+                self.archive_max_entries,
+            )
+            while True:
+                try:
+                    entry = await asyncio.to_thread(next, entries, None)
+                except ValueError as e:
+                    yield {"filename": resume_file.filename, "error": str(e)}
+                    break
+                if entry is None:
+                    break
+                if entry.error is not None:
+                    yield {"filename": entry.filename, "error": entry.error}
+                else:
+                    yield UploadFile(BytesIO(entry.data), filename=entry.filename, size=len(entry.data))
+
+    async def _convert_indexed(
+        self, index: int, resume_file: UploadFile, semaphore: asyncio.Semaphore
+    ) -> Tuple[int, Tuple[Optional[str], Optional[str]]]:
+        """Converts one resume and pairs the outcome with its position."""
+        return index, await self._convert_resume(resume_file, semaphore)
+
+    async def _iter_streamed(
+        self,
+        resume_files: List[UploadFile],
+        jd_text: str,
+        scoring_jd: str,
+        digest: Optional[Dict],
+        semaphore: asyncio.Semaphore,
+    ) -> AsyncIterator[Tuple[int, dict]]:
+        """
+        Evaluates resumes as they are read from uploads and archives.
+
+        The next archive member is read only once fewer than
+        ``max_concurrency`` resumes are being processed, so memory holds a
+        bounded number of members however large the archive is. Indices
+        follow the order members are read in. With batching or pre-screening,
+        members are converted as they arrive and scored once all are read.
+        """
+        two_phase = self.batch_token_budget > 0 or self.prescreener is not None or self.cascade_client is not None
+        filenames: List[str] = []
+        converted: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        pending = set()
+        try:
+            async for source in self._iter_resume_sources(resume_files):
+                index = len(filenames)
+                if isinstance(source, dict):
+                    filenames.append(source["filename"])
+                    yield index, source
+                    continue
+
+                filenames.append(source.filename)
+                if two_phase:
+                    pending.add(asyncio.ensure_future(self._convert_indexed(index, source, semaphore)))
+                else:
+                    pending.add(asyncio.ensure_future(
+                        self._evaluate_resume_indexed(index, source, scoring_jd, semaphore)
+                    ))
+
+                done = {task for task in pending if task.done()}
+                while len(pending) - len(done) >= self.max_concurrency:
+                    await asyncio.wait(pending - done, return_when=asyncio.FIRST_COMPLETED)
+                    done = {task for task in pending if task.done()}
+                pending -= done
+                for task in done:
+                    done_index, outcome = task.result()
+                    if two_phase:
+                        converted[done_index] = outcome
+                    else:
+                        yield done_index, outcome
+
+            for next_done in asyncio.as_completed(pending):
+                done_index, outcome = await next_done
+                if two_phase:
+                    converted[done_index] = outcome
+                else:
+                    yield done_index, outcome
+            pending = set()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if two_phase:
+            async for indexed_result in self._iter_scoring_phase(
+                dict(sorted(converted.items())), filenames, jd_text, scoring_jd, digest, semaphore
+            ):
+                yield indexed_result
+
+    async def _score_keyed(
+        self,
+        jd_text_content: str,
+        resume_id: str,
+        resume_text: str,
+        semaphore: asyncio.Semaphore,
+        client: Optional[LLMClient] = None,
+    ) -> Dict[str, dict]:
+        """Scores one converted resume and returns its evaluation keyed by id."""
+        return {resume_id: await self._score_one(jd_text_content, resume_text, semaphore, client)}
+
+    async def _evaluate_resume_indexed(
+        self,
+        index: int,
+        resume_file: UploadFile,
+        jd_text_content: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[int, dict]:
+        """Evaluates one resume and pairs the result with its position in the upload list."""
+        return index, await self._evaluate_resume(resume_file, jd_text_content, semaphore)
+
+    async def iter_indexed_evaluations(
         self,
         resume_files: List[UploadFile],
         jd_file: UploadFile = None,
         jd_text: str = None,
         jd_generation_details: Dict[str, Any] = None,
-    ) -> List[dict]:
-        """Evaluates a list of resumes against a job description."""
+    ) -> AsyncIterator[Tuple[Optional[int], dict]]:
+        """
+        Evaluates resumes against a job description, yielding ``(index, result)``
+        pairs as soon as each is ready, where ``index`` is the resume's position
+        in ``resume_files``. A job description error is yielded with index None.
+        When archives are uploaded, ``index`` counts the expanded resumes in
+        the order they were read instead.
+        """
         try:
-            jd_text_content = self._get_jd_text(
+            jd_text_content = await self.resolve_jd_text(
                 jd_file, jd_text, jd_generation_details
             )
         except ValueError as e:
-            return [{"error": str(e)}]
+            yield None, {"error": str(e)}
+            return
 
-        results = []
-        for resume_file in resume_files:
+        scoring_jd, digest = await self._get_scoring_jd(jd_text_content)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        if any(is_archive(resume_file.filename) for resume_file in resume_files):
+            async for indexed_result in self._iter_streamed(
+                resume_files, jd_text_content, scoring_jd, digest, semaphore
+            ):
+                yield indexed_result
+        elif self._uses_two_phase(len(resume_files)):
+            async for indexed_result in self._iter_two_phase(
+                resume_files, jd_text_content, scoring_jd, digest, semaphore
+            ):
+                yield indexed_result
+        else:
+            async for indexed_result in _as_completed(
+                self._evaluate_resume_indexed(index, resume_file, scoring_jd, semaphore)
+                for index, resume_file in enumerate(resume_files)
+            ):
+                yield indexed_result
+
+    async def iter_evaluations(
+        self,
+        resume_files: List[UploadFile],
+        jd_file: UploadFile = None,
+        jd_text: str = None,
+        jd_generation_details: Dict[str, Any] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Evaluates resumes against a job description, yielding each candidate's
+        result as soon as it is ready rather than in score order.
+        """
+        async for _, result in self.iter_indexed_evaluations(
+            resume_files, jd_file, jd_text, jd_generation_details
+        ):
+            yield result
+
+    async def evaluate_candidates(
+        self,
+        resume_files: List[UploadFile],
+        jd_file: UploadFile = None,
+        jd_text: str = None,
+        jd_generation_details: Dict[str, Any] = None,
+    ) -> List[dict]:
+        """
+        Evaluates a list of resumes against a job description.
+
+        Resumes are converted and scored concurrently, with at most
+        ``max_concurrency`` conversions or LLM calls in flight at any time.
+        Results are returned ranked by score.
+        """
+        results = [
+            result
+            async for result in self.iter_evaluations(
+                resume_files, jd_file, jd_text, jd_generation_details
+            )
+        ]
+
+        results.sort(key=ranking_key, reverse=True)
+        return results
+
+    async def _store_candidate(
+        self, resume_file: UploadFile, pool: Optional[str], semaphore: asyncio.Semaphore
+    ) -> dict:
+        """Converts and stores one resume unless a file with the same bytes is already stored."""
+        async with semaphore:
             try:
-                resume_text = self.document_processor.process(resume_file)
-                
-                evaluation = self.llm_client.evaluate_resume(jd_text_content, resume_text)
-                evaluation["filename"] = resume_file.filename
-                results.append(evaluation)
+                upload = await asyncio.to_thread(ingest_upload, resume_file, self.document_processor.max_bytes)
+                candidate_id = upload.sha256
+                if await asyncio.to_thread(self.candidate_store.add_to_pool, candidate_id, pool):
+                    return {"candidate_id": candidate_id, "filename": upload.filename, "stored": False}
+                text = await self.document_processor.aprocess_ingested(upload)
+                await asyncio.to_thread(self.candidate_store.add_candidate, candidate_id, upload.filename, text, pool)
+                return {"candidate_id": candidate_id, "filename": upload.filename, "stored": True}
             except Exception as e:
-                results.append({"filename": resume_file.filename, "error": str(e)})
+                return {"filename": resume_file.filename, "error": str(e)}
 
-        results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        return results
+    async def iter_store_candidates(
+        self, resume_files: List[UploadFile], pool: Optional[str] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Converts uploads (expanding archives) and saves them to the candidate
+        store, optionally adding them to ``pool``, yielding one result per resume.
+
+        Files already stored are only added to the pool, so each resume is
+        converted once however many openings it is screened for.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending = set()
+        try:
+            async for source in self._iter_resume_sources(resume_files):
+                if isinstance(source, dict):
+                    yield source
+                    continue
+                pending.add(asyncio.ensure_future(self._store_candidate(source, pool, semaphore)))
+                if len(pending) >= self.max_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+            pending = set()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_stored_evaluations(
+        self,
+        candidate_ids: List[str],
+        jd_file: UploadFile = None,
+        jd_text: str = None,
+        jd_generation_details: Dict[str, Any] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Evaluates stored candidates against a job description without any
+        uploads or conversions, yielding each result as soon as it is ready.
+
+        Evaluations stored for the same JD, model and prompt version are
+        reused; new ones are saved. Results carry ``candidate_id`` and
+        ``jd_id``. A job description error is yielded as a lone error result.
+        """
+        store = self.candidate_store
+        try:
+            jd_text_content = await self.resolve_jd_text(jd_file, jd_text, jd_generation_details)
+        except ValueError as e:
+            yield {"error": str(e)}
+            return
+
+        scoring_jd, digest = await self._get_scoring_jd(jd_text_content)
+        jd_id = await asyncio.to_thread(store.save_jd, jd_text_content)
+        model = _model_id(self.llm_client)
+        if self.cascade_client is not None:
+            model = f"{_model_id(self.cascade_client)}>{model}"
+        prompt_version = self.prompt_manager.get_version(
+            "resume_batch_evaluation" if self.batch_token_budget > 0 else "resume_evaluation"
+        )
+
+        candidate_ids = list(dict.fromkeys(candidate_ids))
+        past = await asyncio.to_thread(store.get_evaluations, candidate_ids, jd_id, model, prompt_version)
+        remaining = [candidate_id for candidate_id in candidate_ids if candidate_id not in past]
+        texts = await asyncio.to_thread(store.load_texts, remaining)
+        for candidate_id in candidate_ids:
+            if candidate_id in past:
+                yield {**past[candidate_id], "candidate_id": candidate_id, "jd_id": jd_id}
+            elif candidate_id not in texts:
+                yield {"candidate_id": candidate_id, "jd_id": jd_id, "error": "Candidate not found."}
+
+        ids = [candidate_id for candidate_id in remaining if candidate_id in texts]
+        converted = {}
+        for index, candidate_id in enumerate(ids):
+            resume_text = texts[candidate_id][1]
+            if self.compactor is not None:
+                resume_text, _ = self.compactor.compact(resume_text)
+            converted[index] = (resume_text, None)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async for index, result in self._iter_scoring_phase(
+            converted, [texts[candidate_id][0] for candidate_id in ids], jd_text_content, scoring_jd, digest, semaphore
+        ):
+            result.update(candidate_id=ids[index], jd_id=jd_id)
+            if "error" not in result and not result.get("prescreened_out", False):
+                await asyncio.to_thread(store.save_evaluation, ids[index], jd_id, model, prompt_version, result)
+            yield result
+
+
+def ranking_key(result: dict) -> tuple:
+    """Sort key for ranking results; pre-screened candidates rank below every LLM-scored one."""
+    return (not result.get("prescreened_out", False), result.get("score", 0))
+
+
+def _merge_cascade(screening: dict, evaluation: dict) -> dict:
+    """
+    Merges a candidate's two cascade scores: the main model's evaluation
+    wins, and the screening score is kept alongside it. If the main model
+    failed, the screening evaluation is kept instead.
+    """
+    if "error" in evaluation and "error" not in screening:
+        return {**screening, "screening_score": screening.get("score")}
+    return {**evaluation, "screening_score": screening.get("score"), "rescored": True}
+
+
+def _model_id(client: LLMClient) -> str:
+    """Identifies the provider and model behind a client, e.g. ``groq:openai/gpt-oss-120b``."""
+    return f"{getattr(client, 'provider', type(client).__name__)}:{getattr(client, 'model', '')}"
+
+
+async def _resolved(value: Any) -> Any:
+    """Wraps an already known result as an awaitable."""
+    return value
+
+
+async def _as_completed(awaitables: Iterable[Awaitable]) -> AsyncIterator[Any]:
+    """Yields the results of awaitables in completion order, cancelling leftovers on exit."""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,224 @@
+import hashlib
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Iterator, Optional
+
+from fastapi import UploadFile
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+INGESTED_BYTES = REGISTRY.counter("upload_ingested_bytes", "Bytes of uploaded files streamed in and hashed.")
+REJECTED_UPLOADS = REGISTRY.counter("upload_rejected", "Uploaded files rejected before conversion.", ("reason",))
+
+ARCHIVE_ENTRIES = REGISTRY.counter(
+    "upload_archive_entries", "Archive members read from uploaded archives, by outcome.", ("outcome",)
+)
+
+# Bytes read from an upload at a time; bounds memory per file while hashing
+CHUNK_SIZE = 64 * 1024
+
+# Archive suffixes expanded into their members, and the member types read as resumes
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz", ".tar")
+RESUME_EXTENSIONS = {
+    ".pdf", ".docx", ".doc", ".txt", ".md", ".html", ".htm", ".rtf", ".odt", ".pptx", ".epub", ".json", ".xml",
+}
+
+
+class FileTooLargeError(ValueError):
+    """Raised when an uploaded file exceeds the per-file size limit."""
+
+
+class IngestedFile:
+    """
+    An upload whose size and SHA-256 were measured by streaming it in chunks.
+
+    The bytes stay in the upload's own (spooled) file until ``read`` is
+    called, so callers can look up caches by ``sha256`` without loading them.
+    """
+
+    def __init__(self, filename: str, stream: BinaryIO, size: int, sha256: str):
+        """Initializes the IngestedFile."""
+        self.filename = filename
+        self.stream = stream
+        self.size = size
+        self.sha256 = sha256
+
+    @property
+    def extension(self) -> str:
+        """Returns the lower-cased file extension, including the dot."""
+        return Path(self.filename).suffix.lower()
+
+    def read(self) -> bytes:
+        """Returns the file's bytes."""
+        self.stream.seek(0)
+        return self.stream.read()
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yields the file's bytes in ``CHUNK_SIZE`` pieces."""
+        self.stream.seek(0)
+        while True:
+            chunk = self.stream.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def ingest_stream(filename: str, stream: BinaryIO, max_bytes: int = 0, size_hint: Optional[int] = None) -> IngestedFile:
+    """
+    Hashes a file stream chunk by chunk, enforcing ``max_bytes`` (0 disables it).
+
+    A known ``size_hint`` over the limit rejects the file without reading it;
+    otherwise reading stops at the first chunk past the limit.
+
+    Raises:
+        ValueError: If the file has no name
+        FileTooLargeError: If the file exceeds ``max_bytes``
+    """
+    if not filename:
+        raise ValueError("File has no name.")
+    filename = Path(filename).name
+    if max_bytes and size_hint is not None and size_hint > max_bytes:
+        REJECTED_UPLOADS.inc(reason="too_large")
+        raise FileTooLargeError(f"File is larger than the limit of {max_bytes} bytes.")
+
+    digest = hashlib.sha256()
+    size = 0
+    stream.seek(0)
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            REJECTED_UPLOADS.inc(reason="too_large")
+            raise FileTooLargeError(f"File is larger than the limit of {max_bytes} bytes.")
+        digest.update(chunk)
+    stream.seek(0)
+    INGESTED_BYTES.inc(size)
+    return IngestedFile(filename, stream, size, digest.hexdigest())
+
+
+def ingest_upload(upload: UploadFile, max_bytes: int = 0) -> IngestedFile:
+    """Streams an UploadFile through ``ingest_stream``; blocking, so run it off the event loop."""
+    return ingest_stream(upload.filename, upload.file, max_bytes, size_hint=upload.size)
+
+
+class ArchiveEntry:
+    """One member of an uploaded archive: its bytes, or why it was skipped."""
+
+    def __init__(self, filename: str, data: Optional[bytes] = None, error: Optional[str] = None):
+        """Initializes the ArchiveEntry."""
+        self.filename = filename
+        self.data = data
+        self.error = error
+
+
+def is_archive(filename: Optional[str]) -> bool:
+    """Returns whether an upload is an archive of resumes, judging by its name."""
+    return bool(filename) and filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def iter_archive_entries(
+    filename: str, stream: BinaryIO, max_entry_bytes: int = 0, max_entries: int = 0
+) -> Iterator[ArchiveEntry]:
+    """
+    Reads a ZIP or (gzipped) tar archive one member at a time, without extracting it to disk.
+
+    Directories and hidden or system files are skipped silently; members with
+    an unsupported extension or over ``max_entry_bytes`` are yielded with an
+    error instead of their bytes, and are never read in full. At most
+    ``max_entries`` resumes are yielded (0 means no limit). Blocking, so run
+    it off the event loop.
+
+    Raises:
+        ValueError: If the archive is corrupt or not a supported format
+    """
+    stream.seek(0)
+    if filename.lower().endswith(".zip"):
+        members = _iter_zip_members(stream, max_entry_bytes)
+    else:
+        members = _iter_tar_members(stream, max_entry_bytes)
+
+    count = 0
+    for entry in members:
+        if entry.error is None:
+            count += 1
+            if max_entries and count > max_entries:
+                ARCHIVE_ENTRIES.inc(outcome="over_limit")
+                yield ArchiveEntry(filename, error=f"Archive has more than {max_entries} resumes; the rest were skipped.")
+                return
+        ARCHIVE_ENTRIES.inc(outcome="read" if entry.error is None else "skipped")
+        yield entry
+
+
+def _member_error(name: str, size: int, max_entry_bytes: int) -> Optional[str]:
+    """Returns why a member can't be read as a resume, or None if it can."""
+    if PurePosixPath(name).suffix.lower() not in RESUME_EXTENSIONS:
+        return "Unsupported file type."
+    if max_entry_bytes and size > max_entry_bytes:
+        return f"File is larger than the limit of {max_entry_bytes} bytes."
+    return None
+
+
+def _is_hidden(name: str) -> bool:
+    """Returns whether a member is a hidden or OS metadata file (e.g. ``__MACOSX/._cv.pdf``)."""
+    return any(part.startswith((".", "__MACOSX")) for part in PurePosixPath(name).parts)
+
+
+def _read_member(member_stream: BinaryIO, max_entry_bytes: int) -> Optional[bytes]:
+    """Reads a member, returning None if it turns out larger than its header claimed."""
+    data = member_stream.read(max_entry_bytes + 1) if max_entry_bytes else member_stream.read()
+    return None if max_entry_bytes and len(data) > max_entry_bytes else data
+
+
+def _iter_zip_members(stream: BinaryIO, max_entry_bytes: int) -> Iterator[ArchiveEntry]:
+    """Yields the members of a ZIP archive, reading each only when it is reached."""
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Invalid ZIP archive: {e}") from e
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir() or _is_hidden(info.filename):
+                continue
+            error = _member_error(info.filename, info.file_size, max_entry_bytes)
+            if error is None and info.flag_bits & 0x1:
+                error = "File is encrypted."
+            if error is not None:
+                yield ArchiveEntry(info.filename, error=error)
+                continue
+            try:
+                with archive.open(info) as member_stream:
+                    data = _read_member(member_stream, max_entry_bytes)
+            except (zipfile.BadZipFile, NotImplementedError, OSError) as e:
+                yield ArchiveEntry(info.filename, error=f"Could not read file from archive: {e}")
+                continue
+            if data is None:
+                yield ArchiveEntry(info.filename, error=f"File is larger than the limit of {max_entry_bytes} bytes.")
+            else:
+                yield ArchiveEntry(info.filename, data)
+
+
+def _iter_tar_members(stream: BinaryIO, max_entry_bytes: int) -> Iterator[ArchiveEntry]:
+    """Yields the members of a tar archive (optionally compressed) in a single forward pass."""
+    try:
+        archive = tarfile.open(fileobj=stream, mode="r|*")
+    except tarfile.TarError as e:
+        raise ValueError(f"Invalid tar archive: {e}") from e
+    with archive:
+        try:
+            for member in archive:
+                if not member.isfile() or _is_hidden(member.name):
+                    continue
+                error = _member_error(member.name, member.size, max_entry_bytes)
+                if error is not None:
+                    yield ArchiveEntry(member.name, error=error)
+                    continue
+                data = _read_member(archive.extractfile(member), max_entry_bytes)
+                yield ArchiveEntry(member.name, data)
+        except (tarfile.TarError, EOFError, OSError) as e:
+            raise ValueError(f"Invalid tar archive: {e}") from e
@@ -0,0 +1,110 @@
+import asyncio
+from io import BytesIO
+from typing import Callable, List, Optional
+
+from fastapi import UploadFile
+
+from src.core.evaluation_engine import EvaluationEngine, ranking_key
+from src.core.job_store import COMPLETED, FAILED, RUNNING, JobStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobRunner:
+    """
+    Runs background screening jobs from the JobStore on a pool of workers.
+
+    Each job is evaluated with the application's current EvaluationEngine.
+    Results are checkpointed as they complete, so unfinished jobs found at
+    startup resume where they stopped instead of re-scoring candidates.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        get_engine: Callable[[], EvaluationEngine],
+        workers: int = 2,
+    ):
+        """Initializes the JobRunner."""
+        self.store = store
+        self.get_engine = get_engine
+        self.workers = max(1, workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Starts the workers and re-queues jobs left unfinished by a previous run."""
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        for job_id in await asyncio.to_thread(self.store.unfinished_jobs):
+            logger.info(f"Resuming unfinished job {job_id}")
+            self.submit(job_id)
+
+    def submit(self, job_id: str) -> None:
+        """Queues a stored job for evaluation."""
+        self._queue.put_nowait(job_id)
+
+    async def stop(self) -> None:
+        """Cancels the workers; running jobs resume from their checkpoint on restart."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        """Takes jobs off the queue and runs them one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+                await asyncio.to_thread(self.store.set_status, job_id, FAILED, str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        """
+        Evaluates the resumes of a job that have no checkpointed result yet.
+
+        Store calls run in threads to keep SQLite off the event loop, and each
+        resume's bytes are read from the store only when the engine converts it.
+        """
+        await asyncio.to_thread(self.store.set_status, job_id, RUNNING)
+        engine = self.get_engine()
+
+        source = await asyncio.to_thread(self.store.get_jd_source, job_id)
+        jd_content = source["jd_content"]
+        if jd_content is None:
+            jd_file = None
+            if source["jd_file"]:
+                filename, data = source["jd_file"]
+                jd_file = UploadFile(BytesIO(data), filename=filename)
+            jd_content = await engine.resolve_jd_text(jd_file, source["jd_text"], source["jd_details"])
+            await asyncio.to_thread(self.store.save_jd_content, job_id, jd_content)
+
+        pending = await asyncio.to_thread(self.store.pending_resumes, job_id)
+        resume_files = [
+            UploadFile(self.store.open_resume(row_id, size), size=size, filename=filename)
+            for _, filename, row_id, size in pending
+        ]
+
+        async for position, result in engine.iter_indexed_evaluations(
+            resume_files, jd_text=jd_content
+        ):
+            if position is None:
+                raise ValueError(result["error"])
+            await asyncio.to_thread(self.store.save_result, job_id, pending[position][0], result)
+
+        await asyncio.to_thread(self.store.set_status, job_id, COMPLETED)
+        logger.info(f"Job {job_id} completed")
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """Returns a job's progress with its results so far ranked by score."""
+        job = self.store.get_job(job_id)
+        if job is not None:
+            job["results"].sort(key=ranking_key, reverse=True)
+        return job
@@ -0,0 +1,265 @@
+import io
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class JobStore:
+    """
+    SQLite-backed store for background screening jobs.
+
+    A job keeps its JD source and the raw bytes of every resume, so it can be
+    resumed after a restart. Resume bytes are streamed from the database
+    while the job runs rather than loaded up front. Each candidate's result is written as soon as
+    it is scored, which checkpoints progress: resuming a job only scores the
+    resumes that have no result yet.
+    """
+
+    def __init__(self, db_path: Path):
+        """Initializes the JobStore and creates its tables if needed."""
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                total INTEGER NOT NULL,
+                jd_text TEXT,
+                jd_details TEXT,
+                jd_filename TEXT,
+                jd_data BLOB,
+                jd_content TEXT,
+                error TEXT
+            );
+            CREATE TABLE IF NOT EXISTS job_resumes (
+                job_id TEXT NOT NULL,
+                resume_index INTEGER NOT NULL,
+                filename TEXT NOT NULL,
+                data BLOB NOT NULL,
+                result TEXT,
+                PRIMARY KEY (job_id, resume_index)
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+            """
+        )
+        self._conn.commit()
+
+    def create_job(
+        self,
+        resumes: Iterable[Tuple[str, bytes, Optional[Dict[str, Any]]]],
+        jd_text: Optional[str] = None,
+        jd_details: Optional[Dict[str, Any]] = None,
+        jd_file: Optional[Tuple[str, bytes]] = None,
+    ) -> Tuple[str, int]:
+        """
+        Persists a new queued job and returns its id and number of resumes.
+
+        ``resumes`` yields ``(filename, data, result)``; a result that is not
+        None (such as a skipped archive member) is recorded as final so the
+        resume is never evaluated. It may be a generator: it is consumed one
+        file at a time so only one upload needs to be in memory while the
+        job is stored, and nothing is stored if it raises.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        jd_filename, jd_data = jd_file if jd_file else (None, None)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO jobs (id, status, created_at, updated_at, total, jd_text, jd_details, jd_filename, jd_data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        job_id, QUEUED, now, now, 0, jd_text,
+                        json.dumps(jd_details) if jd_details else None, jd_filename, jd_data,
+                    ),
+                )
+                total = 0
+                for index, (filename, data, result) in enumerate(resumes):
+                    self._conn.execute(
+                        "INSERT INTO job_resumes (job_id, resume_index, filename, data, result) VALUES (?, ?, ?, ?, ?)",
+                        (job_id, index, filename, data, json.dumps(result) if result is not None else None),
+                    )
+                    total += 1
+                self._conn.execute("UPDATE jobs SET total = ? WHERE id = ?", (total, job_id))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return job_id, total
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Returns a job's status, progress and the results recorded so far."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, created_at, updated_at, total, error FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            results = [
+                json.loads(result)
+                for (result,) in self._conn.execute(
+                    "SELECT result FROM job_resumes WHERE job_id = ? AND result IS NOT NULL",
+                    (job_id,),
+                )
+            ]
+        status, created_at, updated_at, total, error = row
+        return {
+            "job_id": job_id,
+            "status": status,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "total": total,
+            "completed": len(results),
+            "error": error,
+            "results": results,
+        }
+
+    def get_jd_source(self, job_id: str) -> Dict[str, Any]:
+        """Returns the JD inputs of a job, including its resolved JD text if known."""
+        with self._lock:
+            jd_text, jd_details, jd_filename, jd_data, jd_content = self._conn.execute(
+                "SELECT jd_text, jd_details, jd_filename, jd_data, jd_content FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return {
+            "jd_text": jd_text,
+            "jd_details": json.loads(jd_details) if jd_details else None,
+            "jd_file": (jd_filename, jd_data) if jd_filename else None,
+            "jd_content": jd_content,
+        }
+
+    def save_jd_content(self, job_id: str, jd_content: str) -> None:
+        """Checkpoints the resolved JD text so it is not converted or generated again."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET jd_content = ?, updated_at = ? WHERE id = ?",
+                (jd_content, time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def pending_resumes(self, job_id: str) -> List[Tuple[int, str, int, int]]:
+        """
+        Returns ``(index, filename, row_id, size)`` for every resume without a
+        result; the bytes are read through ``open_resume`` when needed.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT resume_index, filename, rowid, length(data) FROM job_resumes "
+                "WHERE job_id = ? AND result IS NULL ORDER BY resume_index",
+                (job_id,),
+            ).fetchall()
+
+    def open_resume(self, row_id: int, size: int) -> BinaryIO:
+        """Returns a read-only, seekable file over a stored resume's bytes, read on demand."""
+        return io.BufferedReader(_StoredResume(self, row_id, size), buffer_size=64 * 1024)
+
+    def _read_resume(self, row_id: int, offset: int, length: int) -> bytes:
+        """Reads part of a stored resume's bytes."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT substr(data, ?, ?) FROM job_resumes WHERE rowid = ?", (offset + 1, length, row_id)
+            ).fetchone()
+        return bytes(row[0]) if row is not None and row[0] is not None else b""
+
+    def save_result(self, job_id: str, resume_index: int, result: Dict[str, Any]) -> None:
+        """Checkpoints one candidate's result."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_resumes SET result = ? WHERE job_id = ? AND resume_index = ?",
+                (json.dumps(result), job_id, resume_index),
+            )
+            self._conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (now, job_id))
+            self._conn.commit()
+
+    def set_status(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """Updates a job's status; resume bytes are dropped once it has finished."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, error, time.time(), job_id),
+            )
+            if status in (COMPLETED, FAILED):
+                self._conn.execute(
+                    "UPDATE job_resumes SET data = x'' WHERE job_id = ?", (job_id,)
+                )
+                self._conn.execute("UPDATE jobs SET jd_data = NULL WHERE id = ?", (job_id,))
+            self._conn.commit()
+
+    def unfinished_jobs(self) -> List[str]:
+        """Returns the ids of queued or running jobs, oldest first."""
+        with self._lock:
+            return [
+                job_id
+                for (job_id,) in self._conn.execute(
+                    "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                    (QUEUED, RUNNING),
+                )
+            ]
+
+    def close(self) -> None:
+        """Closes the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class _StoredResume(io.RawIOBase):
+    """Seekable view of one resume stored in a JobStore, read chunk by chunk from SQLite."""
+
+    def __init__(self, store: JobStore, row_id: int, size: int):
+        """Initializes the _StoredResume."""
+        self._store = store
+        self._row_id = row_id
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._size}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+        data = self._store._read_resume(self._row_id, self._position, length)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        length = self._size - self._position
+        if length <= 0:
+            return b""
+        data = self._store._read_resume(self._row_id, self._position, length)
+        self._position += len(data)
+        return data
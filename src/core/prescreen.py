@@ -0,0 +1,118 @@
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Tokens kept together so skills such as "c++", "c#", "node.js" survive tokenization
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+STOPWORDS = frozenset(
+    """a about above after all also an and any are as at be been being both but by can
+    could do does for from had has have having he her his how i if in into is it its
+    job may more most must need needs of on or our over own role same she should so
+    some such than that the their them then there these they this those to under
+    until up very was we were what when where which while who will with would you
+    your years year experience work working team candidate ability strong knowledge
+    skills skill required requirements preferred plus etc""".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercases text and splits it into skill-friendly tokens, dropping stopwords."""
+    tokens = (token.rstrip(".") for token in TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if len(token) > 1 and token not in STOPWORDS]
+
+
+class LexicalPrescreener:
+    """
+    Ranks resumes against a job description locally with BM25.
+
+    Query terms come from the JD digest's skills when available (must-have
+    skills weigh double) or from the JD text itself. Scoring runs over a
+    sparse document-term matrix restricted to the query vocabulary, so it is
+    fast even for pools of thousands of resumes and needs no network.
+    NumPy and SciPy are imported by the first ranking, not at startup.
+    """
+
+    def __init__(self, top_k: int = 50, min_score: float = 0.0, k1: float = 1.5, b: float = 0.75):
+        """
+        Initializes the LexicalPrescreener.
+
+        Args:
+            top_k: Number of best-ranked resumes kept for LLM scoring
+            min_score: Resumes scoring below this (0-100) are screened out even
+                if they rank in the top K
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.top_k = top_k
+        self.min_score = min_score
+        self.k1 = k1
+        self.b = b
+
+    @staticmethod
+    def query_weights(jd_text: str, digest: Optional[Dict] = None) -> Dict[str, float]:
+        """Builds weighted query terms from the JD digest's skills or the raw JD."""
+        weights: Dict[str, float] = {}
+        if digest and digest.get("must_have_skills"):
+            for field, weight in (("must_have_skills", 2.0), ("nice_to_have_skills", 1.0)):
+                for skill in digest.get(field) or []:
+                    for token in tokenize(str(skill)):
+                        weights[token] = max(weights.get(token, 0.0), weight)
+            return weights
+        for token in tokenize(jd_text):
+            weights[token] = 1.0
+        return weights
+
+    def score(self, weights: Dict[str, float], documents: Sequence[str]) -> "np.ndarray":
+        """Returns a BM25 score per document, scaled to 0-100 of the best attainable score."""
+        import numpy as np
+        from scipy import sparse
+
+        if not weights or not documents:
+            return np.zeros(len(documents))
+
+        vocabulary = {term: column for column, term in enumerate(weights)}
+        rows, columns, lengths = [], [], []
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            lengths.append(len(tokens))
+            for token in tokens:
+                column = vocabulary.get(token)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+
+        term_counts = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, columns)), shape=(len(documents), len(vocabulary))
+        )
+        term_counts.sum_duplicates()
+
+        lengths = np.asarray(lengths, dtype=float)
+        average_length = max(lengths.mean(), 1.0)
+        document_frequency = np.bincount(term_counts.indices, minlength=len(vocabulary))
+        idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+        term_weights = idf * np.fromiter(weights.values(), dtype=float)
+
+        # BM25 term-frequency saturation applied to the non-zero entries only
+        row_lengths = np.repeat(lengths, np.diff(term_counts.indptr))
+        tf = term_counts.data
+        term_counts.data = tf * (self.k1 + 1) / (
+            tf + self.k1 * (1 - self.b + self.b * row_lengths / average_length)
+        )
+
+        scores = term_counts @ term_weights
+        best_attainable = term_weights.sum() * (self.k1 + 1)
+        return 100.0 * scores / best_attainable if best_attainable > 0 else scores
+
+    def select(
+        self, jd_text: str, documents: Sequence[str], digest: Optional[Dict] = None
+    ) -> Tuple[List[int], "np.ndarray"]:
+        """Returns the indices of documents kept for LLM scoring and every local score."""
+        import numpy as np
+
+        scores = self.score(self.query_weights(jd_text, digest), documents)
+        ranked = np.argsort(-scores, kind="stable")[: self.top_k]
+        kept = [int(index) for index in ranked if scores[index] >= self.min_score]
+        return sorted(kept), scores
@@ -1,37 +1,135 @@
 import os
-import yaml
-from pathlib import Path
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
-from src.llm.base import LLMClient
-from src.llm.openai_client import OpenAIClient
-from src.llm.groq_client import GroqClient
+from src.llm.base import ChatCompletionClient, LLMClient
+from src.llm.rate_limiter import AdaptiveRateLimiter
+from src.llm.router import Backend, RoutingLLMClient
 from src.prompts.manager import PromptManager
+from src.utils.config import PROMPTS_PATH, load_settings
+from src.utils.logger import get_logger
 
 load_dotenv()
 
-# Build a robust path to the project root
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+logger = get_logger(__name__)
 
-def get_llm_client() -> LLMClient:
-    """Factory function to get the configured LLM client."""
-    config_path = BASE_DIR / "config/settings.yaml"
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+# Environment variable holding each provider's default API key
+API_KEY_ENV = {"openai": "OPENAI_API_KEY", "groq": "GROQ_API_KEY"}
+
+def get_llm_client(
+    settings: Optional[Dict[str, Any]] = None,
+    prompt_manager: Optional[PromptManager] = None,
+    models: Optional[Dict[str, str]] = None,
+) -> LLMClient:
+    """
+    Factory function to get the configured LLM client.
+
+    Already-loaded settings and prompts can be passed in to avoid re-reading
+    the YAML files; otherwise both are loaded from the default locations.
+    ``models`` maps providers to models that replace ``ai.models`` and the
+    routing backends' models, e.g. for the cheap tier of a cascade.
+    """
+    config = settings if settings is not None else load_settings()
+
+    if prompt_manager is None:
+        prompt_manager = PromptManager(PROMPTS_PATH)
+
+    routing = config["ai"].get("routing", {})
+    if routing.get("enabled", False):
+        return _build_router(config, routing, prompt_manager, models)
 
     provider = config["ai"]["default_provider"]
-    model = config["ai"]["models"][provider]
+    model = (models or {}).get(provider) or config["ai"]["models"][provider]
+    logger.info(f"Creating {provider} LLM client for model {model}")
+    return _build_client(
+        config, provider, model, os.getenv(API_KEY_ENV[provider]), prompt_manager, f"{provider}:{model}"
+    )
+
+
 
-    prompts_path = BASE_DIR / "config/prompts.yaml"
-    prompt_manager = PromptManager(prompts_path)
+def _build_rate_limiter(config: Dict[str, Any], name: str) -> Optional[AdaptiveRateLimiter]:
+    """Creates the adaptive rate limiter for one client, or None when rate limiting is disabled."""
+    rate_limit = config["ai"].get("rate_limit", {})
+    if not rate_limit.get("enabled", False):
+        return None
+    return AdaptiveRateLimiter(
+        name,
+        initial_concurrency=rate_limit.get("initial_concurrency", 8),
+        min_concurrency=rate_limit.get("min_concurrency", 1),
+        max_concurrency=rate_limit.get("max_concurrency", 64),
+        decrease_factor=rate_limit.get("decrease_factor", 0.5),
+        tokens_per_minute=rate_limit.get("tokens_per_minute"),
+        max_retries=rate_limit.get("max_retries", 5),
+        base_backoff_seconds=rate_limit.get("base_backoff_seconds", 0.5),
+        max_backoff_seconds=rate_limit.get("max_backoff_seconds", 30),
+    )
 
+
+def _build_client(
+    config: Dict[str, Any],
+    provider: str,
+    model: str,
+    api_key: Optional[str],
+    prompt_manager: PromptManager,
+    name: str,
+) -> ChatCompletionClient:
+    """
+    Creates the client for one provider, model and API key, with its own rate limiter.
+
+    Provider modules are imported here rather than at module load, so only
+    the configured providers' SDKs are ever imported, on their first call.
+    """
+    pool_settings = config["ai"].get("http_pool")
+    rate_limiter = _build_rate_limiter(config, name)
     if provider == "openai":
-        api_key = os.getenv("OPENAI_API_KEY")
-        return OpenAIClient(api_key=api_key, model=model, prompt_manager=prompt_manager)
+        from src.llm.openai_client import OpenAIClient
+
+        return OpenAIClient(
+            api_key=api_key,
+            model=model,
+            prompt_manager=prompt_manager,
+            pool_settings=pool_settings,
+            rate_limiter=rate_limiter,
+        )
     elif provider == "groq":
-        api_key = os.getenv("GROQ_API_KEY")
+        from src.llm.groq_client import GroqClient
 
-        print(f"Using Groq API key: {api_key}")
-        
-        return GroqClient(api_key=api_key, model=model, prompt_manager=prompt_manager)
+        return GroqClient(
+            api_key=api_key,
+            model=model,
+            prompt_manager=prompt_manager,
+            pool_settings=pool_settings,
+            rate_limiter=rate_limiter,
+        )
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def _build_router(
+    config: Dict[str, Any],
+    routing: Dict[str, Any],
+    prompt_manager: PromptManager,
+    models: Optional[Dict[str, str]] = None,
+) -> RoutingLLMClient:
+    """Creates a routing client over every configured backend whose API key is set."""
+    backends = []
+    for index, backend_settings in enumerate(routing.get("backends", [])):
+        provider = backend_settings["provider"]
+        model = (models or {}).get(provider) or backend_settings.get("model") or config["ai"]["models"][provider]
+        key_env = backend_settings.get("api_key_env", API_KEY_ENV[provider])
+        api_key = os.getenv(key_env)
+        if not api_key:
+            logger.warning(f"Skipping {provider} backend {index}: {key_env} is not set")
+            continue
+        name = f"{provider}:{key_env}:{model}"
+        client = _build_client(config, provider, model, api_key, prompt_manager, name)
+        backends.append(Backend(name, client, weight=backend_settings.get("weight", 1.0)))
+
+    logger.info(f"Creating routing LLM client over {len(backends)} backends")
+    return RoutingLLMClient(
+        backends,
+        prompt_manager,
+        hedge_percentile=routing.get("hedge_percentile", 95),
+        hedge_min_samples=routing.get("hedge_min_samples", 20),
+        hedge_after_seconds=routing.get("hedge_after_seconds", 10),
+        failure_cooldown_seconds=routing.get("failure_cooldown_seconds", 30),
+    )
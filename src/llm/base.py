@@ -1,8 +1,86 @@
+import asyncio
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple, Type
+
+from src.llm.parsing import EVALUATION_SCHEMA, parse_json, validate_evaluation
+from src.llm.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from src.prompts.manager import PromptManager
+from src.utils.logger import get_logger
+from src.utils.metrics import COUNT_BUCKETS, REGISTRY
+from src.utils.tokens import estimate_tokens
+
+logger = get_logger(__name__)
+
+_LLM_LABELS = ("provider", "model", "prompt")
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "llm_request_duration_seconds", "Latency of LLM chat completion calls.", _LLM_LABELS
+)
+LLM_PROMPT_TOKENS = REGISTRY.histogram(
+    "llm_prompt_tokens", "Prompt tokens per LLM call.", _LLM_LABELS, COUNT_BUCKETS
+)
+LLM_COMPLETION_TOKENS = REGISTRY.histogram(
+    "llm_completion_tokens", "Completion tokens per LLM call.", _LLM_LABELS, COUNT_BUCKETS
+)
+LLM_ERRORS = REGISTRY.counter(
+    "llm_errors", "LLM calls that failed after all retries.", _LLM_LABELS + ("error",)
+)
+LLM_RETRIES = REGISTRY.counter(
+    "llm_retries", "Retries (by the SDK or the rate limiter) before an LLM call succeeded.", _LLM_LABELS
+)
+LLM_OUTPUT_PARSES = REGISTRY.counter(
+    "llm_output_parses",
+    "Structured LLM outputs by how they were parsed: valid, repaired locally, re-asked, or invalid.",
+    ("prompt", "outcome"),
+)
+
+# Longest malformed output quoted back to the model in a re-ask
+MAX_REASK_OUTPUT_CHARS = 8000
 
 class LLMClient(ABC):
-    """Abstract base class for LLM clients."""
+    """
+    Abstract base class for LLM clients.
+
+    The async methods are the primary interface and are what the web layer
+    awaits. The sync methods are kept for scripts and other callers that do
+    not run an event loop.
+    """
+
+    @abstractmethod
+    async def aevaluate_resume(self, jd_text: str, resume_text: str) -> dict:
+        """Evaluates a resume against a job description."""
+        pass
+
+    @abstractmethod
+    async def aevaluate_resume_batch(self, jd_text: str, resumes: Dict[str, str]) -> Dict[str, dict]:
+        """
+        Evaluates several resumes, keyed by id, against one copy of a job description.
+
+        Ids whose evaluation is missing or malformed in the response are left
+        out of the result so the caller can retry them.
+        """
+        pass
+
+    @abstractmethod
+    async def adigest_jd(self, jd_text: str) -> dict:
+        """Extracts a structured digest (skills, experience, ...) from a job description."""
+        pass
+
+    @abstractmethod
+    async def agenerate_jd(self, details: Dict) -> str:
+        """Generates a job description from a dictionary of details."""
+        pass
+
+    @abstractmethod
+    async def agenerate_interview_email(self, candidate_name: str, role: str) -> str:
+        """Generates an interview email."""
+        pass
+
+    @abstractmethod
+    async def agenerate_rejection_email(self, candidate_name: str, role: str) -> str:
+        """Generates a rejection email."""
+        pass
 
     @abstractmethod
     def evaluate_resume(self, jd_text: str, resume_text: str) -> dict:
@@ -22,4 +100,391 @@ class LLMClient(ABC):
     @abstractmethod
     def generate_rejection_email(self, candidate_name: str, role: str) -> str:
         """Generates a rejection email."""
-        pass
\ No newline at end of file
+        pass
+
+
+class CompletionClient(LLMClient):
+    """
+    Implements the LLMClient contract on top of a single completion call.
+
+    Subclasses only provide ``_complete`` and ``_acomplete``, which turn a
+    system and user prompt into the model's text and raise on failure;
+    prompt formatting, error payloads and response handling are shared by
+    both variants so the sync methods stay thin wrappers around the same logic.
+    """
+
+    # Provider name used in metrics and cache keys, and its human-readable form; set by subclasses
+    provider = ""
+    display_name = ""
+
+    def __init__(self, model: str, prompt_manager: PromptManager):
+        """Initializes the CompletionClient."""
+        self.model = model
+        self.prompt_manager = prompt_manager
+
+    @abstractmethod
+    def _complete(self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = "") -> str:
+        """Creates a completion with a blocking call, raising on failure."""
+        pass
+
+    @abstractmethod
+    async def _acomplete(
+        self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = ""
+    ) -> str:
+        """Creates a completion without blocking the event loop, raising on failure."""
+        pass
+
+    def _error_response(self, is_json: bool) -> str:
+        """Returns the fallback payload used when the API call fails."""
+        if is_json:
+            return json.dumps({"error": f"Failed to get response from {self.display_name}."})
+        return "Error: Could not get response."
+
+    def _create_chat_completion(
+        self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = ""
+    ) -> str:
+        """Helper to create a chat completion, turning failures into an error payload."""
+        try:
+            return self._complete(system_prompt, user_prompt, is_json, prompt_name)
+        except Exception as e:
+            logger.error(f"Error calling {self.display_name} API: {e}")
+            return self._error_response(is_json)
+
+    async def _acreate_chat_completion(
+        self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = ""
+    ) -> str:
+        """Helper to create a chat completion without blocking the event loop."""
+        try:
+            return await self._acomplete(system_prompt, user_prompt, is_json, prompt_name)
+        except Exception as e:
+            logger.error(f"Error calling {self.display_name} API: {e}")
+            return self._error_response(is_json)
+
+    def _reask_prompt(self, prompt: Dict[str, str], output: str, error: str) -> Tuple[Dict[str, str], str]:
+        """
+        Builds the re-ask for an evaluation that could not be parsed or repaired.
+
+        Malformed output is sent back with the validation error and the schema,
+        which costs far fewer tokens than re-sending the resume; empty output
+        has nothing to fix, so the original prompt is sent again instead.
+        """
+        if not output or not output.strip():
+            return prompt, "resume_evaluation"
+        reask = self.prompt_manager.format_prompt(
+            "output_repair", schema=EVALUATION_SCHEMA, output=output[:MAX_REASK_OUTPUT_CHARS], error=error
+        )
+        return reask, "output_repair"
+
+    def _reasked_evaluation(self, response_str: str, first_error: str) -> dict:
+        """Parses the response to a re-ask, giving up on the candidate if it is still invalid."""
+        evaluation, error = _parse_evaluation(response_str, reasked=True)
+        if error is None:
+            return evaluation
+        logger.warning(f"Invalid evaluation from {self.display_name} after a re-ask: {error}")
+        return {"error": f"Invalid evaluation from {self.display_name}: {first_error}"}
+
+    async def aevaluate_resume(self, jd_text: str, resume_text: str) -> dict:
+        """
+        Evaluates a resume against a job description.
+
+        The output is validated against ``CandidateEvaluation``; malformed
+        output is repaired locally where possible and re-asked once otherwise.
+        """
+        prompt = self.prompt_manager.format_prompt(
+            "resume_evaluation", jd_text=jd_text, resume_text=resume_text
+        )
+        if not prompt:
+            return {"error": "Could not load prompt."}
+
+        response_str = await self._acreate_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], is_json=True, prompt_name="resume_evaluation"
+        )
+        evaluation, error = _parse_evaluation(response_str)
+        if error is None:
+            return evaluation
+
+        reask, reask_name = self._reask_prompt(prompt, response_str, error)
+        response_str = await self._acreate_chat_completion(
+            reask["system_prompt"], reask["user_prompt"], is_json=True, prompt_name=reask_name
+        )
+        return self._reasked_evaluation(response_str, error)
+
+    async def aevaluate_resume_batch(self, jd_text: str, resumes: Dict[str, str]) -> Dict[str, dict]:
+        """
+        Evaluates several resumes, keyed by id, against one copy of a job description.
+
+        Ids whose evaluation is missing or malformed in the response are left
+        out of the result so the caller can retry them.
+        """
+        resumes_block = "\n".join(
+            f"=== Resume id: {resume_id} ===\n{resume_text}\n"
+            for resume_id, resume_text in resumes.items()
+        )
+        prompt = self.prompt_manager.format_prompt(
+            "resume_batch_evaluation", jd_text=jd_text, resumes=resumes_block
+        )
+        if not prompt:
+            return {resume_id: {"error": "Could not load prompt."} for resume_id in resumes}
+
+        response_str = await self._acreate_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], is_json=True, prompt_name="resume_batch_evaluation"
+        )
+        try:
+            payload, repaired = parse_json(response_str)
+        except ValueError:
+            LLM_OUTPUT_PARSES.inc(prompt="resume_batch_evaluation", outcome="invalid")
+            return {}
+
+        if isinstance(payload, dict) and "error" in payload and "results" not in payload:
+            # The API call itself failed; retrying smaller batches would not help
+            return {resume_id: {"error": payload["error"]} for resume_id in resumes}
+
+        entries = payload.get("results") if isinstance(payload, dict) else payload
+        evaluations = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            resume_id = str(entry.get("id"))
+            if resume_id not in resumes:
+                continue
+            try:
+                evaluations[resume_id] = validate_evaluation(entry)
+            except ValueError:
+                continue
+        LLM_OUTPUT_PARSES.inc(
+            prompt="resume_batch_evaluation",
+            outcome="invalid" if len(evaluations) < len(resumes) else "repaired" if repaired else "valid",
+        )
+        return evaluations
+
+    async def adigest_jd(self, jd_text: str) -> dict:
+        """Extracts a structured digest (skills, experience, ...) from a job description."""
+        prompt = self.prompt_manager.format_prompt("jd_digest", jd_text=jd_text)
+        if not prompt:
+            return {"error": "Could not load prompt."}
+
+        response_str = await self._acreate_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], is_json=True, prompt_name="jd_digest"
+        )
+        try:
+            payload, repaired = parse_json(response_str)
+        except ValueError as e:
+            LLM_OUTPUT_PARSES.inc(prompt="jd_digest", outcome="invalid")
+            return {"error": f"Invalid digest: {e}"}
+        LLM_OUTPUT_PARSES.inc(prompt="jd_digest", outcome="repaired" if repaired else "valid")
+        return payload.get("data", payload) if isinstance(payload, dict) else {"error": "Invalid digest."}
+
+    async def agenerate_jd(self, details: Dict) -> str:
+        """Generates a job description from a dictionary of details."""
+        return await self._agenerate_text("jd_generation", requirements=_format_requirements(details))
+
+    async def agenerate_interview_email(self, candidate_name: str, role: str) -> str:
+        """Generates an interview email."""
+        return await self._agenerate_text(
+            "interview_email", candidate_name=candidate_name, role=role
+        )
+
+    async def agenerate_rejection_email(self, candidate_name: str, role: str) -> str:
+        """Generates a rejection email."""
+        return await self._agenerate_text(
+            "rejection_email", candidate_name=candidate_name, role=role
+        )
+
+    async def _agenerate_text(self, prompt_name: str, **kwargs) -> str:
+        """Formats a prompt and returns the plain-text completion."""
+        prompt = self.prompt_manager.format_prompt(prompt_name, **kwargs)
+        if not prompt:
+            return "Error: Could not load prompt."
+        return await self._acreate_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], prompt_name=prompt_name
+        )
+
+    def evaluate_resume(self, jd_text: str, resume_text: str) -> dict:
+        """Evaluates a resume against a job description, validating and repairing the output."""
+        prompt = self.prompt_manager.format_prompt(
+            "resume_evaluation", jd_text=jd_text, resume_text=resume_text
+        )
+        if not prompt:
+            return {"error": "Could not load prompt."}
+
+        response_str = self._create_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], is_json=True, prompt_name="resume_evaluation"
+        )
+        evaluation, error = _parse_evaluation(response_str)
+        if error is None:
+            return evaluation
+
+        reask, reask_name = self._reask_prompt(prompt, response_str, error)
+        response_str = self._create_chat_completion(
+            reask["system_prompt"], reask["user_prompt"], is_json=True, prompt_name=reask_name
+        )
+        return self._reasked_evaluation(response_str, error)
+
+    def generate_jd(self, details: Dict) -> str:
+        """Generates a job description from a dictionary of details."""
+        return self._generate_text("jd_generation", requirements=_format_requirements(details))
+
+    def generate_interview_email(self, candidate_name: str, role: str) -> str:
+        """Generates an interview email."""
+        return self._generate_text(
+            "interview_email", candidate_name=candidate_name, role=role
+        )
+
+    def generate_rejection_email(self, candidate_name: str, role: str) -> str:
+        """Generates a rejection email."""
+        return self._generate_text(
+            "rejection_email", candidate_name=candidate_name, role=role
+        )
+
+    def _generate_text(self, prompt_name: str, **kwargs) -> str:
+        """Formats a prompt and returns the plain-text completion."""
+        prompt = self.prompt_manager.format_prompt(prompt_name, **kwargs)
+        if not prompt:
+            return "Error: Could not load prompt."
+        return self._create_chat_completion(
+            prompt["system_prompt"], prompt["user_prompt"], prompt_name=prompt_name
+        )
+
+
+class ChatCompletionClient(CompletionClient):
+    """
+    Implements ``CompletionClient`` on top of a provider's chat-completions API.
+
+    Subclasses only provide the request arguments and the sync and async
+    send calls, which raise on failure; rate limiting, retries and metrics
+    are shared by both variants.
+    """
+
+    # Exceptions, besides 429 and 5xx responses, that are worth retrying (e.g. connection errors)
+    retryable_errors: Tuple[Type[Exception], ...] = ()
+
+    def __init__(
+        self, model: str, prompt_manager: PromptManager, rate_limiter: Optional[AdaptiveRateLimiter] = None
+    ):
+        """Initializes the ChatCompletionClient; without a ``rate_limiter`` the SDK's own retries apply."""
+        super().__init__(model, prompt_manager)
+        self.rate_limiter = rate_limiter
+
+    @abstractmethod
+    def _completion_kwargs(self, system_prompt: str, user_prompt: str, is_json: bool) -> dict:
+        """Builds the provider's request arguments."""
+        pass
+
+    @abstractmethod
+    def _send(self, kwargs: dict) -> Tuple[Any, Any]:
+        """Sends a request with the blocking client, returning the raw and parsed responses."""
+        pass
+
+    @abstractmethod
+    async def _asend(self, kwargs: dict) -> Tuple[Any, Any]:
+        """Sends a request with the async client, returning the raw and parsed responses."""
+        pass
+
+    def _complete(self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = "") -> str:
+        """Creates a chat completion with the provider's blocking client, raising on failure."""
+        started = time.perf_counter()
+        try:
+            raw_response, response = self._send(self._completion_kwargs(system_prompt, user_prompt, is_json))
+        except Exception as e:
+            self._record_completion(prompt_name, started, error=e)
+            raise
+        self._record_completion(prompt_name, started, response.usage, raw_response.retries_taken)
+        return response.choices[0].message.content
+
+    async def _acomplete(
+        self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = ""
+    ) -> str:
+        """
+        Creates a chat completion with the provider's async client, raising on failure.
+
+        With a rate limiter, each attempt waits for a slot, reports its outcome
+        and rate-limit headers back, and 429s or transient errors are retried
+        with jittered backoff instead of failing the call.
+        """
+        kwargs = self._completion_kwargs(system_prompt, user_prompt, is_json)
+        started = time.perf_counter()
+        limiter = self.rate_limiter
+        if limiter is None:
+            try:
+                raw_response, response = await self._asend(kwargs)
+            except Exception as e:
+                self._record_completion(prompt_name, started, error=e)
+                raise
+            self._record_completion(prompt_name, started, response.usage, raw_response.retries_taken)
+            return response.choices[0].message.content
+
+        tokens = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+        attempt = 0
+        while True:
+            await limiter.acquire(tokens)
+            outcome, headers, retry_after = "cancelled", None, None
+            try:
+                raw_response, response = await self._asend(kwargs)
+                outcome, headers = "success", raw_response.headers
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                headers = getattr(getattr(e, "response", None), "headers", None)
+                outcome = "throttled" if status == 429 else "error"
+                retry_after = parse_retry_after(headers)
+                retryable = status == 429 or (status or 0) >= 500 or isinstance(e, self.retryable_errors)
+                if not retryable or attempt >= limiter.max_retries:
+                    self._record_completion(prompt_name, started, error=e)
+                    raise
+                logger.info(f"Retrying {self.display_name} call after {type(e).__name__} (attempt {attempt + 1})")
+            finally:
+                limiter.release(outcome, headers, retry_after)
+
+            if outcome == "success":
+                self._record_completion(
+                    prompt_name, started, response.usage, attempt + raw_response.retries_taken
+                )
+                return response.choices[0].message.content
+            await asyncio.sleep(limiter.retry_delay(attempt, retry_after))
+            attempt += 1
+
+    def _record_completion(
+        self,
+        prompt_name: str,
+        started: float,
+        usage: Any = None,
+        retries: int = 0,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Records latency, token usage, retries and errors of one completion call."""
+        labels = {"provider": self.provider, "model": self.model, "prompt": prompt_name or "unknown"}
+        LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, **labels)
+        if error is not None:
+            LLM_ERRORS.inc(error=type(error).__name__, **labels)
+            return
+        if retries:
+            LLM_RETRIES.inc(retries, **labels)
+        if usage is not None:
+            LLM_PROMPT_TOKENS.observe(usage.prompt_tokens or 0, **labels)
+            LLM_COMPLETION_TOKENS.observe(usage.completion_tokens or 0, **labels)
+
+
+def _parse_evaluation(response_str: str, reasked: bool = False) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Parses and validates one evaluation, returning it or why it is unusable.
+
+    The error payload of a failed API call is passed through as the result,
+    since re-asking would not help.
+    """
+    try:
+        payload, repaired = parse_json(response_str)
+        if isinstance(payload, dict) and "error" in payload and "score" not in payload:
+            return payload, None
+        evaluation = validate_evaluation(payload)
+    except ValueError as e:
+        LLM_OUTPUT_PARSES.inc(prompt="resume_evaluation", outcome="invalid" if reasked else "reasked")
+        return None, str(e)
+    if not reasked:
+        LLM_OUTPUT_PARSES.inc(prompt="resume_evaluation", outcome="repaired" if repaired else "valid")
+    return evaluation, None
+
+
+def _format_requirements(details: Dict) -> str:
+    """Renders the JD form fields as the bullet list the jd_generation prompt expects."""
+    return "\n".join(
+        f"- {key.replace('_', ' ').capitalize()}: {value}" for key, value in details.items() if value
+    )
@@ -1,72 +1,87 @@
-import json
-import groq
-from typing import Dict
-from src.llm.base import LLMClient
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from src.llm.base import ChatCompletionClient
+from src.llm.http import build_limits, get_shared_http_client
+from src.llm.rate_limiter import AdaptiveRateLimiter
 from src.prompts.manager import PromptManager
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import groq
+
 logger = get_logger(__name__)
 
-class GroqClient(LLMClient):
+class GroqClient(ChatCompletionClient):
     """LLM client for Groq API."""
 
-    def __init__(self, api_key: str, model: str, prompt_manager: PromptManager):
-        """Initializes the GroqClient."""
+    provider = "groq"
+    display_name = "Groq"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        prompt_manager: PromptManager,
+        pool_settings: Optional[Dict] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        """
+        Initializes the GroqClient.
+
+        The Groq SDK is imported, and its clients created, on the first call,
+        so building the client at startup costs no SDK import.
+        """
+        super().__init__(model, prompt_manager, rate_limiter)
         self.api_key = api_key
-        self.model = model
-        self.prompt_manager = prompt_manager
-        self.client = groq.Groq(api_key=self.api_key)
+        self.pool_settings = pool_settings
 
-    def _create_chat_completion(self, system_prompt: str, user_prompt: str, is_json: bool = False) -> str:
-        """Helper to create a chat completion."""
-        try:
-            response_format = {"type": "json_object"} if is_json else {"type": "text"}
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.7,
-                response_format=response_format,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            logger.error(f"Error calling Groq API: {e}")
-            return json.dumps({"error": "Failed to get response from Groq."}) if is_json else "Error: Could not get response."
+    @property
+    def retryable_errors(self) -> Tuple[type, ...]:
+        """Connection errors are retried like 429 and 5xx responses."""
+        import groq
 
-    def evaluate_resume(self, jd_text: str, resume_text: str) -> dict:
-        """Evaluates a resume against a job description using the Groq API."""
-        prompt = self.prompt_manager.format_prompt(
-            "resume_evaluation", jd_text=jd_text, resume_text=resume_text
-        )
-        if not prompt:
-            return {"error": "Could not load prompt."}
-        
-        response_str = self._create_chat_completion(prompt["system_prompt"], prompt["user_prompt"], is_json=True)
-        return json.loads(response_str)
+        return (groq.APIConnectionError,)
 
-    def generate_jd(self, details: Dict) -> str:
-        """Generates a job description using the Groq API."""
-        prompt = self.prompt_manager.format_prompt("jd_generation", **details)
-        if not prompt:
-            return "Error: Could not load prompt."
-        return self._create_chat_completion(prompt["system_prompt"], prompt["user_prompt"])
+    @cached_property
+    def client(self) -> "groq.Groq":
+        """The blocking SDK client."""
+        import groq
 
-    def generate_interview_email(self, candidate_name: str, role: str) -> str:
-        """Generates an interview email using the Groq API."""
-        prompt = self.prompt_manager.format_prompt(
-            "interview_email", candidate_name=candidate_name, role=role
-        )
-        if not prompt:
-            return "Error: Could not load prompt."
-        return self._create_chat_completion(prompt["system_prompt"], prompt["user_prompt"])
+        return groq.Groq(api_key=self.api_key)
 
-    def generate_rejection_email(self, candidate_name: str, role: str) -> str:
-        """Generates a rejection email using the Groq API."""
-        prompt = self.prompt_manager.format_prompt(
-            "rejection_email", candidate_name=candidate_name, role=role
+    @cached_property
+    def async_client(self) -> "groq.AsyncGroq":
+        """The async SDK client, drawing from the provider's shared connection pool."""
+        import groq
+
+        http_client = get_shared_http_client(
+            "groq", lambda: groq.DefaultAsyncHttpxClient(limits=build_limits(self.pool_settings))
         )
-        if not prompt:
-            return "Error: Could not load prompt."
-        return self._create_chat_completion(prompt["system_prompt"], prompt["user_prompt"])
+        async_client = groq.AsyncGroq(api_key=self.api_key, http_client=http_client)
+        if self.rate_limiter is not None:
+            # The rate limiter paces and retries async calls itself
+            async_client = async_client.with_options(max_retries=0)
+        return async_client
+
+    def _completion_kwargs(self, system_prompt: str, user_prompt: str, is_json: bool) -> dict:
+        """Builds the request arguments shared by the sync and async calls."""
+        response_format = {"type": "json_object"} if is_json else {"type": "text"}
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.7,
+            "response_format": response_format,
+        }
+
+    def _send(self, kwargs: dict) -> Tuple[Any, Any]:
+        """Sends a request with the blocking client."""
+        raw_response = self.client.chat.completions.with_raw_response.create(**kwargs)
+        return raw_response, raw_response.parse()
+
+    async def _asend(self, kwargs: dict) -> Tuple[Any, Any]:
+        """Sends a request without blocking the event loop."""
+        raw_response = await self.async_client.chat.completions.with_raw_response.create(**kwargs)
+        return raw_response, await raw_response.parse()
@@ -0,0 +1,49 @@
+import threading
+from typing import TYPE_CHECKING, Callable, Dict
+
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger(__name__)
+
+_lock = threading.Lock()
+_clients: Dict[str, "httpx.AsyncClient"] = {}
+
+
+def build_limits(pool_settings: Dict = None) -> "httpx.Limits":
+    """Builds connection pool limits from the ``ai.http_pool`` settings."""
+    import httpx
+
+    pool_settings = pool_settings or {}
+    return httpx.Limits(
+        max_connections=pool_settings.get("max_connections", 20),
+        max_keepalive_connections=pool_settings.get("max_keepalive_connections", 10),
+        keepalive_expiry=pool_settings.get("keepalive_expiry", 30.0),
+    )
+
+
+def get_shared_http_client(key: str, factory: Callable[[], "httpx.AsyncClient"]) -> "httpx.AsyncClient":
+    """
+    Returns the keep-alive HTTP client registered under ``key``.
+
+    The client is created by ``factory`` on first use and then shared by every
+    SDK client for the same provider, so they all draw from one pool.
+    """
+    with _lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = factory()
+            _clients[key] = client
+            logger.info(f"Created shared HTTP connection pool '{key}'")
+        return client
+
+
+async def close_shared_http_clients() -> None:
+    """Closes every shared async HTTP client (used on application shutdown)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        await client.aclose()
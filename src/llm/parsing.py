@@ -0,0 +1,150 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.utils.schemas import CandidateEvaluation
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Shape of one evaluation, quoted in re-asks so the model can fix its output
+EVALUATION_SCHEMA = '{"score": <integer 0-100>, "missing_skills": [<string>], "remarks": "<string>"}'
+
+# How many cut points of truncated output are tried, from the end backwards
+MAX_TRUNCATION_CANDIDATES = 8
+
+_DECODER = json.JSONDecoder()
+
+
+def parse_json(text: str) -> Tuple[Any, bool]:
+    """
+    Decodes LLM output as JSON, repairing it locally if needed.
+
+    Well-formed output takes the fast path through orjson. Otherwise the
+    JSON is cut out of Markdown fences and surrounding prose, trailing
+    commas are dropped, and output truncated mid-object is closed off after
+    its last complete value.
+
+    Returns:
+        The decoded value and whether it had to be repaired
+
+    Raises:
+        ValueError: If ``text`` is not a string (such as the null content of a
+            refusal) or no JSON value could be recovered
+    """
+    if not isinstance(text, str):
+        raise ValueError(f"Expected text output, got {type(text).__name__}.")
+    try:
+        return _loads(text), False
+    except ValueError:
+        pass
+
+    body = _extract_json(text)
+    if body is None:
+        raise ValueError("Output contains no JSON object.")
+    try:
+        return _DECODER.raw_decode(body)[0], True
+    except ValueError:
+        pass
+    for candidate in _repair_candidates(body):
+        try:
+            return _DECODER.raw_decode(candidate)[0], True
+        except ValueError:
+            continue
+    raise ValueError("Output is not valid JSON and could not be repaired.")
+
+
+def validate_evaluation(payload: Any) -> Dict[str, Any]:
+    """
+    Validates one evaluation against ``CandidateEvaluation``, coercing common drift.
+
+    Raises:
+        ValueError: If the payload is not an object or lacks a usable field
+    """
+    if not isinstance(payload, dict):
+        raise ValueError(f"Expected a JSON object, got {type(payload).__name__}.")
+    try:
+        return CandidateEvaluation.model_validate(payload).model_dump()
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'value'}: {error['msg']}" for error in e.errors()
+        )
+        raise ValueError(f"Evaluation does not match the schema: {problems}") from None
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """Returns the text from the first '{' or '[', inside a Markdown fence if there is one."""
+    fence = text.find("```")
+    if fence != -1:
+        start = text.find("\n", fence)
+        end = text.find("```", start + 1) if start != -1 else -1
+        text = text[start + 1:end] if end != -1 else text[start + 1:]
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    return text[min(starts):].strip() if starts else None
+
+
+def _repair_candidates(body: str) -> List[str]:
+    """
+    Returns repaired versions of malformed JSON to try in order.
+
+    Trailing commas are removed on the way. If the text ends inside an
+    object or array right after a complete value, the first candidate
+    closes everything that is open. A trailing number or literal, or an
+    unterminated string, may itself be cut short (a score of 95 truncated
+    to 9), so it is never kept: the other candidates cut the text back to each earlier top-level
+    or nested comma, dropping the partial member, and close it there.
+    """
+    cleaned: List[str] = []
+    stack: List[str] = []
+    cut_points: List[Tuple[int, str]] = []
+    in_string = escaped = False
+    for char in body:
+        if in_string:
+            cleaned.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            _drop_trailing_comma(cleaned)
+            if stack:
+                stack.pop()
+        elif char == ",":
+            cut_points.append((len(cleaned), "".join(reversed(stack))))
+        cleaned.append(char)
+        if not stack and char in "}]":
+            break
+
+    text = "".join(cleaned)
+    if not stack and not in_string:
+        return [text]
+    candidates = []
+    if not in_string and text.rstrip()[-1:] in ("}", "]", ",", '"'):
+        # Ends after a closed container, a string or a comma-terminated value
+        tail = list(text)
+        _drop_trailing_comma(tail)
+        candidates.append("".join(tail) + "".join(reversed(stack)))
+    for index, closers in reversed(cut_points[-MAX_TRUNCATION_CANDIDATES:]):
+        candidates.append(text[:index] + closers)
+    return candidates
+
+
+def _drop_trailing_comma(chars: List[str]) -> None:
+    """Removes a comma (and whitespace after it) from the end of ``chars``."""
+    index = len(chars)
+    while index and chars[index - 1].isspace():
+        index -= 1
+    if index and chars[index - 1] == ",":
+        del chars[index - 1:]
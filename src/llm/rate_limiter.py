@@ -0,0 +1,271 @@
+import asyncio
+import random
+import re
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+LIMITER_CONCURRENCY = REGISTRY.gauge(
+    "llm_concurrency_limit", "Adaptive in-flight request limit per LLM client.", ("limiter",)
+)
+LIMITER_TOKENS_PER_MINUTE = REGISTRY.gauge(
+    "llm_tokens_per_minute_limit", "Adaptive tokens-per-minute budget per LLM client (0 = unlimited).", ("limiter",)
+)
+LIMITER_THROTTLED = REGISTRY.counter(
+    "llm_throttled", "Requests rejected by the provider with 429.", ("limiter",)
+)
+LIMITER_WAIT_SECONDS = REGISTRY.histogram(
+    "llm_limiter_wait_seconds", "Time requests waited for the adaptive limiter.", ("limiter",)
+)
+
+# Width of the sliding window for the tokens-per-minute budget
+_WINDOW_SECONDS = 60.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parses rate-limit reset durations such as ``"1s"``, ``"6m0s"`` or ``"20ms"`` into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Returns the delay requested by ``retry-after-ms`` or ``retry-after``, in seconds."""
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD limiter for one provider account, driven by its rate-limit signals.
+
+    Requests wait for a slot under an in-flight limit and a tokens-per-minute
+    budget. Each success raises the in-flight limit additively (about one per
+    ``limit`` successes) and each 429 cuts both limits multiplicatively, at
+    most once per ``decrease_interval_seconds`` so one burst of 429s counts
+    as one signal. ``Retry-After`` pauses every request of the limiter, and
+    the ``x-ratelimit-*`` headers cap the budget at the provider's own
+    limits and hold requests back until exhausted quotas reset. Throttled
+    and transient failures are retried up to ``max_retries`` times with
+    jittered exponential backoff.
+
+    The limiter is meant for one event loop at a time; its state is only
+    touched from coroutines and callbacks on that loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        decrease_factor: float = 0.5,
+        decrease_interval_seconds: float = 1.0,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        base_backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+    ):
+        """
+        Initializes the AdaptiveRateLimiter.
+
+        A ``tokens_per_minute`` of None leaves the token budget unlimited until
+        the provider reports its own through ``x-ratelimit-limit-tokens``.
+        """
+        self.name = name
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.limit = float(min(max(initial_concurrency, self.min_concurrency), self.max_concurrency))
+        self.decrease_factor = decrease_factor
+        self.decrease_interval_seconds = decrease_interval_seconds
+        self.tokens_per_minute = tokens_per_minute
+        self.provider_tokens_per_minute: Optional[float] = None
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._remaining: Dict[str, Tuple[float, float]] = {}
+        self._last_decrease = float("-inf")
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._waiters: List[asyncio.Future] = []
+        self._publish()
+
+    def _publish(self) -> None:
+        """Exports the current limits as gauges."""
+        LIMITER_CONCURRENCY.set(self.limit, limiter=self.name)
+        LIMITER_TOKENS_PER_MINUTE.set(self.tokens_per_minute or 0, limiter=self.name)
+
+    def _wait_time(self, now: float, tokens: int) -> Optional[float]:
+        """Returns how long a request must wait (None: until a slot frees up), or 0 if it can go."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        for kind, needed in (("requests", 1), ("tokens", tokens)):
+            remaining, reset_at = self._remaining.get(kind, (None, 0.0))
+            if remaining is not None and remaining < needed and now < reset_at:
+                return reset_at - now
+        if self.in_flight >= int(self.limit):
+            return None
+
+        while self._window and self._window[0][0] <= now - _WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
+        if self.tokens_per_minute and self._window and self._window_tokens + tokens > self.tokens_per_minute:
+            return self._window[0][0] + _WINDOW_SECONDS - now
+        return 0.0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Waits until a request estimated at ``tokens`` prompt tokens may be sent."""
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            wait = self._wait_time(now, tokens)
+            if wait == 0:
+                break
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self.in_flight += 1
+        self._window.append((now, tokens))
+        self._window_tokens += tokens
+        for kind, needed in (("requests", 1), ("tokens", tokens)):
+            remaining, reset_at = self._remaining.get(kind, (None, 0.0))
+            if remaining is not None:
+                self._remaining[kind] = (remaining - needed, reset_at)
+        LIMITER_WAIT_SECONDS.observe(now - started, limiter=self.name)
+
+    def release(
+        self,
+        outcome: str = "success",
+        headers: Optional[Mapping[str, str]] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Frees a slot and adapts the limits to the request's outcome.
+
+        ``outcome`` is "success" (additive increase), "throttled" (a 429:
+        multiplicative decrease and a pause for ``retry_after`` seconds) or
+        anything else, which only frees the slot.
+        """
+        now = time.monotonic()
+        self.in_flight = max(0, self.in_flight - 1)
+        if headers:
+            self._apply_headers(headers, now)
+        if outcome == "throttled":
+            self._decrease(now)
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+        elif outcome == "success":
+            self._increase()
+        self._publish()
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Returns how long to sleep before retry ``attempt`` (0-based), honouring Retry-After."""
+        delay = backoff_delay(attempt, self.base_backoff_seconds, self.max_backoff_seconds)
+        return max(delay, retry_after or 0.0)
+
+    def stats(self) -> dict:
+        """Returns the current limits for diagnostics."""
+        return {
+            "limiter": self.name,
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "tokens_per_minute": self.tokens_per_minute,
+            "provider_tokens_per_minute": self.provider_tokens_per_minute,
+            "paused_seconds": max(0.0, round(self.paused_until - time.monotonic(), 3)),
+        }
+
+    def _increase(self) -> None:
+        """Additive increase: about one more slot per ``limit`` successes, and a slower TPM climb."""
+        self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        if self.tokens_per_minute:
+            ceiling = self.provider_tokens_per_minute or float("inf")
+            self.tokens_per_minute = min(ceiling, self.tokens_per_minute * (1 + 1 / (10 * self.limit)))
+
+    def _decrease(self, now: float) -> None:
+        """Multiplicative decrease, at most once per decrease interval."""
+        LIMITER_THROTTLED.inc(limiter=self.name)
+        if now - self._last_decrease < self.decrease_interval_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+        if self.tokens_per_minute:
+            self.tokens_per_minute *= self.decrease_factor
+        logger.warning(
+            f"Rate limited on {self.name}: concurrency limit {self.limit:.1f}, "
+            f"tokens per minute {self.tokens_per_minute or 'unlimited'}"
+        )
+
+    def _apply_headers(self, headers: Mapping[str, str], now: float) -> None:
+        """Tracks the provider's limits and remaining quota from ``x-ratelimit-*`` headers."""
+        limit_tokens = headers.get("x-ratelimit-limit-tokens")
+        if limit_tokens:
+            try:
+                self.provider_tokens_per_minute = float(limit_tokens)
+            except ValueError:
+                pass
+            if self.provider_tokens_per_minute:
+                self.tokens_per_minute = min(
+                    self.tokens_per_minute or self.provider_tokens_per_minute, self.provider_tokens_per_minute
+                )
+
+        for kind in ("requests", "tokens"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            if remaining is None or reset is None:
+                continue
+            try:
+                self._remaining[kind] = (float(remaining), now + reset)
+            except ValueError:
+                continue
+
+
+def backoff_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Returns a full-jitter exponential backoff delay for a retry attempt (0-based)."""
+    return random.uniform(0, min(max_seconds, base_seconds * 2 ** attempt))
@@ -0,0 +1,254 @@
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from src.llm.base import ChatCompletionClient, CompletionClient
+from src.prompts.manager import PromptManager
+from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+ROUTER_REQUESTS = REGISTRY.counter(
+    "llm_router_requests",
+    "Backend calls made by the routing client, by outcome (success, error, client_error, cancelled).",
+    ("backend", "outcome"),
+)
+ROUTER_HEDGES = REGISTRY.counter(
+    "llm_router_hedges",
+    "Hedged duplicate requests sent because the first backend was slow, by whether they won.",
+    ("backend", "won"),
+)
+ROUTER_FAILOVERS = REGISTRY.counter(
+    "llm_router_failovers", "Calls moved to another backend after a backend failure.", ("from_backend",)
+)
+
+# Successful call latencies kept per backend for the hedging percentile
+_LATENCY_WINDOW = 200
+
+
+class Backend:
+    """One routed client (a provider, model and API key) with its health and latency history."""
+
+    def __init__(self, name: str, client: ChatCompletionClient, weight: float = 1.0):
+        """Initializes the Backend."""
+        self.name = name
+        self.client = client
+        self.weight = max(weight, 0.01)
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def available(self, now: float) -> bool:
+        """Returns whether the backend is outside its failure cooldown."""
+        return now >= self.cooldown_until
+
+    def latency_percentile(self, percentile: float, min_samples: int) -> Optional[float]:
+        """Returns the given latency percentile, or None until enough calls succeeded."""
+        if len(self.latencies) < min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+class RoutingLLMClient(CompletionClient):
+    """
+    Routes chat completions across several backends (providers and API keys).
+
+    Each call goes to the least-loaded healthy backend relative to its weight.
+    If it has not answered within the backend's ``hedge_percentile`` latency
+    (or ``hedge_after_seconds`` until enough samples exist), a duplicate is
+    sent to the next backend and whichever answers first wins. Backends that
+    are throttled (429), failing (5xx) or unreachable are put in a cooldown and
+    the call fails over to the remaining ones; any other error, such as a 400
+    for a prompt over the context length, would fail the same way everywhere
+    and is raised straight away.
+    """
+
+    provider = "router"
+    display_name = "routed LLM"
+
+    def __init__(
+        self,
+        backends: List[Backend],
+        prompt_manager: PromptManager,
+        hedge_percentile: float = 95,
+        hedge_min_samples: int = 20,
+        hedge_after_seconds: Optional[float] = 10,
+        failure_cooldown_seconds: float = 30,
+    ):
+        """Initializes the RoutingLLMClient; a ``hedge_after_seconds`` of None disables hedging."""
+        if not backends:
+            raise ValueError("The routing client needs at least one backend.")
+        model = "+".join(sorted({backend.client.model for backend in backends}))
+        super().__init__(model, prompt_manager)
+        self.backends = backends
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_after_seconds = hedge_after_seconds
+        self.failure_cooldown_seconds = failure_cooldown_seconds
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+
+    def _ranked_backends(self) -> List[Backend]:
+        """Orders backends by health, then load relative to weight, rotating ties."""
+        now = time.monotonic()
+        offset = next(self._round_robin)
+        count = len(self.backends)
+        with self._lock:
+            return sorted(
+                self.backends,
+                key=lambda backend: (
+                    not backend.available(now),
+                    backend.in_flight / backend.weight,
+                    (self.backends.index(backend) - offset) % count,
+                ),
+            )
+
+    def _hedge_delay(self, backend: Backend) -> Optional[float]:
+        """Returns how long to wait on a backend before sending a hedged duplicate."""
+        if self.hedge_after_seconds is None or len(self.backends) < 2:
+            return None
+        observed = backend.latency_percentile(self.hedge_percentile, self.hedge_min_samples)
+        return observed if observed is not None else self.hedge_after_seconds
+
+    @staticmethod
+    def _is_backend_failure(backend: Backend, error: BaseException) -> bool:
+        """Returns whether an error is the backend's fault (429, 5xx, timeout, connection) rather than the request's."""
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+        return isinstance(error, (TimeoutError, ConnectionError) + tuple(backend.client.retryable_errors))
+
+    def _mark_failed(self, backend: Backend, error: Exception) -> None:
+        """Puts a backend in cooldown after a backend failure; client errors are only counted."""
+        if not self._is_backend_failure(backend, error):
+            ROUTER_REQUESTS.inc(backend=backend.name, outcome="client_error")
+            return
+        backend.cooldown_until = time.monotonic() + self.failure_cooldown_seconds
+        ROUTER_REQUESTS.inc(backend=backend.name, outcome="error")
+        logger.warning(f"LLM backend {backend.name} failed: {error}")
+
+    def _mark_succeeded(self, backend: Backend, started: float) -> None:
+        """Records a successful call's latency and clears any cooldown."""
+        backend.latencies.append(time.perf_counter() - started)
+        backend.cooldown_until = 0.0
+        ROUTER_REQUESTS.inc(backend=backend.name, outcome="success")
+
+    async def _call(self, backend: Backend, system_prompt: str, user_prompt: str, is_json: bool, prompt_name: str) -> str:
+        """Calls one backend, tracking its in-flight count, latency and errors."""
+        started = time.perf_counter()
+        with self._lock:
+            backend.in_flight += 1
+        try:
+            content = await backend.client._acomplete(system_prompt, user_prompt, is_json, prompt_name)
+        except asyncio.CancelledError:
+            ROUTER_REQUESTS.inc(backend=backend.name, outcome="cancelled")
+            raise
+        except Exception as e:
+            self._mark_failed(backend, e)
+            raise
+        finally:
+            with self._lock:
+                backend.in_flight -= 1
+        self._mark_succeeded(backend, started)
+        return content
+
+    async def _acomplete(
+        self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = ""
+    ) -> str:
+        """Creates a chat completion with hedging and failover across backends."""
+        candidates = self._ranked_backends()
+        pending: Dict[asyncio.Task, Backend] = {}
+        hedged: Dict[asyncio.Task, Backend] = {}
+        last_error: Optional[Exception] = None
+
+        def launch(is_hedge: bool = False) -> None:
+            backend = candidates.pop(0)
+            task = asyncio.create_task(
+                self._call(backend, system_prompt, user_prompt, is_json, prompt_name)
+            )
+            pending[task] = backend
+            if is_hedge:
+                hedged[task] = backend
+
+        launch()
+        try:
+            while pending:
+                delay = None
+                if candidates and len(pending) == 1:
+                    delay = self._hedge_delay(next(iter(pending.values())))
+                done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # The request is slower than usual: race a duplicate on the next backend
+                    launch(is_hedge=True)
+                    continue
+
+                result, succeeded = None, False
+                for task in done:
+                    backend = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        if not self._is_backend_failure(backend, error):
+                            # Another backend would reject the same request
+                            raise error
+                        last_error = error
+                        if candidates:
+                            ROUTER_FAILOVERS.inc(from_backend=backend.name)
+                    elif not succeeded:
+                        result, succeeded = task.result(), True
+                        if task in hedged:
+                            ROUTER_HEDGES.inc(backend=backend.name, won="true")
+                if succeeded:
+                    for task, backend in pending.items():
+                        if task in hedged:
+                            ROUTER_HEDGES.inc(backend=backend.name, won="false")
+                    return result
+
+                if not pending and candidates:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise last_error if last_error is not None else RuntimeError("No LLM backend available.")
+
+    def _complete(self, system_prompt: str, user_prompt: str, is_json: bool = False, prompt_name: str = "") -> str:
+        """Creates a chat completion with the blocking clients, failing over on backend failures."""
+        last_error: Optional[Exception] = None
+        for backend in self._ranked_backends():
+            if last_error is not None:
+                ROUTER_FAILOVERS.inc(from_backend=previous.name)
+            started = time.perf_counter()
+            try:
+                content = backend.client._complete(system_prompt, user_prompt, is_json, prompt_name)
+            except Exception as e:
+                self._mark_failed(backend, e)
+                if not self._is_backend_failure(backend, e):
+                    raise
+                last_error, previous = e, backend
+                continue
+            self._mark_succeeded(backend, started)
+            return content
+        raise last_error if last_error is not None else RuntimeError("No LLM backend available.")
+
+    def stats(self) -> List[dict]:
+        """Returns per-backend routing state for diagnostics."""
+        now = time.monotonic()
+        return [
+            {
+                "backend": backend.name,
+                "provider": backend.client.provider,
+                "model": backend.client.model,
+                "weight": backend.weight,
+                "in_flight": backend.in_flight,
+                "healthy": backend.available(now),
+                "p50_seconds": backend.latency_percentile(50, 1),
+                "p95_seconds": backend.latency_percentile(95, 1),
+                "rate_limit": backend.client.rate_limiter.stats() if backend.client.rate_limiter else None,
+            }
+            for backend in self.backends
+        ]
@@ -1,31 +1,167 @@
+import hashlib
+import json
+import os
+import string
+import threading
+import time
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple, Union
 
 from src.utils.logger import get_logger
+from src.utils.metrics import REGISTRY
 
 logger = get_logger(__name__)
 
+PROMPT_RELOADS = REGISTRY.counter(
+    "prompt_reloads", "Reloads of the prompts file after it changed, by outcome.", ("outcome",)
+)
+
+# Variables each caller passes to its prompt; templates of these prompts may
+# only use these fields, which is checked when the file is loaded
+PROMPT_FIELDS: Dict[str, FrozenSet[str]] = {
+    "resume_evaluation": frozenset({"jd_text", "resume_text"}),
+    "resume_batch_evaluation": frozenset({"jd_text", "resumes"}),
+    "jd_digest": frozenset({"jd_text"}),
+    "output_repair": frozenset({"schema", "output", "error"}),
+    "jd_generation": frozenset({"requirements"}),
+    "interview_email": frozenset({"candidate_name", "role"}),
+    "rejection_email": frozenset({"candidate_name", "role"}),
+}
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """A format string parsed once into literal text and the fields to substitute."""
+
+    def __init__(self, template: str):
+        """
+        Parses the template.
+
+        Raises:
+            ValueError: If the template is malformed or uses positional,
+                attribute or index fields
+        """
+        self.parts: List[Tuple[str, Optional[str], str, Optional[str]]] = []
+        for literal, field, format_spec, conversion in _FORMATTER.parse(template):
+            if field is not None and (not field.isidentifier() or "{" in (format_spec or "")):
+                raise ValueError(f"Unsupported field '{{{field}}}'; use plain named fields")
+            self.parts.append((literal, field, format_spec or "", conversion))
+        self.fields: FrozenSet[str] = frozenset(field for _, field, _, _ in self.parts if field is not None)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """Substitutes the values; the caller checks that every field is present."""
+        pieces = []
+        for literal, field, format_spec, conversion in self.parts:
+            pieces.append(literal)
+            if field is None:
+                continue
+            value = values[field]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            pieces.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(pieces)
+
+
+class CompiledPrompt:
+    """One prompt (a string or a dict of strings) with its templates compiled and a version id."""
+
+    def __init__(self, name: str, prompt: Union[str, Dict[str, Any]]):
+        """
+        Compiles the prompt's templates and validates their fields.
+
+        Raises:
+            ValueError: If a template is malformed, uses a field its caller does
+                not pass, or the prompt is neither a string nor a dict
+        """
+        self.name = name
+        self.version = hashlib.sha256(json.dumps(prompt, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        if isinstance(prompt, str):
+            self.templates: Dict[Optional[str], Any] = {None: self._compile(prompt, None)}
+        elif isinstance(prompt, dict):
+            self.templates = {
+                key: self._compile(value, key) if isinstance(value, str) else value
+                for key, value in prompt.items()
+            }
+        else:
+            raise ValueError(f"Invalid prompt format for '{name}'. Expected string or dict, got {type(prompt)}")
+
+        self.fields: FrozenSet[str] = frozenset().union(
+            *(template.fields for template in self.templates.values() if isinstance(template, CompiledTemplate))
+        )
+        allowed = PROMPT_FIELDS.get(name)
+        if allowed is not None and not self.fields <= allowed:
+            unknown = ", ".join(sorted(self.fields - allowed))
+            raise ValueError(f"Prompt '{name}' uses variables its caller does not provide: {unknown}")
+
+    def _compile(self, template: str, key: Optional[str]) -> CompiledTemplate:
+        """Compiles one template, naming it in the error if it is malformed."""
+        try:
+            return CompiledTemplate(template)
+        except ValueError as e:
+            location = f"{self.name}.{key}" if key else self.name
+            raise ValueError(f"Invalid template in prompt '{location}': {e}") from e
+
+    def format(self, **kwargs) -> Union[str, Dict[str, Any]]:
+        """Renders the prompt; raises ValueError if a required variable is missing."""
+        missing = self.fields - kwargs.keys()
+        if missing:
+            raise ValueError(f"Missing required variable in prompt '{self.name}': {', '.join(sorted(missing))}")
+        if None in self.templates:
+            return self.templates[None].render(kwargs)
+        return {
+            key: template.render(kwargs) if isinstance(template, CompiledTemplate) else template
+            for key, template in self.templates.items()
+        }
+
+
 class PromptManager:
-    """Manages loading, parsing, and formatting of prompts from a YAML file."""
+    """
+    Manages loading, compiling and formatting of prompts from a YAML file.
+
+    Templates are compiled and validated once per load, and each prompt gets a
+    content hash as its version. When ``reload_interval`` is set, callers check
+    the file's mtime at most that often and a changed file is reloaded on a
+    background thread; callers keep the previous prompts until the new ones
+    compiled, and an invalid edit is logged and ignored.
+    """
 
-    def __init__(self, prompts_file: Path):
+    def __init__(self, prompts_file: Path, reload_interval: Optional[float] = None):
         """
         Initializes the PromptManager with the path to the prompts file.
-        
+
         Args:
             prompts_file: Path to the YAML file containing prompt templates
+            reload_interval: Seconds between mtime checks; None disables hot reload
         """
         self.prompts_file = prompts_file
-        self.prompts = self._load_prompts()
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._reloading = False
+        self._next_check = time.monotonic() + (reload_interval or 0)
+        self._mtime = self._stat_mtime()
+        self.prompts, self.compiled = self._compile_prompts(self._load_prompts())
+
+    @property
+    def versions(self) -> Dict[str, str]:
+        """Returns the version id of every loaded prompt."""
+        return {name: prompt.version for name, prompt in self.compiled.items()}
+
+    def _stat_mtime(self) -> Optional[int]:
+        """Returns the prompts file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self.prompts_file).st_mtime_ns
+        except OSError:
+            return None
 
     def _load_prompts(self) -> Dict[str, Any]:
         """
         Loads prompts from the YAML file.
-        
+
         Returns:
             Dictionary of prompt templates
-            
+
         Raises:
             FileNotFoundError: If the prompts file doesn't exist
             ValueError: If there's an error parsing the YAML
@@ -45,50 +181,94 @@ class PromptManager:
             logger.error(f"Unexpected error loading prompts: {e}")
             raise
 
+    @staticmethod
+    def _compile_prompts(prompts: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, CompiledPrompt]]:
+        """
+        Compiles every prompt.
+
+        Raises:
+            ValueError: If any prompt is invalid
+        """
+        compiled = {name: CompiledPrompt(name, prompt) for name, prompt in prompts.items()}
+        missing = sorted(PROMPT_FIELDS.keys() - compiled.keys())
+        if missing:
+            logger.warning(f"Prompts file has no template for: {', '.join(missing)}")
+        return prompts, compiled
+
+    def _maybe_reload(self) -> None:
+        """Starts a background reload if the check interval elapsed and the file changed."""
+        if self.reload_interval is None or time.monotonic() < self._next_check:
+            return
+        with self._lock:
+            if self._reloading or time.monotonic() < self._next_check:
+                return
+            self._next_check = time.monotonic() + self.reload_interval
+            mtime = self._stat_mtime()
+            if mtime is None or mtime == self._mtime:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(mtime,), name="prompt-reload", daemon=True).start()
+
+    def _reload(self, mtime: int) -> None:
+        """Loads and compiles the changed file, swapping it in only if every prompt is valid."""
+        try:
+            prompts, compiled = self._compile_prompts(self._load_prompts())
+        except Exception as e:
+            logger.error(f"Keeping the current prompts; reloading {self.prompts_file} failed: {e}")
+            PROMPT_RELOADS.inc(outcome="error")
+        else:
+            changed = sorted(
+                name for name, prompt in compiled.items()
+                if self.compiled.get(name) is None or self.compiled[name].version != prompt.version
+            )
+            # Callers only read self.compiled, so they see either the old or the new prompts
+            self.prompts, self.compiled = prompts, compiled
+            logger.info(f"Reloaded prompts from {self.prompts_file}; changed: {', '.join(changed) or 'none'}")
+            PROMPT_RELOADS.inc(outcome="success")
+        finally:
+            with self._lock:
+                self._mtime = mtime
+                self._reloading = False
+
     def get_prompt(self, prompt_name: str, **kwargs) -> Union[str, Dict[str, Any]]:
         """
         Gets a specific prompt by name and formats it with the given kwargs.
-        
+
         Args:
             prompt_name: Name of the prompt template to retrieve
             **kwargs: Variables to format into the prompt
-            
+
         Returns:
             Formatted prompt as a string or dictionary
-            
+
         Raises:
             ValueError: If no prompts are loaded or required variables are missing
             KeyError: If the requested prompt doesn't exist
         """
-        if not self.prompts:
+        self._maybe_reload()
+        compiled = self.compiled
+        if not compiled:
             raise ValueError("No prompts loaded. Check the prompts file path and format.")
-        
-        if prompt_name not in self.prompts:
-            available = ", ".join(self.prompts.keys())
+
+        if prompt_name not in compiled:
+            available = ", ".join(compiled.keys())
             raise KeyError(f"Prompt '{prompt_name}' not found. Available prompts: {available}")
-        
-        prompt = self.prompts[prompt_name]
-        
-        # Handle both string and dictionary prompts
-        if isinstance(prompt, str):
-            try:
-                return prompt.format(**kwargs)
-            except KeyError as e:
-                raise ValueError(f"Missing required variable in prompt '{prompt_name}': {e}") from e
-        elif isinstance(prompt, dict):
-            # For system/user prompt format
-            formatted = {}
-            for key, value in prompt.items():
-                if isinstance(value, str):
-                    try:
-                        formatted[key] = value.format(**kwargs)
-                    except KeyError as e:
-                        raise ValueError(f"Missing required variable in prompt '{prompt_name}.{key}': {e}") from e
-                else:
-                    formatted[key] = value
-            return formatted
-        else:
-            raise ValueError(f"Invalid prompt format for '{prompt_name}'. Expected string or dict, got {type(prompt)}")
-    
+
+        return compiled[prompt_name].format(**kwargs)
+
+    def get_version(self, prompt_name: str) -> str:
+        """
+        Returns a short content hash identifying the current version of a prompt.
+
+        Args:
+            prompt_name: Name of the prompt template
+
+        Returns:
+            Hash of the template, or an empty string if the prompt doesn't exist
+        """
+        self._maybe_reload()
+        prompt = self.compiled.get(prompt_name)
+        return prompt.version if prompt is not None else ""
+
     # Alias for backward compatibility
     format_prompt = get_prompt
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded LRU cache with an optional time-to-live.
+
+    Hit and miss counts are kept so callers can report cache effectiveness.
+    """
+
+    def __init__(self, max_items: int = 256, ttl_seconds: Optional[float] = None):
+        """
+        Initializes the LRUCache.
+
+        Args:
+            max_items: Maximum number of entries kept before the least recently
+                used one is evicted
+            ttl_seconds: Optional lifetime of an entry; ``None`` keeps entries
+                until they are evicted
+        """
+        self.max_items = max(1, max_items)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for ``key`` or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores ``value`` under ``key``, evicting the oldest entries if needed."""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent async calls that share a key.
+
+    While a call for a key is in flight, further callers with the same key
+    await its result instead of starting a duplicate call. The call runs in
+    its own task, so cancelling any caller (the first one included) never
+    cancels the shared work or the other callers waiting on it.
+    """
+
+    def __init__(self):
+        """Initializes the SingleFlight."""
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, "asyncio.Task"] = {}
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the result of ``compute``, sharing it with concurrent callers of ``key``."""
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(compute())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task") -> None:
+        """Forgets a finished call, marking its exception as retrieved if every caller left."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,16 @@
+import os
+import yaml
+from pathlib import Path
+from typing import Dict, Any
+
+# Build a robust path to the project root
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+# RECRUITMENT_SETTINGS_PATH points the app at another settings file (e.g. for benchmarks)
+SETTINGS_PATH = Path(os.getenv("RECRUITMENT_SETTINGS_PATH", BASE_DIR / "config/settings.yaml"))
+PROMPTS_PATH = BASE_DIR / "config/prompts.yaml"
+
+
+def load_settings(settings_path: Path = SETTINGS_PATH) -> Dict[str, Any]:
+    """Loads the application settings from the YAML settings file."""
+    with open(settings_path, "r") as f:
+        return yaml.safe_load(f) or {}
@@ -0,0 +1,58 @@
+import re
+
+from pydantic import BaseModel, field_validator
+from typing import Any, List
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+class CandidateEvaluation(BaseModel):
+    """
+    Pydantic model for the evaluation the LLM returns for one candidate.
+
+    Common drift in model output is coerced rather than rejected: a score
+    given as a string ("85", "85/100") or a float, a comma-separated string
+    of missing skills, and null remarks. Missing ``missing_skills`` and
+    ``remarks`` (e.g. output truncated before them) default to empty.
+    """
+    score: int
+    missing_skills: List[str] = []
+    remarks: str = ""
+
+    @field_validator("score", mode="before")
+    @classmethod
+    def _coerce_score(cls, value: Any) -> Any:
+        """Reads the first number of a string score and clamps the score to 0-100."""
+        if isinstance(value, bool):
+            raise ValueError("score must be a number")
+        if isinstance(value, str):
+            match = _NUMBER.search(value)
+            if match is None:
+                raise ValueError(f"score is not a number: {value!r}")
+            value = float(match.group())
+        if isinstance(value, (int, float)):
+            return min(100, max(0, int(round(value))))
+        return value
+
+    @field_validator("missing_skills", mode="before")
+    @classmethod
+    def _coerce_missing_skills(cls, value: Any) -> Any:
+        """Accepts null, a comma- or newline-separated string, or a list of scalars."""
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = re.split(r"[,\n;]", value)
+        if isinstance(value, list):
+            skills = (str(skill).strip().lstrip("-*• ").strip() for skill in value if skill is not None)
+            return [skill for skill in skills if skill]
+        return value
+
+    @field_validator("remarks", mode="before")
+    @classmethod
+    def _coerce_remarks(cls, value: Any) -> Any:
+        """Accepts null or a list of sentences as remarks."""
+        if value is None:
+            return ""
+        if isinstance(value, list):
+            return " ".join(str(part) for part in value)
+        return value
@@ -18,6 +18,192 @@ function openTab(evt, tabName) {
     evt.currentTarget.classList.add("active");
 }
 
+// Small helper to create an element with optional class and text content
+function createElement(tag, className, text) {
+    const element = document.createElement(tag);
+    if (className) {
+        element.className = className;
+    }
+    if (text !== undefined && text !== null) {
+        element.textContent = text;
+    }
+    return element;
+}
+
+// Builds a candidate card with the same markup as the server-rendered template
+function createCandidateCard(candidate, isTop) {
+    const card = createElement("div", "candidate-card" + (isTop ? " top-candidate" : ""));
+    card.appendChild(createElement("h3", null, candidate.filename || "Job Description"));
+
+    if (candidate.error) {
+        const error = createElement("p", "error");
+        error.appendChild(createElement("strong", null, "Error:"));
+        error.appendChild(document.createTextNode(" " + candidate.error));
+        card.appendChild(error);
+        return card;
+    }
+
+    const score = createElement("p");
+    score.appendChild(createElement("strong", null, "Score:"));
+    score.appendChild(document.createTextNode(" "));
+    score.appendChild(createElement("span", "score", candidate.score));
+    card.appendChild(score);
+
+    const skillsLabel = createElement("p");
+    skillsLabel.appendChild(createElement("strong", null, "Missing Skills:"));
+    card.appendChild(skillsLabel);
+    const skills = createElement("ul");
+    (candidate.missing_skills || []).forEach((skill) => skills.appendChild(createElement("li", null, skill)));
+    card.appendChild(skills);
+
+    const remarks = createElement("p");
+    remarks.appendChild(createElement("strong", null, "Remarks:"));
+    remarks.appendChild(document.createTextNode(" " + (candidate.remarks || "")));
+    card.appendChild(remarks);
+    return card;
+}
+
+function createEmailCard(title, body) {
+    const card = createElement("div", "email-card");
+    card.appendChild(createElement("h3", null, title));
+    card.appendChild(createElement("pre", null, body));
+    return card;
+}
+
+// Builds the email section; emails are only generated when the recruiter asks for them
+function createEmailSection(filename, jobTitle) {
+    const section = createElement("div", "email-section");
+    section.dataset.emailAction = "/emails";
+    section.dataset.jobTitle = jobTitle || "";
+    section.dataset.candidateName = filename.split(".")[0];
+    section.dataset.candidateLabel = filename;
+    section.appendChild(createElement("h2", null, "Candidate Emails"));
+    const button = createElement("button", "email-button", "Generate Emails");
+    button.type = "button";
+    section.appendChild(button);
+    section.appendChild(createElement("div", "results-container email-results"));
+    return section;
+}
+
+// Requests the interview and rejection emails for the top candidate in one call
+async function requestEmails(section) {
+    const button = section.querySelector(".email-button");
+    const container = section.querySelector(".email-results");
+    const body = new FormData();
+    body.append("email_types", "interview");
+    body.append("email_types", "rejection");
+    body.append("job_title", section.dataset.jobTitle);
+    body.append("candidate_name", section.dataset.candidateName);
+
+    button.disabled = true;
+    button.textContent = "Generating emails...";
+    try {
+        const response = await fetch(section.dataset.emailAction, { method: "POST", body: body });
+        if (!response.ok) {
+            throw new Error("Email request failed with status " + response.status);
+        }
+        const { emails } = await response.json();
+        container.replaceChildren(
+            createEmailCard("Interview Invitation for " + section.dataset.candidateLabel, emails.interview),
+            createEmailCard("Rejection Email (Template)", emails.rejection)
+        );
+        button.remove();
+    } catch (error) {
+        container.replaceChildren(createElement("p", "error", error.message));
+        button.disabled = false;
+        button.textContent = "Generate Emails";
+    }
+}
+
+// Renders the running top-N ranking shown while the batch is still being scored
+function renderRanking(rankingList, ranking) {
+    rankingList.replaceChildren();
+    ranking.forEach((entry) => {
+        rankingList.appendChild(createElement("li", null, entry.filename + " (" + entry.score + ")"));
+    });
+}
+
+// Renders the final ranked results once the stream is done
+function renderFinalResults(resultsWrapper, event, jobTitle) {
+    resultsWrapper.replaceChildren();
+
+    const section = createElement("div", "results-section");
+    section.appendChild(createElement("h2", null, "Evaluation Results"));
+    const container = createElement("div", "results-container");
+    event.results.forEach((candidate, index) => container.appendChild(createCandidateCard(candidate, index === 0)));
+    section.appendChild(container);
+    resultsWrapper.appendChild(section);
+
+    const top = event.results[0];
+    if (top && !top.error) {
+        resultsWrapper.appendChild(createEmailSection(top.filename, jobTitle));
+    }
+}
+
+// Posts the form to the streaming endpoint and renders candidates as they finish
+async function streamEvaluation(form, loader, resultsWrapper) {
+    resultsWrapper.replaceChildren();
+    resultsWrapper.style.display = "block";
+
+    const section = createElement("div", "results-section");
+    const progress = createElement("h2", null, "Evaluating candidates...");
+    section.appendChild(progress);
+    const rankingSection = createElement("div", "ranking");
+    rankingSection.appendChild(createElement("h3", null, "Current Top Candidates"));
+    const rankingList = createElement("ol");
+    rankingSection.appendChild(rankingList);
+    section.appendChild(rankingSection);
+    const container = createElement("div", "results-container");
+    section.appendChild(container);
+    resultsWrapper.appendChild(section);
+
+    const response = await fetch(form.dataset.streamAction, { method: "POST", body: new FormData(form) });
+    if (!response.ok || !response.body) {
+        throw new Error("Evaluation request failed with status " + response.status);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let finished = false;
+
+    const handleLine = (line) => {
+        if (!line.trim()) {
+            return;
+        }
+        const event = JSON.parse(line);
+        if (event.type === "candidate") {
+            if (loader) {
+                loader.style.display = "none";
+            }
+            progress.textContent = event.total === null
+                ? "Evaluated " + event.completed + " candidates..."
+                : "Evaluated " + event.completed + " of " + event.total + " candidates...";
+            container.appendChild(createCandidateCard(event.candidate, false));
+            renderRanking(rankingList, event.ranking);
+        } else if (event.type === "done") {
+            finished = true;
+            renderFinalResults(resultsWrapper, event, form.elements.job_title.value);
+        }
+    };
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split("\n");
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+    }
+    handleLine(buffer);
+
+    if (!finished) {
+        throw new Error("The evaluation stream ended unexpectedly.");
+    }
+}
+
 document.addEventListener("DOMContentLoaded", () => {
     // Initialize the first tab
     if (document.querySelector(".tab-link")) {
@@ -28,9 +214,17 @@ document.addEventListener("DOMContentLoaded", () => {
     const form = document.getElementById("evaluation-form");
     const loader = document.getElementById("loader");
     const resultsWrapper = document.getElementById("results-wrapper");
+    const canStream = window.fetch && window.ReadableStream && window.TextDecoder;
+
+    // Email sections are rendered by the server or after streaming, so delegate clicks
+    document.addEventListener("click", (event) => {
+        if (event.target.classList.contains("email-button")) {
+            requestEmails(event.target.closest(".email-section"));
+        }
+    });
 
     if (form) {
-        form.addEventListener("submit", () => {
+        form.addEventListener("submit", (event) => {
             // Hide results and show loader
             if (resultsWrapper) {
                 resultsWrapper.style.display = "none";
@@ -38,6 +232,22 @@ document.addEventListener("DOMContentLoaded", () => {
             if (loader) {
                 loader.style.display = "block";
             }
+
+            // Without streaming support, fall back to the regular form post
+            if (!canStream || !form.dataset.streamAction) {
+                return;
+            }
+            event.preventDefault();
+            streamEvaluation(form, loader, resultsWrapper)
+                .catch((error) => {
+                    const message = createElement("p", "error", error.message);
+                    resultsWrapper.appendChild(message);
+                })
+                .finally(() => {
+                    if (loader) {
+                        loader.style.display = "none";
+                    }
+                });
         });
     }
-});
\ No newline at end of file
+});
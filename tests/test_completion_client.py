@@ -0,0 +1,43 @@
+import asyncio
+import json
+from typing import List, Optional
+
+from src.llm.base import CompletionClient
+from src.prompts.manager import PromptManager
+from src.utils.config import PROMPTS_PATH
+
+
+class ScriptedClient(CompletionClient):
+    """Returns queued replies in order and records the prompts it was sent."""
+
+    provider = "scripted"
+    display_name = "scripted LLM"
+
+    def __init__(self, replies: List[Optional[str]]):
+        super().__init__("scripted-model", PromptManager(PROMPTS_PATH))
+        self.replies = list(replies)
+        self.prompt_names: List[str] = []
+
+    def _complete(self, system_prompt, user_prompt, is_json=False, prompt_name=""):
+        self.prompt_names.append(prompt_name)
+        return self.replies.pop(0)
+
+    async def _acomplete(self, system_prompt, user_prompt, is_json=False, prompt_name=""):
+        return self._complete(system_prompt, user_prompt, is_json, prompt_name)
+
+
+VALID = json.dumps({"score": 72, "missing_skills": ["Kubernetes"], "remarks": "Solid backend experience."})
+
+
+def test_null_content_is_asked_again():
+    client = ScriptedClient([None, VALID])
+    evaluation = asyncio.run(client.aevaluate_resume("Python developer", "Five years of Python."))
+    assert evaluation["score"] == 72
+    assert client.prompt_names == ["resume_evaluation", "resume_evaluation"]
+
+
+def test_truncated_score_is_repaired_by_a_reask():
+    client = ScriptedClient(['{"score": 9', VALID])
+    evaluation = client.evaluate_resume("Python developer", "Five years of Python.")
+    assert evaluation["score"] == 72
+    assert client.prompt_names == ["resume_evaluation", "output_repair"]
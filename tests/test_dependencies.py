@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+import yaml
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.api.dependencies import AppContainer
+from src.utils.config import PROMPTS_PATH, SETTINGS_PATH
+
+
+@pytest.fixture
+def settings_path(tmp_path):
+    """A copy of the shipped settings with every store under ``tmp_path``."""
+    with open(SETTINGS_PATH) as f:
+        settings = yaml.safe_load(f)
+    settings["documents"]["workers"] = 0
+    settings["documents"]["cache"]["path"] = str(tmp_path / "conversions.sqlite3")
+    settings["candidates"]["path"] = str(tmp_path / "candidates.sqlite3")
+    settings["jobs"]["path"] = str(tmp_path / "jobs.sqlite3")
+    path = tmp_path / "settings.yaml"
+    _write(path, settings)
+    return path
+
+
+def _write(path, settings) -> None:
+    with open(path, "w") as f:
+        yaml.safe_dump(settings, f)
+
+
+def _edit(path, section: str, key: str, value) -> None:
+    with open(path) as f:
+        settings = yaml.safe_load(f)
+    settings[section][key] = value
+    _write(path, settings)
+
+
+def test_areload_rebuilds_components_from_the_edited_settings(settings_path):
+    async def run():
+        container = AppContainer(settings_path, PROMPTS_PATH)
+        await container.start()
+        try:
+            old_processor, old_engine = container.document_processor, container.evaluation_engine
+            conversion_cache, job_store = container.conversion_cache, container.job_store
+            _edit(settings_path, "uploads", "spool_max_kb", 128)
+            _edit(settings_path, "documents", "timeout_seconds", 5)
+
+            await container.areload()
+
+            assert container.settings["uploads"]["spool_max_kb"] == 128
+            assert container.upload_spool_bytes == 128 * 1024
+            assert container.document_processor is not old_processor
+            assert container.document_processor.timeout_seconds == 5
+            assert container.evaluation_engine is not old_engine
+            assert old_processor._retired
+            # Stores and caches survive reloads
+            assert container.conversion_cache is conversion_cache
+            assert container.job_store is job_store
+        finally:
+            await container.aclose()
+
+    asyncio.run(run())
+
+
+def test_areload_keeps_the_old_components_if_the_settings_are_invalid(settings_path):
+    async def run():
+        container = AppContainer(settings_path, PROMPTS_PATH)
+        try:
+            processor = container.document_processor
+            settings_path.write_text("documents: [unclosed")
+            with pytest.raises(Exception):
+                await container.areload()
+            assert container.document_processor is processor
+            assert not processor._retired
+        finally:
+            await container.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.fixture
+def app(settings_path, monkeypatch):
+    monkeypatch.delenv("RECRUITMENT_ADMIN_TOKEN", raising=False)
+    app = FastAPI()
+    app.include_router(routes.router)
+    app.state.container = AppContainer(settings_path, PROMPTS_PATH)
+    yield app
+    asyncio.run(app.state.container.aclose())
+
+
+def test_reload_endpoint_is_local_only_without_a_token(app):
+    assert TestClient(app, client=("127.0.0.1", 50000)).post("/config/reload").status_code == 200
+    assert TestClient(app, client=("203.0.113.7", 50000)).post("/config/reload").status_code == 403
+
+
+def test_reload_endpoint_requires_the_admin_token_when_set(app, monkeypatch):
+    monkeypatch.setenv("RECRUITMENT_ADMIN_TOKEN", "s3cret")
+    local = TestClient(app, client=("127.0.0.1", 50000))
+    assert local.post("/config/reload").status_code == 403
+    assert local.post("/config/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    remote = TestClient(app, client=("203.0.113.7", 50000))
+    assert remote.post("/config/reload", headers={"X-Admin-Token": "s3cret"}).status_code == 200
@@ -0,0 +1,35 @@
+import asyncio
+import io
+
+from fastapi import UploadFile
+
+from src.core.document_processor import DocumentProcessor
+
+
+def _upload(name: str, text: str) -> UploadFile:
+    data = text.encode("utf-8")
+    return UploadFile(io.BytesIO(data), size=len(data), filename=name)
+
+
+def test_processor_built_in_a_thread_converts_in_the_pool():
+    async def run():
+        # AppContainer.areload builds processors in a worker thread
+        processor = await asyncio.to_thread(DocumentProcessor, max_workers=1, timeout_seconds=30)
+        try:
+            return await asyncio.gather(
+                processor.aprocess(_upload("first.txt", "Senior Python developer")),
+                processor.aprocess(_upload("second.txt", "Data engineer with Spark")),
+            )
+        finally:
+            processor.retire()
+
+    first, second = asyncio.run(run())
+    assert "Senior Python developer" in first
+    assert "Data engineer with Spark" in second
+
+
+def test_thread_mode_converts_without_a_pool():
+    processor = DocumentProcessor(max_workers=0)
+    text = asyncio.run(processor.aprocess(_upload("resume.txt", "Go and Rust")))
+    assert "Go and Rust" in text
+    assert processor._executor is None
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from src.core.job_store import COMPLETED, QUEUED, JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    job_store = JobStore(tmp_path / "jobs.sqlite3")
+    yield job_store
+    job_store.close()
+
+
+def test_stored_resume_reads_back_in_chunks(store):
+    data = bytes(range(256)) * 1000
+    job_id, total = store.create_job([("resume.pdf", data, None)], jd_text="Python developer")
+    assert total == 1
+
+    [(index, filename, row_id, size)] = store.pending_resumes(job_id)
+    assert (index, filename, size) == (0, "resume.pdf", len(data))
+
+    resume = store.open_resume(row_id, size)
+    assert resume.read(5) == data[:5]
+    assert resume.seek(1000) == 1000
+    assert resume.read(300) == data[1000:1300]
+    assert resume.read() == data[1300:]
+    assert resume.read() == b""
+
+    resume.seek(-10, io.SEEK_END)
+    assert resume.read() == data[-10:]
+
+
+def test_empty_resume_reads_as_empty(store):
+    job_id, _ = store.create_job([("empty.txt", b"", None)])
+    [(_, _, row_id, size)] = store.pending_resumes(job_id)
+    assert size == 0
+    assert store.open_resume(row_id, size).read() == b""
+
+
+def test_results_checkpoint_pending_resumes(store):
+    skipped = {"filename": "notes.bin", "error": "Unsupported file type."}
+    job_id, total = store.create_job(
+        [("a.pdf", b"a", None), ("notes.bin", b"b", skipped), ("c.pdf", b"c", None)]
+    )
+    assert total == 3
+    assert [row[1] for row in store.pending_resumes(job_id)] == ["a.pdf", "c.pdf"]
+
+    store.save_result(job_id, 0, {"filename": "a.pdf", "score": 80})
+    assert [row[1] for row in store.pending_resumes(job_id)] == ["c.pdf"]
+
+    job = store.get_job(job_id)
+    assert job["status"] == QUEUED
+    assert job["completed"] == 2
+    assert store.unfinished_jobs() == [job_id]
+
+    store.set_status(job_id, COMPLETED)
+    assert store.unfinished_jobs() == []
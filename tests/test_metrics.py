@@ -0,0 +1,27 @@
+import pytest
+
+from src.utils.metrics import MetricsRegistry, _Metric
+
+
+def test_metric_without_samples_renderer_cannot_be_created():
+    class Incomplete(_Metric):
+        type_name = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Has no _render_samples.")
+
+
+def test_registry_renders_counters_and_histograms():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests", "Requests served.", ("route",))
+    latency = registry.histogram("latency_seconds", "Request latency.", buckets=(0.1, 1))
+    requests.inc(route="/evaluate")
+    requests.inc(2, route="/evaluate")
+    latency.observe(0.5)
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/evaluate"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{le="1"} 1' in text
+    assert "latency_seconds_count 1" in text
@@ -0,0 +1,68 @@
+import pytest
+
+from src.llm.parsing import parse_json, validate_evaluation
+
+
+def test_well_formed_output_is_not_repaired():
+    assert parse_json('{"score": 80, "missing_skills": [], "remarks": "ok"}') == (
+        {"score": 80, "missing_skills": [], "remarks": "ok"},
+        False,
+    )
+
+
+def test_fenced_output_with_trailing_comma_is_repaired():
+    text = 'Here you go:\n```json\n{"score": 90, "missing_skills": ["Go",],}\n```'
+    assert parse_json(text) == ({"score": 90, "missing_skills": ["Go"]}, True)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"score": 9', '{"score": 9.', '{"passed": tr', '[{"score": 9'],
+)
+def test_truncated_scalar_with_nothing_before_it_is_unrepairable(text):
+    with pytest.raises(ValueError):
+        parse_json(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"score": 95, "missing_skills": ["Go"', {"score": 95, "missing_skills": ["Go"]}),
+        ('{"score": 95, "remarks": "Strong backend exp', {"score": 95}),
+        ('{"score": 95, "remarks"', {"score": 95}),
+        ('{"score": 95,', {"score": 95}),
+        ('{"score": 95, "missing_skills": ["Go", "Rus', {"score": 95, "missing_skills": ["Go"]}),
+    ],
+)
+def test_truncated_output_keeps_only_complete_values(text, expected):
+    assert parse_json(text) == (expected, True)
+
+
+def test_truncated_batch_drops_the_partial_candidate():
+    text = '{"r1": {"score": 80, "missing_skills": [], "remarks": "ok"}, "r2": {"score": 9'
+    payload, repaired = parse_json(text)
+    assert repaired
+    assert payload == {"r1": {"score": 80, "missing_skills": [], "remarks": "ok"}}
+
+
+def test_output_without_json_is_rejected():
+    with pytest.raises(ValueError):
+        parse_json("I can't evaluate this resume.")
+
+
+def test_validate_evaluation_defaults_missing_fields():
+    evaluation = validate_evaluation({"score": "85"})
+    assert evaluation["score"] == 85
+    assert evaluation["missing_skills"] == []
+    assert evaluation["remarks"] == ""
+
+
+def test_validate_evaluation_rejects_non_objects():
+    with pytest.raises(ValueError):
+        validate_evaluation([{"score": 85}])
+
+
+@pytest.mark.parametrize("content", [None, b'{"score": 80}'])
+def test_non_text_output_raises_value_error(content):
+    with pytest.raises(ValueError):
+        parse_json(content)
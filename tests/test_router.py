@@ -0,0 +1,83 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm.base import ChatCompletionClient
+from src.llm.router import Backend, RoutingLLMClient
+
+
+class StatusError(Exception):
+    """An API error carrying an HTTP status, like the provider SDKs raise."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeClient(ChatCompletionClient):
+    """Chat-completions client whose transport replies with ``content`` or raises ``error``."""
+
+    provider = "fake"
+    display_name = "fake LLM"
+
+    def __init__(self, content: str = "ok", error: Exception = None):
+        super().__init__("fake-model", prompt_manager=None)
+        self.content = content
+        self.error = error
+        self.calls = 0
+
+    def _completion_kwargs(self, system_prompt, user_prompt, is_json):
+        return {}
+
+    def _send(self, kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        message = SimpleNamespace(content=self.content)
+        response = SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+        return SimpleNamespace(retries_taken=0, headers={}), response
+
+    async def _asend(self, kwargs):
+        return self._send(kwargs)
+
+
+def _router(*clients: FakeClient) -> RoutingLLMClient:
+    backends = [Backend(f"backend{index}", client) for index, client in enumerate(clients)]
+    router = RoutingLLMClient(backends, prompt_manager=None, hedge_after_seconds=None)
+    # Always try the backends in the order given
+    router._round_robin = iter(lambda: 0, None)
+    return router
+
+
+@pytest.mark.parametrize(
+    "error", [StatusError(429), StatusError(503), TimeoutError(), ConnectionError()]
+)
+def test_backend_failures_cool_down_and_fail_over(error):
+    failing, healthy = FakeClient(error=error), FakeClient(content="from backup")
+    router = _router(failing, healthy)
+
+    assert asyncio.run(router._acomplete("system", "user")) == "from backup"
+    assert not router.backends[0].available(time.monotonic())
+    assert router._complete("system", "user") == "from backup"
+
+
+@pytest.mark.parametrize("error", [StatusError(400), StatusError(422), ValueError("bad request")])
+def test_client_errors_are_raised_without_failover(error):
+    failing, healthy = FakeClient(error=error), FakeClient()
+    router = _router(failing, healthy)
+
+    with pytest.raises(type(error)):
+        asyncio.run(router._acomplete("system", "user"))
+    with pytest.raises(type(error)):
+        router._complete("system", "user")
+    assert healthy.calls == 0
+    assert router.backends[0].available(time.monotonic())
+
+
+def test_last_backend_error_is_raised_when_all_fail():
+    router = _router(FakeClient(error=StatusError(500)), FakeClient(error=StatusError(502)))
+    with pytest.raises(StatusError) as raised:
+        asyncio.run(router._acomplete("system", "user"))
+    assert raised.value.status_code in (500, 502)